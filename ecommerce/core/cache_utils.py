@@ -0,0 +1,100 @@
+"""
+Caching of data retrieved from other services, such as the LMS.
+
+Entries remain usable for a while after they expire: a single caller, holding the entry's refresh lock, retrieves
+fresh data while other callers continue to be served the stale data. Failures to retrieve data are cached briefly,
+alongside any stale data, so that an unavailable service is not called on every request.
+
+Each entry is a dict holding the cached `data` (None if it has never been retrieved), the time until which it is
+`fresh_until`, and the `error` raised by the last failed retrieval, if any.
+"""
+from collections import namedtuple
+import logging
+import time
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+# Seconds after which a caller refreshing an entry is assumed to have failed.
+REFRESH_LOCK_TIMEOUT = 30
+POLL_INTERVAL = 0.1
+
+# Seconds for which retrieved data is fresh, for which stale data may be served, and for which failures are cached.
+CacheTimeouts = namedtuple('CacheTimeouts', ('fresh', 'stale', 'negative'))
+
+
+def make_entry(data, timeout, error=None):
+    return {'data': data, 'fresh_until': time.time() + timeout, 'error': error}
+
+
+def is_fresh(entry):
+    return entry is not None and entry['fresh_until'] > time.time()
+
+
+def acquire_refresh_lock(key):
+    """ Returns True if the caller should refresh the entry, or False if another caller is already doing so. """
+    return cache.add(_get_lock_key(key), True, REFRESH_LOCK_TIMEOUT)
+
+
+def release_refresh_locks(keys):
+    cache.delete_many([_get_lock_key(key) for key in keys])
+
+
+def set_entries(entries, timeouts):
+    # Entries are retained beyond their freshness so that stale data can be served while it is refreshed.
+    cache.set_many(entries, timeouts.fresh + timeouts.stale)
+
+
+def get_entry(key, fetch, timeouts, errors, wait_timeout=0):
+    """
+    Returns the entry cached under the given key, refreshing it if it is missing or expired.
+
+    Arguments:
+        key (str): Cache key.
+        fetch (callable): Called, without arguments, to retrieve fresh data.
+        timeouts (CacheTimeouts): Timeouts of the entry.
+        errors (tuple): Exception classes, raised by `fetch`, which indicate a failure to retrieve the data.
+        wait_timeout (float): Seconds for which a caller finding no entry waits for another caller, which is already
+            retrieving the data, rather than retrieving it as well.
+
+    Returns:
+        dict: The entry. Its data is None if it could not be retrieved, and no stale data exists.
+    """
+    entry = cache.get(key)
+    if is_fresh(entry):
+        return entry
+
+    if acquire_refresh_lock(key):
+        try:
+            entry = _refresh(key, fetch, timeouts, errors, entry)
+            set_entries({key: entry}, timeouts)
+        finally:
+            release_refresh_locks([key])
+    elif entry is None:
+        entry = _wait_for_entry(key, wait_timeout) or _refresh(key, fetch, timeouts, errors)
+
+    return entry
+
+
+def _get_lock_key(key):
+    return '{}_refresh_lock'.format(key)
+
+
+def _refresh(key, fetch, timeouts, errors, stale_entry=None):
+    try:
+        return make_entry(fetch(), timeouts.fresh)
+    except errors as e:
+        logger.exception('Failed to retrieve the data cached under [%s].', key)
+        stale = stale_entry['data'] if stale_entry else None
+        return make_entry(stale, timeouts.negative, error=unicode(e))
+
+
+def _wait_for_entry(key, wait_timeout):
+    deadline = time.time() + wait_timeout
+    while time.time() < deadline:
+        time.sleep(POLL_INTERVAL)
+        entry = cache.get(key)
+        if entry is not None:
+            return entry
+    return None
@@ -11,3 +11,7 @@ class CoreAppConfig(AppConfig):
         # Ensures that the initialized Celery app is loaded when Django starts.
         # Allows Celery tasks to bind themselves to an initialized instance of the Celery library.
         from ecommerce import celery_app  # pylint: disable=unused-variable
+
+        # Register signal handlers
+        # noinspection PyUnresolvedReferences
+        import ecommerce.core.signals  # pylint: disable=unused-variable
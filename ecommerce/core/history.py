@@ -0,0 +1,189 @@
+"""
+Helpers for recording the history of models with django-simple-history at a lower cost.
+
+Saving an object with `HistoricalRecords` writes one row for the object and one for its historical record. The
+helpers in this module reduce the number of historical rows, and of the queries writing them:
+
+- `bulk_update` updates many objects with a single UPDATE, and writes their historical records with a single INSERT.
+- `DeferrableHistoricalRecords` buffers the historical records of the models named by the HISTORY_DEFERRED_MODELS
+  setting while history is deferred (e.g. by `DeferredHistoryMiddleware` for the duration of a request), and writes
+  them with a single INSERT per model when the deferral ends. It also skips the records of saves which only change
+  the fields named by the HISTORY_IGNORED_FIELDS setting.
+"""
+from collections import OrderedDict
+from contextlib import contextmanager
+import threading
+
+from django.conf import settings
+from django.utils import timezone
+from simple_history.models import HistoricalRecords
+
+_deferral = threading.local()
+
+
+def get_model_label(model):
+    """ Returns the label (e.g. 'order.Line') by which a model is named in settings. """
+    return '{}.{}'.format(model._meta.app_label, model._meta.object_name)  # pylint: disable=protected-access
+
+
+def get_history_user(instance):
+    """ Returns the user to whom changes to the given object are attributed, as django-simple-history does. """
+    try:
+        return instance._history_user  # pylint: disable=protected-access
+    except AttributeError:
+        request = getattr(HistoricalRecords.thread, 'request', None)
+        if request is not None and request.user.is_authenticated():
+            return request.user
+
+        return None
+
+
+def build_historical_record(instance, history_type, history_date=None):
+    """ Returns an unsaved historical record of the current state of the given object. """
+    opts = instance._meta  # pylint: disable=protected-access
+    return opts.concrete_model.history.model(
+        history_date=history_date or timezone.now(),
+        history_type=history_type,
+        history_user=get_history_user(instance),
+        **{field.attname: getattr(instance, field.attname) for field in opts.fields}
+    )
+
+
+def bulk_create_historical_records(instances, history_type='~'):
+    """
+    Creates a historical record for each of the given objects, which must be of the same model.
+
+    Arguments:
+        instances (list): Objects whose current state should be recorded.
+        history_type (str): '+' for created objects, '~' for changed objects, or '-' for deleted objects.
+    """
+    if not instances:
+        return
+
+    history_date = timezone.now()
+    history_model = instances[0]._meta.concrete_model.history.model  # pylint: disable=protected-access
+    history_model.objects.bulk_create(
+        [build_historical_record(instance, history_type, history_date) for instance in instances]
+    )
+
+
+def bulk_update(instances, **values):
+    """
+    Sets the given field values on each of the given objects, which must be of the same model.
+
+    The objects are updated with a single UPDATE, without sending the pre_save and post_save signals, and their
+    historical records are created with a single INSERT.
+
+    Arguments:
+        instances (list): Objects to be updated.
+
+    Keyword Arguments:
+        Field names, and the values to which they should be set.
+    """
+    if not instances:
+        return
+
+    model = type(instances[0])
+    model.objects.filter(pk__in=[instance.pk for instance in instances]).update(**values)
+
+    for instance in instances:
+        for name, value in values.items():
+            setattr(instance, name, value)
+
+    bulk_create_historical_records(instances)
+
+
+def begin_deferral():
+    """ Starts buffering the historical records of the models named by HISTORY_DEFERRED_MODELS. """
+    depth = getattr(_deferral, 'depth', 0)
+    if not depth:
+        _deferral.records = []
+    _deferral.depth = depth + 1
+
+
+def end_deferral(discard=False):
+    """
+    Stops buffering historical records, and writes the buffered records, unless they are to be discarded.
+
+    Deferrals may be nested: records are only written, or discarded, when the outermost deferral ends.
+    """
+    depth = getattr(_deferral, 'depth', 0)
+    if not depth:
+        return
+
+    _deferral.depth = depth - 1
+    if depth > 1:
+        return
+
+    records = _deferral.records
+    _deferral.records = None
+    if discard:
+        return
+
+    records_by_model = OrderedDict()
+    for record in records:
+        records_by_model.setdefault(type(record), []).append(record)
+
+    for history_model, model_records in records_by_model.items():
+        history_model.objects.bulk_create(model_records)
+
+
+def reset_deferral():
+    """
+    Ends all deferrals, e.g. if a previous request failed to end its deferral. Their buffered records are discarded,
+    since it is not known whether the changes they record were committed.
+    """
+    if getattr(_deferral, 'depth', 0):
+        _deferral.depth = 1
+        end_deferral(discard=True)
+
+
+@contextmanager
+def deferred_history():
+    """
+    Defers the historical records created within the block until it exits.
+
+    The records are discarded if the block raises an exception, since the changes they record will usually have been
+    rolled back. Note that the buffered records cannot be queried until the block exits.
+    """
+    begin_deferral()
+    try:
+        yield
+    except:  # pylint: disable=bare-except
+        end_deferral(discard=True)
+        raise
+    end_deferral()
+
+
+class DeferrableHistoricalRecords(HistoricalRecords):
+    """ Records history, skipping records of changes to ignored fields, and deferring records while requested. """
+
+    def post_save(self, instance, created, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if not created and update_fields and set(update_fields) <= set(self.get_ignored_fields(instance)):
+            return
+
+        super(DeferrableHistoricalRecords, self).post_save(instance, created, **kwargs)
+
+    def create_historical_record(self, instance, history_type):
+        # The recorded state of the object is retained on the object, so that subsequent saves which do not change
+        # it, other than its ignored fields, can be identified without querying the previous record.
+        ignored_fields = self.get_ignored_fields(instance)
+        snapshot = {
+            field.attname: getattr(instance, field.attname)
+            for field in instance._meta.fields if field.name not in ignored_fields
+        }
+        if history_type == '~' and getattr(instance, '_history_snapshot', None) == snapshot:
+            return
+        instance._history_snapshot = snapshot  # pylint: disable=protected-access
+
+        record = build_historical_record(instance, history_type)
+        model_label = get_model_label(instance._meta.concrete_model)  # pylint: disable=protected-access
+        if getattr(_deferral, 'depth', 0) and model_label in settings.HISTORY_DEFERRED_MODELS:
+            _deferral.records.append(record)
+        else:
+            record.save()
+
+    def get_ignored_fields(self, instance):
+        model_label = get_model_label(instance._meta.concrete_model)  # pylint: disable=protected-access
+        return settings.HISTORY_IGNORED_FIELDS.get(model_label, ())
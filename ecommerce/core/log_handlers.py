@@ -0,0 +1,123 @@
+"""
+Logging handlers which move log I/O off the thread emitting the record.
+
+Python 2 lacks `logging.handlers.QueueHandler` and `QueueListener`; these are equivalents which can be configured
+with `logging.config.dictConfig`.
+"""
+import atexit
+import copy
+import importlib
+import logging
+import os
+import Queue
+import threading
+
+
+class QueueListener(object):
+    """ Passes records placed on a queue to handlers, from a background thread. """
+    _sentinel = None
+
+    def __init__(self, queue, *handlers):
+        self.queue = queue
+        self.handlers = handlers
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._monitor, name='QueueListener')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """ Handles the records remaining on the queue, then stops the background thread. """
+        if self._thread is not None:
+            self.queue.put(self._sentinel)
+            self._thread.join()
+            self._thread = None
+
+    def handle(self, record):
+        for handler in self.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def _monitor(self):
+        while True:
+            record = self.queue.get()
+            if record is self._sentinel:
+                break
+            self.handle(record)
+
+
+class QueueHandler(logging.Handler):
+    """
+    Places records on a bounded queue, from which a QueueListener passes them to the target handler.
+
+    Records are formatted by this handler, on the emitting thread, so that they can be safely handled on another
+    thread; the target handler should simply output the message. If the queue is full, records are handled on the
+    emitting thread, rather than dropped.
+
+    The listener is started when the first record is emitted, and again in each forked process (e.g. Celery
+    workers), since threads do not survive a fork.
+
+    Arguments:
+        target (dict): Configuration of the target handler: its `class`, as a dotted path, and the keyword
+            arguments with which it is constructed.
+        maxsize (int): Maximum number of records awaiting the target handler.
+    """
+
+    def __init__(self, target, maxsize=10000):
+        super(QueueHandler, self).__init__()
+        target = dict(target)
+        module_name, class_name = target.pop('class').rsplit('.', 1)
+        self.target = getattr(importlib.import_module(module_name), class_name)(**target)
+        self.maxsize = maxsize
+        self.queue = None
+        self.listener = None
+        self._pid = None
+        atexit.register(self.close)
+
+    def prepare(self, record):
+        """
+        Returns a copy of the record, whose arguments and exception, which may not be thread-safe, are merged into its
+        message. The record itself is left untouched for the other handlers to which it is passed.
+        """
+        message = self.format(record)
+        record = copy.copy(record)
+        record.message = message
+        record.msg = message
+        record.args = None
+        record.exc_info = None
+        record.exc_text = None
+        return record
+
+    def emit(self, record):
+        try:
+            if self._pid != os.getpid():
+                self._start_listener()
+
+            record = self.prepare(record)
+            try:
+                self.queue.put_nowait(record)
+            except Queue.Full:
+                self.listener.handle(record)
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except:  # pylint: disable=bare-except
+            self.handleError(record)
+
+    def close(self):
+        if self.listener is not None and self._pid == os.getpid():
+            self.listener.stop()
+        self.listener = None
+        self.target.close()
+        super(QueueHandler, self).close()
+
+    def _start_listener(self):
+        self.acquire()
+        try:
+            if self._pid != os.getpid():
+                self.queue = Queue.Queue(self.maxsize)
+                self.listener = QueueListener(self.queue, self.target)
+                self.listener.start()
+                self._pid = os.getpid()
+        finally:
+            self.release()
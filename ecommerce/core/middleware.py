@@ -0,0 +1,139 @@
+"""Middleware for resolving the tenant-specific configuration of a request, and deferring history records."""
+import copy
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.utils.functional import SimpleLazyObject
+
+from ecommerce.core.history import begin_deferral, end_deferral, reset_deferral
+from ecommerce.core.models import SiteConfiguration
+from ecommerce.extensions.payment.helpers import get_enabled_processor_classes
+
+# SiteConfigurations, with their Site and Partner pre-loaded, keyed by request host. Cleared by the
+# receivers in ecommerce.core.signals whenever a Site, SiteConfiguration, or Partner is modified.
+# The cached instances are shared by all threads, and must not be handed out; see get_site_configuration.
+_site_configurations = {}
+
+
+def get_site_configuration(request, site):
+    """
+    Returns the SiteConfiguration for the given Site.
+
+    The SiteConfiguration is cached, by request host, for the lifetime of the process or until the cache is
+    cleared. Its `site` and `partner` relations are loaded, and `site.siteconfiguration` refers back to it,
+    so that traversing these relations does not require additional queries. Each call returns a copy of the
+    cached instances, so that they may be modified without affecting other requests.
+
+    Arguments:
+        request (HttpRequest): Request for which the SiteConfiguration is being retrieved.
+        site (Site): Site resolved for the request by `CurrentSiteMiddleware`.
+
+    Returns:
+        SiteConfiguration, or None if the Site has not been configured.
+    """
+    site_configuration = _get_cached_site_configuration(request, site)
+    return copy.deepcopy(site_configuration) if site_configuration else None
+
+
+def get_payment_processors(request, site):
+    """
+    Returns the payment processor classes enabled for the given Site.
+
+    Arguments:
+        request (HttpRequest): Request for which the payment processors are being retrieved.
+        site (Site): Site resolved for the request by `CurrentSiteMiddleware`.
+
+    Returns:
+        list: The enabled payment processor classes, as returned by `get_enabled_processor_classes`, which are
+            listed in the `payment_processors` of the Site's SiteConfiguration. All of them, if the Site has not
+            been configured.
+    """
+    processors = get_enabled_processor_classes()
+    site_configuration = _get_cached_site_configuration(request, site)
+
+    if site_configuration is None:
+        return processors
+
+    names = set(name.strip() for name in site_configuration.payment_processors.split(','))
+    return [processor for processor in processors if processor.NAME in names]
+
+
+def _get_cached_site_configuration(request, site):
+    """ Returns the cached SiteConfiguration for the request's host, retrieving it if it is not cached. """
+    host = request.get_host()
+    site_configuration = _site_configurations.get(host)
+
+    if site_configuration is None:
+        try:
+            site_configuration = SiteConfiguration.objects.select_related('site', 'partner').get(site=site)
+        except SiteConfiguration.DoesNotExist:
+            return None
+
+        _site_configurations[host] = site_configuration
+
+    return site_configuration
+
+
+def clear_site_configuration_cache():
+    """ Removes all cached SiteConfigurations. """
+    _site_configurations.clear()
+
+
+class SiteConfigurationMiddleware(object):
+    """
+    Resolves the Site, SiteConfiguration, Partner, and enabled payment processors once per request.
+
+    `request.site` is replaced with a copy of the cached Site, whose `siteconfiguration.partner` can be read without
+    querying the database. `request.payment_processors` holds the list of payment processor classes enabled for the
+    Site.
+    Both are evaluated lazily, so requests which do not use them (e.g. health checks) never touch the cache
+    or the database.
+
+    This middleware must be placed after `django.contrib.sites.middleware.CurrentSiteMiddleware`.
+    """
+
+    def process_request(self, request):
+        current_site = request.site
+        request.site = SimpleLazyObject(lambda: self._get_site(request, current_site))
+        request.payment_processors = SimpleLazyObject(lambda: get_payment_processors(request, current_site))
+
+    def _get_site(self, request, site):
+        site_configuration = get_site_configuration(request, site)
+        return site_configuration.site if site_configuration else site
+
+
+class DeferredHistoryMiddleware(object):
+    """
+    Defers the historical records of the models named by the HISTORY_DEFERRED_MODELS setting until the end of each
+    request, so that they are written with a single INSERT per model.
+
+    Only views which run in the request's transaction, with ATOMIC_REQUESTS, are deferred. Their records are written
+    after the transaction has been committed, and are discarded if the view raises an exception. Views exempted with
+    `non_atomic_requests` commit, or roll back, their own transactions, so their records are written immediately.
+    """
+
+    def process_request(self, request):  # pylint: disable=unused-argument
+        reset_deferral()
+
+    def process_view(self, request, view_func, view_args, view_kwargs):  # pylint: disable=unused-argument
+        if self._is_atomic(view_func):
+            begin_deferral()
+            request._history_deferred = True  # pylint: disable=protected-access
+
+    def process_response(self, request, response):
+        if getattr(request, '_history_deferred', False):
+            request._history_deferred = False  # pylint: disable=protected-access
+            end_deferral()
+        return response
+
+    def process_exception(self, request, exception):  # pylint: disable=unused-argument
+        if getattr(request, '_history_deferred', False):
+            request._history_deferred = False  # pylint: disable=protected-access
+            end_deferral(discard=True)
+
+    def _is_atomic(self, view_func):
+        """ Returns True if the view runs in a transaction on the default database, as Django makes it. """
+        non_atomic_requests = getattr(view_func, '_non_atomic_requests', set())
+        return (
+            connections[DEFAULT_DB_ALIAS].settings_dict['ATOMIC_REQUESTS'] and
+            DEFAULT_DB_ALIAS not in non_atomic_requests
+        )
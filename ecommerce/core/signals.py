@@ -0,0 +1,23 @@
+from django.contrib.sites.models import Site
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from oscar.core.loading import get_model
+
+from ecommerce.core.middleware import clear_site_configuration_cache
+from ecommerce.core.models import SiteConfiguration
+
+Partner = get_model('partner', 'Partner')
+
+
+@receiver(post_save, sender=Site, dispatch_uid='core.site_saved')
+@receiver(post_delete, sender=Site, dispatch_uid='core.site_deleted')
+@receiver(post_save, sender=SiteConfiguration, dispatch_uid='core.site_configuration_saved')
+@receiver(post_delete, sender=SiteConfiguration, dispatch_uid='core.site_configuration_deleted')
+@receiver(post_save, sender=Partner, dispatch_uid='core.partner_saved')
+def invalidate_site_configuration_cache(sender, **kwargs):  # pylint: disable=unused-argument
+    """
+    Clear the cached SiteConfigurations when any of the models they hold is modified.
+
+    Several hosts may share a Site, and several Sites may share a Partner, so the entire cache is cleared.
+    """
+    clear_site_configuration_cache()
@@ -0,0 +1,129 @@
+from django.db import transaction
+from django.test import override_settings, RequestFactory
+from oscar.core.loading import get_model
+from oscar.test import factories
+
+from ecommerce.core.history import begin_deferral, deferred_history, reset_deferral
+from ecommerce.core.middleware import DeferredHistoryMiddleware
+from ecommerce.tests.testcases import TestCase
+
+Line = get_model('order', 'Line')
+Product = get_model('catalogue', 'Product')
+
+
+def view(request):  # pylint: disable=unused-argument
+    pass
+
+
+@transaction.non_atomic_requests
+def non_atomic_view(request):  # pylint: disable=unused-argument
+    pass
+
+
+@override_settings(HISTORY_DEFERRED_MODELS=('order.Line',), HISTORY_IGNORED_FIELDS={})
+class DeferredHistoryTests(TestCase):
+    def setUp(self):
+        super(DeferredHistoryTests, self).setUp()
+        self.line = factories.create_order().lines.first()
+        self.product = self.line.product
+
+    def change_objects(self):
+        self.line.status = 'Changed'
+        self.line.save()
+        self.product.title = 'Changed'
+        self.product.save()
+
+    def assert_changes_recorded(self, line_recorded, product_recorded=True):
+        self.assertEqual(self.line.history.filter(status='Changed').exists(), line_recorded)
+        self.assertEqual(self.product.history.filter(title='Changed').exists(), product_recorded)
+
+    def test_deferred_history(self):
+        """ Verify the records of deferred models are written, together, when the block exits. """
+        with deferred_history():
+            with deferred_history():
+                self.change_objects()
+
+            self.assert_changes_recorded(line_recorded=False)
+
+        self.assert_changes_recorded(line_recorded=True)
+
+    def test_deferred_history_exception(self):
+        """ Verify buffered records are discarded if the block raises an exception. """
+        with self.assertRaises(ValueError):
+            with deferred_history():
+                self.change_objects()
+                raise ValueError
+
+        self.assert_changes_recorded(line_recorded=False)
+
+    def test_middleware(self):
+        """ Verify the records of deferred models are written at the end of each request. """
+        middleware = DeferredHistoryMiddleware()
+        request = RequestFactory().get('/')
+
+        middleware.process_request(request)
+        middleware.process_view(request, view, (), {})
+        self.change_objects()
+        self.assert_changes_recorded(line_recorded=False)
+        middleware.process_response(request, None)
+        self.assert_changes_recorded(line_recorded=True)
+
+    def test_middleware_non_atomic_view(self):
+        """ Verify records are not deferred for views which manage their own transactions. """
+        middleware = DeferredHistoryMiddleware()
+        request = RequestFactory().get('/')
+
+        middleware.process_request(request)
+        middleware.process_view(request, non_atomic_view, (), {})
+        self.change_objects()
+        self.assert_changes_recorded(line_recorded=True)
+        middleware.process_response(request, None)
+
+    def test_middleware_exception(self):
+        """ Verify buffered records are discarded if the view raises an exception. """
+        middleware = DeferredHistoryMiddleware()
+        request = RequestFactory().get('/')
+
+        middleware.process_request(request)
+        middleware.process_view(request, view, (), {})
+        self.change_objects()
+        middleware.process_exception(request, ValueError())
+        self.assert_changes_recorded(line_recorded=False)
+
+    def test_reset_deferral(self):
+        """ Verify the records left buffered by a deferral which was never ended are discarded. """
+        begin_deferral()
+        begin_deferral()
+        self.change_objects()
+        reset_deferral()
+        self.assert_changes_recorded(line_recorded=False)
+
+        # Records are no longer deferred.
+        self.line.status = 'Changed again'
+        self.line.save()
+        self.assertTrue(self.line.history.filter(status='Changed again').exists())
+
+    def test_unchanged_objects(self):
+        """ Verify saving an object which has not changed since it was last recorded does not create a record. """
+        self.line.status = 'Changed'
+        self.line.save()
+        count = self.line.history.count()
+
+        self.line.save()
+        self.assertEqual(self.line.history.count(), count)
+
+    @override_settings(HISTORY_IGNORED_FIELDS={'order.Line': ('status', 'est_dispatch_date')})
+    def test_ignored_fields(self):
+        """ Verify changes to ignored fields alone are not recorded. """
+        self.line.save()
+        count = self.line.history.count()
+
+        self.line.status = 'Changed'
+        self.line.save()
+        self.line.save(update_fields=['est_dispatch_date'])
+        self.assertEqual(self.line.history.count(), count)
+
+        self.line.title = 'Changed'
+        self.line.save()
+        self.assertEqual(self.line.history.count(), count + 1)
+        self.assertEqual(self.line.history.first().status, 'Changed')
@@ -0,0 +1,81 @@
+import logging
+
+import mock
+
+from ecommerce.core.log_handlers import QueueHandler
+from ecommerce.tests.testcases import TestCase
+
+
+class RecordingHandler(logging.Handler):
+    """ Retains the messages of handled records. """
+    messages = []
+
+    def emit(self, record):
+        self.messages.append(self.format(record))
+
+
+class QueueHandlerTests(TestCase):
+    def setUp(self):
+        super(QueueHandlerTests, self).setUp()
+        RecordingHandler.messages = []
+        self.handler = QueueHandler({'class': 'ecommerce.core.tests.test_log_handlers.RecordingHandler'}, maxsize=1)
+        self.handler.setFormatter(logging.Formatter('%(levelname)s - %(message)s'))
+        self.addCleanup(self.handler.close)
+
+        self.logger = logging.getLogger('test_log_handlers')
+        self.logger.propagate = False
+        self.logger.addHandler(self.handler)
+        self.addCleanup(self.logger.removeHandler, self.handler)
+
+    def test_emit(self):
+        """ Verify records are formatted before being enqueued, and handled by the target handler. """
+        self.logger.warning('Hello, %s.', 'world')
+        try:
+            raise ValueError('Oops')
+        except ValueError:
+            self.logger.exception('Failed')
+
+        self.handler.listener.stop()
+
+        self.assertEqual(RecordingHandler.messages[0], 'WARNING - Hello, world.')
+        self.assertTrue(RecordingHandler.messages[1].startswith('ERROR - Failed\nTraceback'))
+        self.assertEqual(RecordingHandler.messages[1].count('ValueError: Oops'), 1)
+
+    def test_other_handlers(self):
+        """ Verify records passed on to other handlers, e.g. those of parent loggers, are left unmodified. """
+        parent_handler = RecordingHandler()
+        parent_handler.setFormatter(logging.Formatter('%(message)s'))
+        parent_handler.handle = mock.Mock(wraps=parent_handler.handle)
+        parent = logging.getLogger('test_log_handlers_parent')
+        parent.propagate = False
+        parent.addHandler(parent_handler)
+        self.addCleanup(parent.removeHandler, parent_handler)
+
+        child = logging.getLogger('test_log_handlers_parent.child')
+        child.addHandler(self.handler)
+        self.addCleanup(child.removeHandler, self.handler)
+
+        try:
+            raise ValueError('Oops')
+        except ValueError:
+            child.exception('Failed for %s', 'world')
+
+        self.handler.listener.stop()
+
+        record = parent_handler.handle.call_args[0][0]
+        self.assertEqual(record.msg, 'Failed for %s')
+        self.assertEqual(record.args, ('world',))
+        self.assertIsNotNone(record.exc_info)
+        # The parent's handler runs on this thread, and the target handler on the listener's, in either order.
+        messages = sorted(RecordingHandler.messages)
+        self.assertTrue(messages[0].startswith('ERROR - Failed for world\nTraceback'))
+        self.assertTrue(messages[1].startswith('Failed for world\nTraceback'))
+
+    def test_queue_full(self):
+        """ Verify records are handled on the emitting thread, rather than dropped, if the queue is full. """
+        self.logger.warning('Starting')
+        self.handler.listener.stop()
+
+        self.handler.queue.put(None)
+        self.logger.warning('Queue full')
+        self.assertEqual(RecordingHandler.messages, ['WARNING - Starting', 'WARNING - Queue full'])
@@ -0,0 +1,108 @@
+from django.conf import settings
+from django.contrib.sites.middleware import CurrentSiteMiddleware
+from django.test import override_settings, RequestFactory
+from waffle.models import Switch
+
+from ecommerce.core.middleware import clear_site_configuration_cache, SiteConfigurationMiddleware
+from ecommerce.extensions.payment.tests.processors import DummyProcessor, AnotherDummyProcessor
+from ecommerce.tests.factories import PartnerFactory
+from ecommerce.tests.testcases import TestCase
+
+
+@override_settings(PAYMENT_PROCESSORS=[
+    'ecommerce.extensions.payment.tests.processors.DummyProcessor',
+    'ecommerce.extensions.payment.tests.processors.AnotherDummyProcessor',
+])
+class SiteConfigurationMiddlewareTests(TestCase):
+    def setUp(self):
+        super(SiteConfigurationMiddlewareTests, self).setUp()
+        clear_site_configuration_cache()
+
+    def process_request(self):
+        """ Run a new request through the site middleware, and return it. """
+        request = RequestFactory().get('/', SERVER_NAME=self.site.domain)
+        CurrentSiteMiddleware().process_request(request)
+        SiteConfigurationMiddleware().process_request(request)
+        return request
+
+    def test_process_request(self):
+        """ Verify the Site, with its SiteConfiguration and Partner, is set on the request. """
+        request = self.process_request()
+        self.assertEqual(request.site, self.site)
+        self.assertEqual(request.site.siteconfiguration, self.site.siteconfiguration)
+        self.assertEqual(request.site.siteconfiguration.partner, self.partner)
+
+    def test_process_request_lazy(self):
+        """ Verify the database is not queried until the request's Site is used. """
+        request = RequestFactory().get('/', SERVER_NAME=self.site.domain)
+        CurrentSiteMiddleware().process_request(request)
+
+        with self.assertNumQueries(0):
+            SiteConfigurationMiddleware().process_request(request)
+
+    def test_process_request_cached(self):
+        """ Verify subsequent requests are resolved, and the relations traversed, without querying the database. """
+        self.assertEqual(self.process_request().site, self.site)
+
+        with self.assertNumQueries(0):
+            request = self.process_request()
+            self.assertEqual(request.site.siteconfiguration.partner, self.partner)
+
+    def test_process_request_copied(self):
+        """ Verify each request is given its own copy of the cached Site, SiteConfiguration, and Partner. """
+        request = self.process_request()
+        request.site.siteconfiguration.partner.name = 'ACME'
+
+        site_configuration = self.process_request().site.siteconfiguration
+        self.assertEqual(site_configuration.partner.name, self.partner.name)
+        self.assertIs(site_configuration.site.siteconfiguration, site_configuration)
+
+    def test_process_request_without_site_configuration(self):
+        """ Verify requests for a Site without a SiteConfiguration are passed through. """
+        self.site.siteconfiguration.delete()
+        request = self.process_request()
+        self.assertEqual(request.site, self.site)
+
+    def test_cache_invalidation(self):
+        """ Verify the cache is cleared when the SiteConfiguration is modified. """
+        self.process_request()
+
+        partner = PartnerFactory(name='ACME')
+        site_configuration = self.site.siteconfiguration
+        site_configuration.partner = partner
+        site_configuration.save()
+
+        self.assertEqual(self.process_request().site.siteconfiguration.partner, partner)
+
+    def configure_payment_processors(self, payment_processors):
+        """ Set the names of the payment processors enabled for the test Site. """
+        site_configuration = self.site.siteconfiguration
+        site_configuration.payment_processors = payment_processors
+        site_configuration.save()
+
+    def test_payment_processors(self):
+        """ Verify the enabled payment processors are set on the request. """
+        self.configure_payment_processors('dummy,another-dummy')
+        Switch.objects.create(name=settings.PAYMENT_PROCESSOR_SWITCH_PREFIX + DummyProcessor.NAME, active=True)
+        Switch.objects.create(name=settings.PAYMENT_PROCESSOR_SWITCH_PREFIX + AnotherDummyProcessor.NAME, active=False)
+
+        request = self.process_request()
+        self.assertEqual(list(request.payment_processors), [DummyProcessor])
+
+    def test_payment_processors_site_configuration(self):
+        """ Verify only the payment processors listed in the Site's SiteConfiguration are set on the request. """
+        self.configure_payment_processors('another-dummy')
+        Switch.objects.create(name=settings.PAYMENT_PROCESSOR_SWITCH_PREFIX + DummyProcessor.NAME, active=True)
+        Switch.objects.create(name=settings.PAYMENT_PROCESSOR_SWITCH_PREFIX + AnotherDummyProcessor.NAME, active=True)
+
+        request = self.process_request()
+        self.assertEqual(list(request.payment_processors), [AnotherDummyProcessor])
+
+    def test_payment_processors_without_site_configuration(self):
+        """ Verify all enabled payment processors are set on requests for a Site without a SiteConfiguration. """
+        self.site.siteconfiguration.delete()
+        Switch.objects.create(name=settings.PAYMENT_PROCESSOR_SWITCH_PREFIX + DummyProcessor.NAME, active=True)
+        Switch.objects.create(name=settings.PAYMENT_PROCESSOR_SWITCH_PREFIX + AnotherDummyProcessor.NAME, active=True)
+
+        request = self.process_request()
+        self.assertEqual(list(request.payment_processors), [DummyProcessor, AnotherDummyProcessor])
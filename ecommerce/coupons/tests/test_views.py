@@ -3,27 +3,37 @@ from decimal import Decimal
 import json
 
 from django.conf import settings
+from django.core.cache import cache
 from django.core.urlresolvers import reverse
 from django.http import HttpResponseRedirect
 from django.utils.timezone import now
 from django.utils.translation import ugettext_lazy as _
 import httpretty
+import mock
 from oscar.core.loading import get_class, get_model
 from oscar.test.factories import (OrderFactory, ConditionalOfferFactory, VoucherFactory,
                                   RangeFactory, BenefitFactory, ProductFactory)
 from oscar.test.utils import RequestFactory
 import pytz
 
-from ecommerce.coupons.views import get_voucher, voucher_is_valid
+from ecommerce.coupons.views import CouponRedeemView, get_voucher, voucher_is_valid
 from ecommerce.courses.tests.factories import CourseFactory
+from ecommerce.extensions.api.constants import APIConstants as AC
 from ecommerce.extensions.test.factories import create_coupon
+from ecommerce.extensions.voucher.utils import create_vouchers
 from ecommerce.settings import get_lms_url
 from ecommerce.tests.testcases import TestCase
 
 Applicator = get_class('offer.utils', 'Applicator')
 Basket = get_model('basket', 'Basket')
+Benefit = get_model('offer', 'Benefit')
 Catalog = get_model('catalogue', 'Catalog')
+ConditionalOffer = get_model('offer', 'ConditionalOffer')
 Course = get_model('courses', 'Course')
+Order = get_model('order', 'Order')
+Product = get_model('catalogue', 'Product')
+ProductClass = get_model('catalogue', 'ProductClass')
+Selector = get_class('partner.strategy', 'Selector')
 StockRecord = get_model('partner', 'StockRecord')
 Voucher = get_model('voucher', 'Voucher')
 VoucherApplication = get_model('voucher', 'VoucherApplication')
@@ -60,6 +70,7 @@ class CouponOfferViewTests(TestCase):
 
     def setUp(self):
         super(CouponOfferViewTests, self).setUp()
+        cache.clear()
 
     def prepare_voucher(self, range_=None, start_datetime=None, benefit_value=100):
         """ Create a voucher and add an offer to it that contains a created product. """
@@ -274,3 +285,129 @@ class CouponRedeemViewTests(TestCase):
         url = self.redeem_url + '?code={}'.format('COUPONTEST')
         response = self.client.get(url)
         self.assertIsInstance(response, HttpResponseRedirect)
+
+
+class EnrollmentCodeRedemptionTests(TestCase):
+    redeem_url = reverse('coupons:redeem')
+
+    def setUp(self):
+        super(EnrollmentCodeRedemptionTests, self).setUp()
+        cache.clear()
+        self.user = self.create_user()
+        self.client.login(username=self.user.username, password=self.password)
+        course = Course.objects.create(id='org/course/run')
+        self.seat = course.create_or_update_seat('verified', True, 50, self.partner)
+
+        self.catalog = Catalog.objects.create(partner=self.partner)
+        self.catalog.stock_records.add(StockRecord.objects.get(product=self.seat))
+
+    def create_voucher(self, benefit_value=100):
+        coupon = Product.objects.create(product_class=ProductClass.objects.get(slug='coupon'), title='Test coupon')
+        return create_vouchers(
+            benefit_type=Benefit.PERCENTAGE,
+            benefit_value=benefit_value,
+            catalog=self.catalog,
+            coupon=coupon,
+            end_datetime=now() + datetime.timedelta(days=1),
+            name='Test coupon',
+            quantity=1,
+            start_datetime=now() - datetime.timedelta(days=1),
+            voucher_type=Voucher.SINGLE_USE
+        )[0]
+
+    def redeem(self, voucher):
+        return self.client.get(self.redeem_url + '?code={}'.format(voucher.code))
+
+    def build_view(self):
+        """ Returns a redemption view, as set up for a request by the test user. """
+        request = RequestFactory().get(self.redeem_url)
+        request.user = self.user
+        request.site = self.site
+        request.strategy = Selector().strategy(user=self.user)
+        view = CouponRedeemView()
+        view.request = request
+        return view
+
+    @httpretty.activate
+    def test_enrollment_code(self):
+        """ Verify enrollment codes are redeemed in a new basket, to which only the code's offer is applied. """
+        httpretty.register_uri(httpretty.POST, settings.ENROLLMENT_API_URL, status=200)
+        existing_basket = Basket.get_basket(self.user, self.site)
+        voucher = self.create_voucher()
+
+        with mock.patch.object(Applicator, 'get_offers') as mock_get_offers:
+            response = self.redeem(voucher)
+            self.assertFalse(mock_get_offers.called)
+
+        self.assertIsInstance(response, HttpResponseRedirect)
+        order = Order.objects.get(user=self.user)
+        self.assertEqual(order.total_excl_tax, AC.FREE)
+        self.assertEqual(order.lines.get().product, self.seat)
+        self.assertEqual(list(order.basket.vouchers.all()), [voucher])
+        self.assertNotEqual(order.basket, existing_basket)
+        self.assertEqual(Basket.get_basket(self.user, self.site), existing_basket)
+
+    def test_enrollment_code_basket_not_free(self):
+        """ Verify nothing is saved if an enrollment code does not make the basket free. """
+        voucher = self.create_voucher()
+        basket_count = Basket.objects.count()
+
+        with mock.patch.object(Applicator, 'apply_offers'):
+            response = self.redeem(voucher)
+
+        self.assertEqual(str(response.context['error']), 'Basket total not $0, current value = $50.00')
+        self.assertEqual(Basket.objects.count(), basket_count)
+        self.assertFalse(Order.objects.exists())
+
+    def test_enrollment_code_usage_limit(self):
+        """ Verify the usage limits of an enrollment code's offer are checked against its current usage, rather than
+        that of the offer passed in. """
+        voucher = self.create_voucher()
+        offer = voucher.offers.get()
+        ConditionalOffer.objects.filter(id=offer.id).update(max_global_applications=1, num_applications=1)
+
+        __, order, __ = self.build_view()._redeem_enrollment_code(  # pylint: disable=protected-access
+            self.site, self.user, self.seat, voucher, offer
+        )
+        self.assertIsNone(order)
+        self.assertEqual(ConditionalOffer.objects.get(id=offer.id).num_applications, 1)
+
+    def test_enrollment_code_redeemed_concurrently(self):
+        """ Verify a single-use enrollment code is not redeemed again if it was redeemed by another user after it
+        was validated. """
+        voucher = self.create_voucher()
+        offer = voucher.offers.get()
+        basket_count = Basket.objects.count()
+
+        # Simulate a concurrent redemption, committed between validation and redemption of the code.
+        VoucherApplication.objects.create(voucher=voucher, user=self.create_user(), order=OrderFactory())
+
+        basket, order, msg = self.build_view()._redeem_enrollment_code(  # pylint: disable=protected-access
+            self.site, self.user, self.seat, voucher, offer
+        )
+        self.assertIsNone(basket)
+        self.assertIsNone(order)
+        self.assertEqual(msg, _('This coupon has already been used'))
+        self.assertEqual(Basket.objects.count(), basket_count)
+        self.assertEqual(voucher.applications.count(), 1)
+
+    def test_multiple_product_code(self):
+        """ Verify codes whose range contains products other than the resolved one are not enrollment codes. """
+        other_seat = Course.objects.create(id='org/other/run').create_or_update_seat('verified', True, 50, self.partner)
+        self.catalog.stock_records.add(StockRecord.objects.get(product=other_seat))
+        voucher = self.create_voucher()
+
+        with mock.patch.object(Applicator, 'get_offers', return_value=[]) as mock_get_offers:
+            self.redeem(voucher)
+            self.assertTrue(mock_get_offers.called)
+
+    def test_discount_code(self):
+        """ Verify codes which are not enrollment codes are applied to the user's basket, with all other offers. """
+        voucher = self.create_voucher(benefit_value=50)
+
+        with mock.patch.object(Applicator, 'get_offers', return_value=[]) as mock_get_offers:
+            response = self.redeem(voucher)
+            self.assertTrue(mock_get_offers.called)
+
+        self.assertEqual(str(response.context['error']), 'Basket total not $0, current value = $50.00')
+        self.assertFalse(Order.objects.exists())
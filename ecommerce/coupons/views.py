@@ -2,6 +2,7 @@ from __future__ import unicode_literals
 import logging
 
 from django.contrib.auth.decorators import login_required
+from django.db import transaction
 from django.http import HttpResponseRedirect
 from django.utils.decorators import method_decorator
 from django.utils.translation import ugettext_lazy as _
@@ -9,24 +10,31 @@ from django.shortcuts import render
 from django.views.generic import TemplateView, View
 from oscar.core.loading import get_class, get_model
 
-from edx_rest_api_client.client import EdxRestApiClient
-from edx_rest_api_client.exceptions import SlumberHttpBaseException
+from requests.exceptions import RequestException
+from slumber.exceptions import SlumberBaseException
 
 from ecommerce.core.views import StaffOnlyMixin
+from ecommerce.courses.utils import get_course_info_from_lms
 from ecommerce.extensions.api import data as data_api
 from ecommerce.extensions.api.constants import APIConstants as AC
 from ecommerce.extensions.checkout.mixins import EdxOrderPlacementMixin
 from ecommerce.extensions.fulfillment.status import ORDER
+from ecommerce.extensions.voucher.utils import get_voucher_resolution
 from ecommerce.settings import get_lms_url
 
 
 Applicator = get_class('offer.utils', 'Applicator')
 Basket = get_model('basket', 'Basket')
+Benefit = get_model('offer', 'Benefit')
+Condition = get_model('offer', 'Condition')
+ConditionalOffer = get_model('offer', 'ConditionalOffer')
 logger = logging.getLogger(__name__)
 Selector = get_class('partner.strategy', 'Selector')
 StockRecord = get_model('partner', 'StockRecord')
 Voucher = get_model('voucher', 'Voucher')
 
+ENROLLMENT_CODE_BENEFIT_VALUE = 100
+
 
 def get_voucher(code):
     """
@@ -39,20 +47,12 @@ def get_voucher(code):
         voucher (Voucher): The Voucher for the passed code.
         product (Product): The Product associated with the Voucher.
     """
-    voucher = None
-    product = None
-    # Check to see if a voucher exists for the code.
-    try:
-        voucher = Voucher.objects.get(code=code)
-    except Voucher.DoesNotExist:
-        logger.exception('Voucher does not exist for code [%s].', code)
-        return voucher, product
-
-    # Just get the first product.
-    products = voucher.offers.all()[0].benefit.range.all_products()
-    if products:
-        product = products[0]
-    return voucher, product
+    resolution = get_voucher_resolution(code)
+    if resolution is None:
+        logger.error('Voucher does not exist for code [%s].', code)
+        return None, None
+
+    return resolution['voucher'], resolution['product']
 
 
 def voucher_is_valid(voucher, product, request):
@@ -87,6 +87,29 @@ def voucher_is_valid(voucher, product, request):
     return True, ''
 
 
+def is_enrollment_code(resolution):
+    """
+    Returns True if the resolved voucher is an enrollment code, i.e. grants a 100% discount on a single product, and
+    its offer has no condition other than the presence of that product in the basket.
+
+    Arguments:
+        resolution (dict): Voucher resolution, as returned by get_voucher_resolution.
+
+    Returns:
+        bool
+    """
+    benefit = resolution['benefit']
+    if not (resolution['product'] and resolution['single_product'] and benefit):
+        return False
+
+    condition = resolution['offer'].condition
+    return (
+        benefit.type == Benefit.PERCENTAGE and benefit.value == ENROLLMENT_CODE_BENEFIT_VALUE and
+        not condition.proxy_class and condition.type == Condition.COUNT and condition.value == 1 and
+        condition.range_id == benefit.range_id
+    )
+
+
 class CouponAppView(StaffOnlyMixin, TemplateView):
     template_name = 'coupons/coupon_app.html'
 
@@ -99,26 +122,23 @@ class CouponOfferView(TemplateView):
 
         code = self.request.GET.get('code', None)
         if code is not None:
-            voucher, product = get_voucher(code=code)
+            resolution = get_voucher_resolution(code) or {}
+            voucher, product = resolution.get('voucher'), resolution.get('product')
             valid_voucher, msg = voucher_is_valid(voucher, product, self.request)
             if valid_voucher:
-                api = EdxRestApiClient(
-                    get_lms_url('api/courses/v1/'),
-                )
                 try:
-                    course = api.courses(product.course_id).get()
-                except SlumberHttpBaseException as e:
+                    course = get_course_info_from_lms(product.course_id)
+                except (SlumberBaseException, RequestException) as e:
                     logger.exception('Could not get course information. [%s]', e)
                     return {
                         'error': _('Could not get course information. [{error}]'.format(error=e))
                     }
 
                 course['image_url'] = get_lms_url(course['media']['course_image']['uri'])
-                stock_records = voucher.offers.first().benefit.range.catalog.stock_records.first()
                 context.update({
                     'course': course,
                     'code': code,
-                    'price': stock_records.price_excl_tax,
+                    'price': resolution['price'],
                     'verified': (product.attr.certificate_type is 'verified')
                 })
                 return context
@@ -149,35 +169,22 @@ class CouponRedeemView(EdxOrderPlacementMixin, View):
         if not code:
             return render(request, template_name, {'error': _('Code not provided')})
 
-        voucher, product = get_voucher(code=code)
+        resolution = get_voucher_resolution(code) or {}
+        voucher, product = resolution.get('voucher'), resolution.get('product')
         valid_voucher, msg = voucher_is_valid(voucher, product, request)
         if not valid_voucher:
             return render(request, template_name, {'error': msg})
 
-        basket = self._prepare_basket(request.site, request.user, product, voucher)
-        if basket.total_excl_tax == AC.FREE:
-            basket.freeze()
-            order_metadata = data_api.get_order_metadata(basket)
-
-            logger.info(
-                u"Preparing to place order [%s] for the contents of basket [%d]",
-                order_metadata[AC.KEYS.ORDER_NUMBER],
-                basket.id,
-            )
-
-            # Place an order. If order placement succeeds, the order is committed
-            # to the database so that it can be fulfilled asynchronously.
-            order = self.handle_order_placement(
-                order_number=order_metadata[AC.KEYS.ORDER_NUMBER],
-                user=basket.owner,
-                basket=basket,
-                shipping_address=None,
-                shipping_method=order_metadata[AC.KEYS.SHIPPING_METHOD],
-                shipping_charge=order_metadata[AC.KEYS.SHIPPING_CHARGE],
-                billing_address=None,
-                order_total=order_metadata[AC.KEYS.ORDER_TOTAL],
-            )
+        if is_enrollment_code(resolution):
+            basket, order, msg = self._redeem_enrollment_code(request.site, request.user, product, voucher,
+                                                              resolution['offer'])
+            if msg:
+                return render(request, template_name, {'error': msg})
         else:
+            basket = self._prepare_basket(request.site, request.user, product, voucher)
+            order = self._place_free_order(basket) if basket.total_excl_tax == AC.FREE else None
+
+        if order is None:
             return render(
                 request,
                 template_name,
@@ -186,12 +193,105 @@ class CouponRedeemView(EdxOrderPlacementMixin, View):
                 ))}
             )
 
+        order = self.handle_successful_order(order)
+
         if order.status is ORDER.COMPLETE:
             return HttpResponseRedirect(get_lms_url(''))
         else:
             logger.error('Order was not completed [%s]', order.id)
             return render(request, template_name, {'error': _('Error when trying to redeem code')})
 
+    def _redeem_enrollment_code(self, site, user, product, voucher, offer):
+        """
+        Place the order for an enrollment code.
+
+        Unlike _prepare_basket, the user's existing basket is left untouched. A new basket, containing only the
+        product, is created and only the voucher's offer is applied to it; other offers cannot reduce the total
+        of a basket that is already free. The basket and order are created in a single transaction, so that
+        nothing is left behind if the basket is not free.
+
+        Arguments:
+            site (Site): The site from which the request came.
+            user (User): User who made the request.
+            product (Product): Product to be redeemed.
+            voucher (Voucher): Enrollment code to apply to the basket.
+            offer (ConditionalOffer): The voucher's offer.
+
+        Returns:
+            tuple: The basket, or None if the voucher is no longer available to the user; the placed order, or None
+                if the basket was not free; and a message explaining why the voucher is no longer available, if so.
+        """
+        with transaction.atomic():
+            # The voucher may have been validated before other redemptions of the code, or of other codes sharing
+            # its offer, were committed. The voucher and offer are reloaded with locking reads, so that concurrent
+            # redemptions wait for each other, and the voucher's availability is checked again, and usage recorded,
+            # against the current counts.
+            voucher = Voucher.objects.select_for_update().get(id=voucher.id)
+            offer = ConditionalOffer.objects.select_for_update().select_related(
+                'benefit__range', 'condition__range'
+            ).get(id=offer.id)
+
+            available, msg = voucher.is_available_to_user(user)
+            if not available:
+                logger.warning('Enrollment code [%s] is no longer available to user [%d].', voucher.code, user.id)
+                transaction.set_rollback(True)
+                return None, None, msg.replace('voucher', 'coupon')
+
+            basket = Basket.objects.create(site=site, owner=user)
+            basket.strategy = self.request.strategy
+            basket.add_product(product, 1)
+            basket.vouchers.add(voucher)
+
+            offer.set_voucher(voucher)
+            Applicator().apply_offers(basket, [offer])
+
+            if basket.total_excl_tax != AC.FREE:
+                logger.warning('Enrollment code [%s] does not make basket [%d] free.', voucher.code, basket.id)
+                transaction.set_rollback(True)
+                return basket, None, None
+
+            logger.info('Applied Voucher [%s] to basket.', voucher.code)
+            return basket, self._place_free_order(basket), None
+
+    def _place_free_order(self, basket):
+        """
+        Freeze the basket and place an order for its contents, without payment.
+
+        Fulfillment is left to the caller, by way of handle_successful_order. Since requests are atomic, it runs
+        in the request's transaction, after the order has been placed.
+
+        Arguments:
+            basket (Basket): Basket whose total is zero.
+
+        Returns:
+            Order
+        """
+        basket.freeze()
+        order_metadata = data_api.get_order_metadata(basket)
+
+        logger.info(
+            u"Preparing to place order [%s] for the contents of basket [%d]",
+            order_metadata[AC.KEYS.ORDER_NUMBER],
+            basket.id,
+        )
+
+        # Place an order. If order placement succeeds, the order is committed
+        # to the database so that it can be fulfilled asynchronously.
+        with transaction.atomic():
+            order = self.place_order(
+                order_number=order_metadata[AC.KEYS.ORDER_NUMBER],
+                user=basket.owner,
+                basket=basket,
+                shipping_address=None,
+                shipping_method=order_metadata[AC.KEYS.SHIPPING_METHOD],
+                shipping_charge=order_metadata[AC.KEYS.SHIPPING_CHARGE],
+                billing_address=None,
+                order_total=order_metadata[AC.KEYS.ORDER_TOTAL],
+            )
+            basket.submit()
+
+        return order
+
     def _prepare_basket(self, site, user, product, voucher):
         """
         Prepare the basket, add the product, and apply a voucher.
@@ -5,8 +5,8 @@ from django.db import models, transaction
 from django.db.models import Q
 from django.utils.translation import ugettext_lazy as _
 from oscar.core.loading import get_model
-from simple_history.models import HistoricalRecords
 
+from ecommerce.core.history import DeferrableHistoricalRecords
 from ecommerce.courses.publishers import LMSPublisher
 from ecommerce.extensions.catalogue.utils import generate_sku
 
@@ -27,7 +27,7 @@ class Course(models.Model):
         blank=True,
         help_text=_('Last date/time on which verification for this product can be submitted.')
     )
-    history = HistoricalRecords()
+    history = DeferrableHistoricalRecords()
     thumbnail_url = models.URLField(null=True, blank=True)
 
     def __unicode__(self):
@@ -1,7 +1,15 @@
+from django.conf import settings
+from django.core.cache import cache
 import ddt
+import httpretty
+import mock
+from slumber.exceptions import SlumberHttpBaseException
 
+from ecommerce.core import cache_utils
+from ecommerce.courses import utils
 from ecommerce.courses.models import Course
-from ecommerce.courses.utils import mode_for_seat
+from ecommerce.courses.utils import get_course_info_from_lms, mode_for_seat
+from ecommerce.settings import get_lms_url
 from ecommerce.extensions.catalogue.tests.mixins import CourseCatalogTestMixin
 from ecommerce.tests.testcases import TestCase
 
@@ -24,3 +32,95 @@ class UtilsTests(CourseCatalogTestMixin, TestCase):
         course = Course.objects.create(id='edx/Demo_Course/DemoX')
         seat = course.create_or_update_seat(certificate_type, id_verification_required, 10.00, self.partner)
         self.assertEqual(mode_for_seat(seat), mode)
+
+
+@httpretty.activate
+class CourseInfoCacheTests(TestCase):
+    course_id = 'edX/DemoX/Demo_Course'
+
+    def setUp(self):
+        super(CourseInfoCacheTests, self).setUp()
+        cache.clear()
+        self.now = 1000.0
+
+        patcher = mock.patch.object(cache_utils.time, 'time', side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def mock_course_api(self, status=200, name='Demo Course'):
+        url = get_lms_url('api/courses/v1/courses/{}/'.format(self.course_id))
+        body = '{{"name": "{}"}}'.format(name) if status == 200 else '{}'
+        httpretty.reset()
+        httpretty.register_uri(httpretty.GET, url, status=status, body=body, content_type='application/json')
+
+    def assert_request_count(self, count):
+        self.assertEqual(len(httpretty.httpretty.latest_requests), count)
+
+    def test_cached(self):
+        """ Verify course information is retrieved from the LMS once, and cached. """
+        self.mock_course_api()
+        self.assertEqual(get_course_info_from_lms(self.course_id), {'name': 'Demo Course'})
+        self.assertEqual(get_course_info_from_lms(self.course_id), {'name': 'Demo Course'})
+        self.assert_request_count(1)
+
+    def test_negative_caching(self):
+        """ Verify failures are cached briefly, and stale information is served in their place. """
+        self.mock_course_api(status=404)
+        for __ in range(2):
+            with self.assertRaises(SlumberHttpBaseException):
+                get_course_info_from_lms(self.course_id)
+        self.assert_request_count(1)
+
+        self.now += settings.COURSE_INFO_NEGATIVE_CACHE_TIMEOUT + 1
+        self.mock_course_api()
+        self.assertEqual(get_course_info_from_lms(self.course_id), {'name': 'Demo Course'})
+        self.assert_request_count(1)
+
+        # Stale information is served if the LMS fails while the information is refreshed.
+        self.now += settings.COURSE_INFO_CACHE_TIMEOUT + 1
+        self.mock_course_api(status=500)
+        self.assertEqual(get_course_info_from_lms(self.course_id), {'name': 'Demo Course'})
+        self.assertEqual(get_course_info_from_lms(self.course_id), {'name': 'Demo Course'})
+        self.assert_request_count(1)
+
+    def test_stale_while_revalidate(self):
+        """ Verify stale information is served, without calling the LMS, while another request refreshes it. """
+        self.mock_course_api()
+        get_course_info_from_lms(self.course_id)
+
+        self.now += settings.COURSE_INFO_CACHE_TIMEOUT + 1
+        self.mock_course_api(name='Updated')
+        with mock.patch.object(cache_utils.cache, 'add', return_value=False):
+            self.assertEqual(get_course_info_from_lms(self.course_id), {'name': 'Demo Course'})
+        self.assert_request_count(0)
+
+        self.assertEqual(get_course_info_from_lms(self.course_id), {'name': 'Updated'})
+        self.assert_request_count(1)
+
+    def test_request_coalescing(self):
+        """ Verify a request waits for another request already retrieving the information, rather than calling
+        the LMS itself. """
+        self.mock_course_api()
+        key = 'course_info_{}'.format(utils.hashlib.md5(self.course_id).hexdigest())
+
+        def sleep(seconds):
+            # The other request stores the information while this one waits.
+            self.now += seconds
+            cache.set(key, {'data': {'name': 'Other'}, 'fresh_until': self.now + 60, 'error': None})
+
+        with mock.patch.object(cache_utils.cache, 'add', return_value=False):
+            with mock.patch.object(cache_utils.time, 'sleep', side_effect=sleep):
+                self.assertEqual(get_course_info_from_lms(self.course_id), {'name': 'Other'})
+        self.assert_request_count(0)
+
+    def test_request_coalescing_timeout(self):
+        """ Verify the LMS is called if the information is not retrieved by another request in time. """
+        self.mock_course_api()
+
+        def sleep(seconds):
+            self.now += seconds
+
+        with mock.patch.object(cache_utils.cache, 'add', return_value=False):
+            with mock.patch.object(cache_utils.time, 'sleep', side_effect=sleep):
+                self.assertEqual(get_course_info_from_lms(self.course_id), {'name': 'Demo Course'})
+        self.assert_request_count(1)
@@ -2,6 +2,7 @@ import json
 
 import httpretty
 from django.conf import settings
+from django.core.cache import cache
 from django.core.urlresolvers import reverse
 from requests import Timeout
 from testfixtures import LogCapture
@@ -53,6 +54,10 @@ class CourseConvertHonorToAuditView(ManagementCommandViewMixin, TestCase):
 class CourseAppViewTests(TestCase):
     path = reverse('courses:app', args=[''])
 
+    def setUp(self):
+        super(CourseAppViewTests, self).setUp()
+        cache.clear()
+
     def mock_credit_api_providers(self):
         """
         Mock GET requests to the Credit API's provider endpoint.
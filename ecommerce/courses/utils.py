@@ -1,10 +1,64 @@
+import hashlib
+
+from django.conf import settings
+from edx_rest_api_client.client import EdxRestApiClient
+from requests.exceptions import RequestException
+from slumber.exceptions import SlumberBaseException, SlumberHttpBaseException
+
+from ecommerce.core import cache_utils
+from ecommerce.settings import get_lms_url
+
+# Seconds for which a request waits for another request to retrieve the same course information.
+COURSE_INFO_WAIT_TIMEOUT = 5
+
+
 def mode_for_seat(seat):
     """ Returns the Enrollment mode for a given seat product. """
     certificate_type = getattr(seat.attr, 'certificate_type', '')
+    id_verification_required = certificate_type == 'professional' and seat.attr.id_verification_required
+    return mode_for_certificate_type(certificate_type, id_verification_required)
+
 
-    if certificate_type == 'professional' and not seat.attr.id_verification_required:
+def mode_for_certificate_type(certificate_type, id_verification_required):
+    """ Returns the Enrollment mode for a seat with the given certificate type and ID verification requirement. """
+    if certificate_type == 'professional' and not id_verification_required:
         return 'no-id-professional'
     elif certificate_type == '':
         return 'audit'
 
     return certificate_type
+
+
+def get_course_info_from_lms(course_key):
+    """ Retrieve course information from the LMS Course API.
+
+    Results, including failures, are cached. Concurrent requests for information which is not cached make a single
+    call to the LMS. Expired information continues to be served while a single request refreshes it.
+
+    Arguments:
+        course_key (str): The course identifier.
+
+    Returns:
+        dict
+
+    Raises:
+        SlumberBaseException, RequestException: If the information could not be retrieved.
+    """
+    key = 'course_info_{}'.format(hashlib.md5(course_key).hexdigest())
+    timeouts = cache_utils.CacheTimeouts(
+        fresh=settings.COURSE_INFO_CACHE_TIMEOUT,
+        stale=settings.COURSE_INFO_STALE_CACHE_TIMEOUT,
+        negative=settings.COURSE_INFO_NEGATIVE_CACHE_TIMEOUT
+    )
+    entry = cache_utils.get_entry(
+        key,
+        lambda: EdxRestApiClient(get_lms_url('api/courses/v1/')).courses(course_key).get(),
+        timeouts,
+        (SlumberBaseException, RequestException),
+        wait_timeout=COURSE_INFO_WAIT_TIMEOUT
+    )
+
+    if entry['data'] is None:
+        raise SlumberHttpBaseException(entry['error'])
+
+    return entry['data']
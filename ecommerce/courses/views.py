@@ -3,18 +3,13 @@ import json
 import logging
 import os
 
-from django.conf import settings
-from django.core.cache import cache
 from django.core.management import call_command
 from django.http import Http404, HttpResponse
 from django.views.generic import View, TemplateView
-from edx_rest_api_client.client import EdxRestApiClient
-from requests import Timeout
-from slumber.exceptions import SlumberBaseException
 
 from ecommerce.core.views import StaffOnlyMixin
+from ecommerce.credit.providers import get_all_credit_providers, get_credit_api_client
 from ecommerce.extensions.partner.shortcuts import get_partner_for_site
-from ecommerce.settings import get_lms_url
 
 
 logger = logging.getLogger(__name__)
@@ -41,24 +36,13 @@ class CourseAppView(StaffOnlyMixin, TemplateView):
 
         Results will be sorted alphabetically by display name.
         """
-        key = 'credit_providers'
-        credit_providers = cache.get(key, [])
-
-        if not credit_providers:
-            try:
-                credit_api = EdxRestApiClient(
-                    get_lms_url('/api/credit/v1/'),
-                    oauth_access_token=self.request.user.access_token
-                )
-                credit_providers = credit_api.providers.get()
-                credit_providers.sort(key=lambda provider: provider['display_name'])
-
-                # Update the cache
-                cache.set(key, credit_providers, settings.CREDIT_PROVIDER_CACHE_TIMEOUT)
-            except (SlumberBaseException, Timeout):
-                logger.exception('Failed to retrieve credit providers!')
-
-        return credit_providers
+        credit_providers = get_all_credit_providers(get_credit_api_client(self.request.user.access_token))
+
+        if credit_providers is None:
+            logger.error('Failed to retrieve credit providers!')
+            return []
+
+        return sorted(credit_providers, key=lambda provider: provider['display_name'])
 
 
 class CourseMigrationView(View):
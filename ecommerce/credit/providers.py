@@ -0,0 +1,162 @@
+"""
+Cached access to credit provider data from the LMS Credit API.
+
+Each provider is cached under its own key, so that callers interested in a few providers need not retrieve all of
+them. Cached data remains usable for CREDIT_PROVIDER_STALE_CACHE_TIMEOUT seconds after it expires, and failures to
+retrieve data are cached for CREDIT_PROVIDER_NEGATIVE_CACHE_TIMEOUT seconds. See ecommerce.core.cache_utils.
+"""
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from edx_rest_api_client.client import EdxRestApiClient
+import requests
+from slumber.exceptions import SlumberBaseException
+
+from ecommerce.core import cache_utils
+from ecommerce.settings import get_lms_url
+
+logger = logging.getLogger(__name__)
+
+ALL_PROVIDERS_CACHE_KEY = 'credit_providers'
+# Errors raised if provider data cannot be retrieved from the LMS.
+FETCH_ERRORS = (SlumberBaseException, requests.RequestException)
+
+
+def get_credit_api_client(access_token=None):
+    """ Returns a Credit API client.
+
+    Arguments:
+        access_token (str): OAuth access token with which to authenticate. If not provided, the client is
+            authenticated with the EDX_API_KEY setting.
+
+    Returns:
+        EdxRestApiClient
+    """
+    session = None
+    if not access_token:
+        session = requests.Session()
+        session.headers['X-Edx-Api-Key'] = settings.EDX_API_KEY
+
+    return EdxRestApiClient(
+        get_lms_url('api/credit/v1/'),
+        oauth_access_token=access_token,
+        session=session,
+        timeout=settings.PROVIDER_DATA_PROCESSING_TIMEOUT
+    )
+
+
+def get_credit_providers(provider_ids, api=None):
+    """ Retrieve data for the given credit providers.
+
+    Arguments:
+        provider_ids (list): IDs of the providers to retrieve.
+        api (EdxRestApiClient): Credit API client used if data must be retrieved from the LMS.
+
+    Returns:
+        dict: Provider data keyed by provider ID. Providers whose data could not be retrieved are omitted.
+    """
+    timeouts = _get_timeouts()
+    keys = {provider_id: _get_cache_key(provider_id) for provider_id in set(provider_ids)}
+    entries = cache.get_many(keys.values())
+    providers = {}
+    refresh = []
+
+    for provider_id, key in keys.items():
+        entry = entries.get(key)
+        if entry is None:
+            refresh.append(provider_id)
+            continue
+
+        if entry['data'] is not None:
+            providers[provider_id] = entry['data']
+
+        if not cache_utils.is_fresh(entry) and cache_utils.acquire_refresh_lock(key):
+            refresh.append(provider_id)
+
+    if refresh:
+        fetched = _fetch_providers(api, refresh)
+        if fetched is None:
+            # Serve stale data while the LMS is unavailable, but try again once the negative entry expires.
+            entries = {
+                keys[provider_id]: cache_utils.make_entry(providers.get(provider_id), timeouts.negative)
+                for provider_id in refresh
+            }
+        else:
+            fetched = {provider['id']: provider for provider in fetched if provider['id'] in keys}
+            providers.update(fetched)
+            entries = {
+                keys[provider_id]: cache_utils.make_entry(
+                    fetched.get(provider_id),
+                    timeouts.fresh if provider_id in fetched else timeouts.negative
+                )
+                for provider_id in refresh
+            }
+
+        cache_utils.set_entries(entries, timeouts)
+        cache_utils.release_refresh_locks([keys[provider_id] for provider_id in refresh])
+
+    return providers
+
+
+def get_credit_provider(provider_id, api=None):
+    """ Retrieve data for a single credit provider.
+
+    Returns:
+        dict, or None if the data could not be retrieved.
+    """
+    return get_credit_providers([provider_id], api=api).get(provider_id)
+
+
+def get_all_credit_providers(api=None):
+    """ Retrieve data for all credit providers.
+
+    Arguments:
+        api (EdxRestApiClient): Credit API client used if data must be retrieved from the LMS.
+
+    Returns:
+        list, or None if the data could not be retrieved.
+    """
+    timeouts = _get_timeouts()
+
+    def fetch():
+        providers = (api or get_credit_api_client()).providers.get()
+        # Providers retrieved together are also cached individually, for get_credit_providers.
+        cache_utils.set_entries(
+            {
+                _get_cache_key(provider['id']): cache_utils.make_entry(provider, timeouts.fresh)
+                for provider in providers
+            },
+            timeouts
+        )
+        return providers
+
+    return cache_utils.get_entry(ALL_PROVIDERS_CACHE_KEY, fetch, timeouts, FETCH_ERRORS)['data']
+
+
+def _get_cache_key(provider_id):
+    return 'credit_provider_{}'.format(provider_id)
+
+
+def _get_timeouts():
+    return cache_utils.CacheTimeouts(
+        fresh=settings.CREDIT_PROVIDER_CACHE_TIMEOUT,
+        stale=settings.CREDIT_PROVIDER_STALE_CACHE_TIMEOUT,
+        negative=settings.CREDIT_PROVIDER_NEGATIVE_CACHE_TIMEOUT
+    )
+
+
+def _fetch_providers(api, provider_ids):
+    """ Retrieve data for the given providers from the LMS, in a single request.
+
+    Returns:
+        list, or None if the request failed.
+    """
+    api = api or get_credit_api_client()
+    provider_ids = ','.join(sorted(provider_ids))
+
+    try:
+        return api.providers.get(provider_ids=provider_ids)
+    except FETCH_ERRORS:
+        logger.exception('Failed to retrieve credit provider data for [%s].', provider_ids)
+        return None
@@ -0,0 +1,112 @@
+from __future__ import unicode_literals
+
+from django.conf import settings
+from django.core.cache import cache
+import mock
+from slumber.exceptions import HttpServerError
+
+from ecommerce.core import cache_utils
+from ecommerce.credit import providers
+from ecommerce.tests.testcases import TestCase
+
+ASU = {'id': 'ASU', 'display_name': 'Arizona State University'}
+MIT = {'id': 'MIT', 'display_name': 'Massachusetts Institute of Technology'}
+
+
+class CreditProviderCacheTests(TestCase):
+    def setUp(self):
+        super(CreditProviderCacheTests, self).setUp()
+        cache.clear()
+        self.api = mock.Mock()
+        self.api.providers.get.return_value = [ASU, MIT]
+        self.now = 1000.0
+
+        patcher = mock.patch.object(cache_utils.time, 'time', side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def assert_fetched(self, *provider_ids):
+        """ Verify the providers were requested from the LMS, and reset the mock. """
+        self.api.providers.get.assert_called_once_with(provider_ids=','.join(provider_ids))
+        self.api.providers.get.reset_mock()
+
+    def test_get_credit_providers_cached(self):
+        """ Verify providers are cached individually, and only missing providers are requested. """
+        self.api.providers.get.return_value = [ASU]
+        self.assertEqual(providers.get_credit_providers(['ASU'], api=self.api), {'ASU': ASU})
+        self.assert_fetched('ASU')
+
+        self.assertEqual(providers.get_credit_provider('ASU', api=self.api), ASU)
+        self.assertFalse(self.api.providers.get.called)
+
+        self.api.providers.get.return_value = [MIT]
+        self.assertEqual(providers.get_credit_providers(['ASU', 'MIT'], api=self.api), {'ASU': ASU, 'MIT': MIT})
+        self.assert_fetched('MIT')
+
+    def test_stale_while_revalidate(self):
+        """ Verify stale data is served while a single caller refreshes it. """
+        providers.get_credit_providers(['ASU'], api=self.api)
+        self.assert_fetched('ASU')
+
+        self.now += settings.CREDIT_PROVIDER_CACHE_TIMEOUT + 1
+        updated = dict(ASU, display_name='ASU')
+        self.api.providers.get.return_value = [updated]
+
+        # Another caller is refreshing the data.
+        cache_utils.acquire_refresh_lock(providers._get_cache_key('ASU'))  # pylint: disable=protected-access
+        self.assertEqual(providers.get_credit_provider('ASU', api=self.api), ASU)
+        self.assertFalse(self.api.providers.get.called)
+
+        cache_utils.release_refresh_locks([providers._get_cache_key('ASU')])  # pylint: disable=protected-access
+        self.assertEqual(providers.get_credit_provider('ASU', api=self.api), updated)
+        self.assert_fetched('ASU')
+
+        self.assertEqual(providers.get_credit_provider('ASU', api=self.api), updated)
+        self.assertFalse(self.api.providers.get.called)
+
+    def test_negative_caching(self):
+        """ Verify failures to retrieve data are cached briefly, and stale data is served in their place. """
+        self.api.providers.get.side_effect = HttpServerError
+        self.assertIsNone(providers.get_credit_provider('ASU', api=self.api))
+        self.assert_fetched('ASU')
+
+        self.assertIsNone(providers.get_credit_provider('ASU', api=self.api))
+        self.assertFalse(self.api.providers.get.called)
+
+        # Providers unknown to the LMS are also cached briefly.
+        self.api.providers.get.side_effect = None
+        self.api.providers.get.return_value = [MIT]
+        self.assertEqual(providers.get_credit_providers(['MIT', 'XYZ'], api=self.api), {'MIT': MIT})
+        self.assert_fetched('MIT', 'XYZ')
+        self.assertEqual(providers.get_credit_providers(['MIT', 'XYZ'], api=self.api), {'MIT': MIT})
+        self.assertFalse(self.api.providers.get.called)
+
+        self.now += settings.CREDIT_PROVIDER_NEGATIVE_CACHE_TIMEOUT + 1
+        self.api.providers.get.return_value = [ASU]
+        self.assertEqual(providers.get_credit_provider('ASU', api=self.api), ASU)
+        self.assert_fetched('ASU')
+
+        # Stale data is served if the LMS fails while the data is refreshed.
+        self.now += settings.CREDIT_PROVIDER_CACHE_TIMEOUT + 1
+        self.api.providers.get.side_effect = HttpServerError
+        self.assertEqual(providers.get_credit_provider('ASU', api=self.api), ASU)
+        self.assert_fetched('ASU')
+        self.assertEqual(providers.get_credit_provider('ASU', api=self.api), ASU)
+        self.assertFalse(self.api.providers.get.called)
+
+    def test_get_all_credit_providers(self):
+        """ Verify all providers are cached together, and individually. """
+        self.assertEqual(providers.get_all_credit_providers(api=self.api), [ASU, MIT])
+        self.api.providers.get.assert_called_once_with()
+        self.api.providers.get.reset_mock()
+
+        self.assertEqual(providers.get_all_credit_providers(api=self.api), [ASU, MIT])
+        self.assertEqual(providers.get_credit_providers(['ASU', 'MIT'], api=self.api), {'ASU': ASU, 'MIT': MIT})
+        self.assertFalse(self.api.providers.get.called)
+
+    def test_get_all_credit_providers_failure(self):
+        """ Verify None is returned, and cached briefly, if the providers cannot be retrieved. """
+        self.api.providers.get.side_effect = HttpServerError
+        self.assertIsNone(providers.get_all_credit_providers(api=self.api))
+        self.assertIsNone(providers.get_all_credit_providers(api=self.api))
+        self.assertEqual(self.api.providers.get.call_count, 1)
@@ -6,6 +6,7 @@ import json
 
 import ddt
 from django.conf import settings
+from django.core.cache import cache
 from django.core.urlresolvers import reverse
 import httpretty
 from waffle.models import Switch
@@ -27,6 +28,7 @@ class CheckoutPageTest(CourseCatalogTestMixin, TestCase, JwtMixin):
 
     def setUp(self):
         super(CheckoutPageTest, self).setUp()
+        cache.clear()
         self.switch = toggle_switch('ENABLE_CREDIT_APP', True)
 
         user = self.create_user(is_superuser=False)
@@ -174,6 +176,21 @@ class CheckoutPageTest(CourseCatalogTestMixin, TestCase, JwtMixin):
         self._mock_providers_api(body=[])
         self._assert_error_without_providers()
 
+    @httpretty.activate
+    def test_get_with_missing_provider(self):
+        """ Verify an error is shown if the Credit API returns the details of only some of the seats' providers. """
+        self._mock_eligibility_api(body=self.eligibilities)
+
+        # Create credit seats for two providers, only one of which is known to the Credit API
+        self.course.create_or_update_seat(
+            'credit', True, self.price, self.partner, self.provider, credit_hours=self.credit_hours
+        )
+        self.course.create_or_update_seat(
+            'credit', True, self.price, self.partner, 'MIT', credit_hours=self.credit_hours
+        )
+        self._mock_providers_api(body=self.provider_data)
+        self._assert_error_without_providers()
+
     @httpretty.activate
     def test_eligibility_api_failure(self):
         """ Verify an error is shown if an exception is raised when requesting
@@ -11,14 +11,12 @@ from django.utils.decorators import method_decorator
 from django.utils.functional import cached_property
 from django.utils.translation import ugettext_lazy as _
 from django.views.generic import TemplateView
-from edx_rest_api_client.client import EdxRestApiClient
 from slumber.exceptions import SlumberHttpBaseException
 import waffle
 
 from ecommerce.courses.models import Course
+from ecommerce.credit.providers import get_credit_api_client, get_credit_providers
 from ecommerce.extensions.partner.shortcuts import get_partner_for_site
-from ecommerce.extensions.payment.helpers import get_processor_class
-from ecommerce.settings import get_lms_url
 
 logger = logging.getLogger(__name__)
 
@@ -65,10 +63,7 @@ class Checkout(TemplateView):
 
         # Make button text for each processor which will be shown to user.
         processors_dict = OrderedDict()
-        for path in settings.PAYMENT_PROCESSORS:
-            processor_class = get_processor_class(path)
-            if not processor_class.is_enabled():
-                continue
+        for processor_class in self.request.payment_processors:
             processor = processor_class.NAME.lower()
             if processor == 'cybersource':
                 processors_dict[processor] = 'Checkout'
@@ -152,9 +147,7 @@ class Checkout(TemplateView):
         if not providers:
             return None
 
-        providers_dict = {}
-        for provider in providers:
-            providers_dict[provider['id']] = provider
+        providers_dict = {provider['id']: dict(provider) for provider in providers}
 
         partner = get_partner_for_site(self.request)
         for seat in credit_seats:
@@ -165,7 +158,7 @@ class Checkout(TemplateView):
                 'credit_hours': seat.attr.credit_hours
             })
 
-        return providers_dict.values()
+        return [providers_dict[provider['id']] for provider in providers]
 
     def _get_providers_from_lms(self, credit_seats):
         """ Helper method for getting provider info from LMS.
@@ -174,22 +167,23 @@ class Checkout(TemplateView):
             credit_seats (Products): List of credit_seats objects.
 
         Returns:
-            Response from LMS as json, containing list of providers.
+            List of providers, in the order of the seats, or None if any of them could not be retrieved.
         """
+        provider_ids = []
+        for seat in credit_seats:
+            if seat.attr.credit_provider and seat.attr.credit_provider not in provider_ids:
+                provider_ids.append(seat.attr.credit_provider)
 
-        provider_ids = ",".join([seat.attr.credit_provider for seat in credit_seats if seat.attr.credit_provider])
+        providers = get_credit_providers(provider_ids, api=self.credit_api_client)
 
-        try:
-            return self.credit_api_client.providers.get(provider_ids=provider_ids)
-        except SlumberHttpBaseException:
-            logger.exception(u'An error occurred while retrieving credit provider details.')
+        if set(provider_ids) - set(providers):
+            logger.error(u'An error occurred while retrieving credit provider details.')
             return None
 
+        return [providers[provider_id] for provider_id in provider_ids]
+
     @cached_property
     def credit_api_client(self):
         """ Returns an instance of the Credit API client. """
 
-        return EdxRestApiClient(
-            get_lms_url('api/credit/v1/'),
-            oauth_access_token=self.request.user.access_token
-        )
+        return get_credit_api_client(self.request.user.access_token)
@@ -0,0 +1,64 @@
+"""
+Emitters deliver business intelligence events.
+
+Events are never delivered inline: the Segment emitter places them on the bounded in-process queue of the Segment
+client, whose consumer thread uploads them in batches. Events are dropped, and a warning logged, if the queue is full,
+so that callers never wait on Segment. The in-memory emitter retains events, for tests.
+"""
+import logging
+
+import analytics
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+_emitters = {}
+
+
+class SegmentEmitter(object):
+    """ Emits events to Segment. """
+
+    def track(self, user_id, event, properties, context=None):
+        if analytics.default_client is None and settings.SEGMENT_KEY:
+            # The client, and its consumer thread, are created lazily so that they are not inherited by forked
+            # processes (e.g. Celery workers) in which the thread would not be running.
+            analytics.default_client = analytics.Client(
+                settings.SEGMENT_KEY,
+                debug=settings.DEBUG,
+                max_queue_size=settings.SEGMENT_MAX_QUEUE_SIZE,
+                on_error=log_upload_error
+            )
+
+        analytics.track(user_id, event, properties, context=context or {})
+
+
+class InMemoryEmitter(object):
+    """ Retains events in memory, for use in tests. """
+
+    def __init__(self):
+        self.events = []
+
+    def track(self, user_id, event, properties, context=None):
+        self.events.append({'user_id': user_id, 'event': event, 'properties': properties, 'context': context or {}})
+
+    def clear(self):
+        self.events = []
+
+
+def log_upload_error(error, batch):
+    logger.error('Failed to upload [%d] events to Segment: %s', len(batch), error)
+
+
+def get_emitter():
+    """ Returns the emitter configured by the ANALYTICS_EMITTER setting. """
+    path = settings.ANALYTICS_EMITTER
+    if path not in _emitters:
+        _emitters[path] = import_string(path)()
+
+    return _emitters[path]
+
+
+def clear_emitters():
+    """ Discard all emitters, including the events retained by in-memory emitters. """
+    _emitters.clear()
@@ -0,0 +1,102 @@
+"""
+Builders for business intelligence event payloads.
+
+Payloads are built from a single query for the lines of an order or refund, and its products, rather than by
+loading each product's course, class and attributes individually.
+"""
+from django.db.models import Prefetch
+from oscar.core.loading import get_model
+
+from ecommerce.courses.utils import mode_for_certificate_type
+from ecommerce.extensions.analytics.utils import parse_tracking_context
+
+ProductAttributeValue = get_model('catalogue', 'ProductAttributeValue')
+
+COMPLETED_ORDER = 'Completed Order'
+
+
+def build_completed_order_event(order):
+    """ Returns the user ID, properties and context of the event tracking a placed order. """
+    lines = order.lines.select_related(*_product_relations('product')).prefetch_related(
+        _prefetch_attribute_values('product')
+    )
+
+    return _build_event(
+        order.user,
+        order.number,
+        str(order.total_excl_tax),
+        order.currency,
+        [(line, line.product, str(line.line_price_excl_tax), line.quantity) for line in lines]
+    )
+
+
+def build_refund_event(refund):
+    """ Returns the user ID, properties and context of the event tracking a completed refund.
+
+    Refunds are tracked as transaction reversals, by emitting an event which is the inverse of the event tracking the
+    refunded order. See: https://support.google.com/analytics/answer/1037443?hl=en
+    """
+    lines = refund.lines.select_related('order_line', *_product_relations('order_line__product')).prefetch_related(
+        _prefetch_attribute_values('order_line__product')
+    )
+
+    return _build_event(
+        refund.user,
+        refund.order.number,
+        '-{}'.format(refund.total_credit_excl_tax),
+        refund.currency,
+        [
+            (line.order_line, line.order_line.product, str(line.line_credit_excl_tax), -1 * line.quantity)
+            for line in lines
+        ]
+    )
+
+
+def _product_relations(prefix):
+    return [prefix + '__product_class', prefix + '__parent__product_class']
+
+
+def _prefetch_attribute_values(prefix):
+    return Prefetch(
+        prefix + '__attribute_values', queryset=ProductAttributeValue.objects.select_related('attribute')
+    )
+
+
+def _build_event(user, order_number, total, currency, lines):
+    user_tracking_id, lms_client_id, lms_ip = parse_tracking_context(user)
+    properties = {
+        'orderId': order_number,
+        'total': total,
+        'currency': currency,
+        'products': [
+            {
+                # For backwards-compatibility with older events the `sku` field is (ab)used to
+                # store the product's `certificate_type`, while the `id` field holds the product's
+                # SKU. Marketing is aware that this approach will not scale once we start selling
+                # products other than courses, and will need to change in the future.
+                'id': order_line.partner_sku,
+                'sku': _get_mode(product),
+                'name': product.course_id,
+                'price': price,
+                'quantity': quantity,
+                'category': product.get_product_class().name,
+            } for order_line, product, price, quantity in lines
+        ],
+    }
+    context = {
+        'ip': lms_ip,
+        'Google Analytics': {
+            'clientId': lms_client_id
+        }
+    }
+
+    return user_tracking_id, properties, context
+
+
+def _get_mode(product):
+    # Read the prefetched attribute values, since product.attr queries them anew.
+    attributes = {value.attribute.code: value.value for value in product.attribute_values.all()}
+    return mode_for_certificate_type(
+        attributes.get('certificate_type', ''),
+        attributes.get('id_verification_required', False)
+    )
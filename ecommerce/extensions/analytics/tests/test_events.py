@@ -0,0 +1,76 @@
+from django.test import override_settings
+import mock
+from oscar.test.newfactories import UserFactory
+
+from ecommerce.extensions.analytics import emitters, events
+from ecommerce.extensions.checkout import tasks
+from ecommerce.extensions.refund.api import create_refunds
+from ecommerce.extensions.refund.tests.mixins import RefundTestMixin
+from ecommerce.tests.mixins import BusinessIntelligenceMixin
+from ecommerce.tests.testcases import TestCase
+
+
+class EventPayloadTests(BusinessIntelligenceMixin, RefundTestMixin, TestCase):
+    def setUp(self):
+        super(EventPayloadTests, self).setUp()
+        self.user = UserFactory()
+        self.order = self.create_order(multiple_lines=True)
+
+    def test_build_completed_order_event(self):
+        """ Verify the payload of the order event is built with a single query for the lines and products. """
+        order = self.order.__class__.objects.select_related('user').get(id=self.order.id)
+        with self.assertNumQueries(2):
+            user_id, properties, context = events.build_completed_order_event(order)
+
+        self.assertEqual(user_id, 'ecommerce-{}'.format(self.user.id))
+        self.assertEqual(context, {'ip': None, 'Google Analytics': {'clientId': None}})
+        self.assert_correct_event_payload(order, properties, order.number, order.currency, order.total_excl_tax)
+
+    def test_build_refund_event(self):
+        """ Verify the payload of the refund event is built with a single query for the lines and products. """
+        refund = create_refunds([self.order], self.course.id)[0]
+        refund = refund.__class__.objects.select_related('user', 'order').get(id=refund.id)
+
+        with self.assertNumQueries(2):
+            __, properties, __ = events.build_refund_event(refund)
+
+        self.assert_correct_event_payload(
+            refund, properties, refund.order.number, refund.currency, refund.total_credit_excl_tax
+        )
+
+
+@override_settings(ANALYTICS_EMITTER='ecommerce.extensions.analytics.emitters.InMemoryEmitter')
+class EmitterTests(RefundTestMixin, TestCase):
+    def setUp(self):
+        super(EmitterTests, self).setUp()
+        emitters.clear_emitters()
+        self.addCleanup(emitters.clear_emitters)
+        self.user = UserFactory()
+
+    def test_in_memory_emitter(self):
+        """ Verify the configured emitter receives tracking events. """
+        order = self.create_order()
+        order.refresh_from_db()
+        tasks.track_completed_order.delay(order.number)
+
+        emitter = emitters.get_emitter()
+        self.assertIsInstance(emitter, emitters.InMemoryEmitter)
+        self.assertEqual(len(emitter.events), 1)
+        self.assertEqual(emitter.events[0]['event'], events.COMPLETED_ORDER)
+        self.assertEqual(emitter.events[0]['properties']['orderId'], order.number)
+
+        emitter.clear()
+        self.assertEqual(emitter.events, [])
+
+    @override_settings(SEGMENT_KEY='dummy-key', SEGMENT_MAX_QUEUE_SIZE=2)
+    def test_segment_emitter(self):
+        """ Verify the Segment client, and its bounded queue, are created when the first event is emitted. """
+        with mock.patch.object(emitters.analytics, 'default_client', None):
+            with mock.patch.object(emitters.analytics, 'Client') as mock_client:
+                emitters.SegmentEmitter().track('user', 'Event', {'a': 1})
+                emitters.SegmentEmitter().track('user', 'Event', {'a': 2})
+
+        mock_client.assert_called_once_with(
+            'dummy-key', debug=False, max_queue_size=2, on_error=emitters.log_upload_error
+        )
+        mock_client.return_value.track.assert_called_with('user', 'Event', {'a': 2}, context={})
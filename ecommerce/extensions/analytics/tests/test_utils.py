@@ -0,0 +1,34 @@
+from decimal import Decimal
+import logging
+
+import mock
+from testfixtures import LogCapture
+
+from ecommerce.extensions.analytics.utils import audit_log
+from ecommerce.tests.testcases import TestCase
+
+LOGGER_NAME = 'ecommerce.extensions.analytics.utils'
+
+
+class AuditLogTests(TestCase):
+    def test_audit_log(self):
+        """ Verify the message is a JSON object, ordered by key, holding the name and keyword arguments. """
+        with LogCapture(LOGGER_NAME) as l:
+            audit_log('payment_received', user_id=1, amount=Decimal('50.00'), currency='USD', reference=None)
+            l.check(
+                (
+                    LOGGER_NAME,
+                    'INFO',
+                    '{"amount": "50.00", "currency": "USD", "event": "payment_received", "reference": null, '
+                    '"user_id": 1}'
+                )
+            )
+
+    def test_audit_log_disabled(self):
+        """ Verify the message is not built if INFO-level messages are disabled. """
+        with mock.patch('ecommerce.extensions.analytics.utils.json.dumps') as mock_dumps:
+            with LogCapture(LOGGER_NAME, level=logging.WARNING) as l:
+                audit_log('payment_received', user_id=1)
+                l.check()
+
+        self.assertFalse(mock_dumps.called)
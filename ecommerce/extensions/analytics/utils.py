@@ -1,4 +1,5 @@
 from functools import wraps
+import json
 import logging
 
 from django.conf import settings
@@ -63,9 +64,13 @@ def audit_log(name, **kwargs):
 
     Messages logged with this function are used to construct an audit trail. Log messages
     should be emitted immediately after the event they correspond to has occurred and, if
-    applicable, after the database has been updated. These log messages use a verbose
-    key-value pair syntax to make it easier to extract fields when parsing the application's
-    logs.
+    applicable, after the database has been updated. Each message is a JSON object holding
+    the message's name, as `event`, and the keyword arguments, so that the application's logs
+    can be parsed without splitting the message. For example:
+
+        {"amount": "50.00", "basket_id": 1, "currency": "USD", "event": "payment_received"}
+
+    The message is not built if INFO-level messages are disabled.
 
     This function is variadic, accepting a variable number of keyword arguments.
 
@@ -73,15 +78,15 @@ def audit_log(name, **kwargs):
         name (str): The name of the message to log. For example, 'payment_received'.
 
     Keyword Arguments:
-        Indefinite. Keyword arguments are strung together as comma-separated key-value
-        pairs ordered alphabetically by key in the resulting log message.
+        Indefinite. Keyword arguments, other than `event`, become the members of the JSON
+        object, ordered alphabetically by key. Values which cannot be represented in JSON (e.g. Decimals)
+        are converted to strings.
 
     Returns:
         None
     """
-    # Joins sorted keyword argument keys and values with an "=", wraps each value
-    # in quotes, and separates each pair with a comma and a space.
-    payload = u', '.join([u'{k}="{v}"'.format(k=k, v=v) for k, v in sorted(kwargs.items())])
-    message = u'{name}: {payload}'.format(name=name, payload=payload)
+    if not logger.isEnabledFor(logging.INFO):
+        return
 
-    logger.info(message)
+    kwargs['event'] = name
+    logger.info(json.dumps(kwargs, sort_keys=True, default=unicode))
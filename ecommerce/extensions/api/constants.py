@@ -11,6 +11,8 @@ class APIDictionaryKeys(object):
     CODE = u'code'
     COUPON_ID = u'coupon_id'
     END_DATE = u'end_date'
+    JOB_ID = u'job_id'
+    JOB_URL = u'job_url'
     ORDER = u'order'
     ORDER_NUMBER = u'number'
     ORDER_TOTAL = u'total'
@@ -1,4 +1,5 @@
 from rest_framework import pagination
+from rest_framework.settings import api_settings
 
 
 class PageNumberPagination(pagination.PageNumberPagination):
@@ -7,3 +8,62 @@ class PageNumberPagination(pagination.PageNumberPagination):
     # NOTE (CCB): This is a hack, necessary until the frontend
     # can properly follow our paginated lists.
     max_page_size = 10000
+
+
+class CursorPagination(pagination.CursorPagination):
+    """
+    Paginates with an opaque cursor, rather than a page number.
+
+    Pages are retrieved by filtering on the position of the last item of the previous page, rather than by OFFSET,
+    and are not counted, so that deep pages of large tables are as cheap to retrieve as the first. Results are ordered
+    by the view's `cursor_ordering`, whose first field is the position; the remaining fields break ties.
+    """
+    page_size_query_param = 'page_size'
+    max_page_size = 1000
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.page_size = self.get_page_size(request)
+        return super(CursorPagination, self).paginate_queryset(queryset, request, view=view)
+
+    def get_page_size(self, request):
+        try:
+            return pagination._positive_int(  # pylint: disable=protected-access
+                request.query_params[self.page_size_query_param],
+                strict=True,
+                cutoff=self.max_page_size
+            )
+        except (KeyError, ValueError):
+            return api_settings.PAGE_SIZE
+
+    def get_ordering(self, request, queryset, view):
+        return tuple(getattr(view, 'cursor_ordering', ('-id',)))
+
+
+class OptionalCursorPagination(pagination.BasePagination):
+    """
+    Paginates with page numbers, unless the client opts in to cursor pagination with `?pagination=cursor`.
+
+    The links to the next and previous pages of cursor-paginated results retain the parameter.
+    """
+    pagination_query_param = 'pagination'
+
+    def __init__(self):
+        self.paginator = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if request.query_params.get(self.pagination_query_param) == 'cursor':
+            self.paginator = CursorPagination()
+        else:
+            self.paginator = PageNumberPagination()
+
+        return self.paginator.paginate_queryset(queryset, request, view=view)
+
+    def get_paginated_response(self, data):
+        return self.paginator.get_paginated_response(data)
+
+    @property
+    def display_page_controls(self):
+        return getattr(self.paginator, 'display_page_controls', False)
+
+    def to_html(self):
+        return self.paginator.to_html()
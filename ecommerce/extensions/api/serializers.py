@@ -5,6 +5,7 @@ import logging
 from dateutil.parser import parse
 from django.conf import settings
 from django.db import transaction
+from django.db.models import Prefetch
 from django.utils.translation import ugettext_lazy as _
 from oscar.core.loading import get_model, get_class
 from rest_framework import serializers
@@ -21,6 +22,7 @@ Basket = get_model('basket', 'Basket')
 Benefit = get_model('offer', 'Benefit')
 BillingAddress = get_model('order', 'BillingAddress')
 Catalog = get_model('catalogue', 'Catalog')
+CouponCreationJob = get_model('voucher', 'CouponCreationJob')
 Line = get_model('order', 'Line')
 Order = get_model('order', 'Order')
 Product = get_model('catalogue', 'Product')
@@ -100,12 +102,10 @@ class PartialStockRecordSerializerForUpdate(StockRecordSerializer):
         fields = ('price_currency', 'price_excl_tax',)
 
 
-class ProductSerializer(ProductPaymentInfoMixin, serializers.HyperlinkedModelSerializer):
-    """ Serializer for Products. """
+class ProductAttributesMixin(serializers.ModelSerializer):
+    """ Mixin class used for serializing the class and attribute values of products. """
     attribute_values = serializers.SerializerMethodField()
     product_class = serializers.SerializerMethodField()
-    is_available_to_buy = serializers.SerializerMethodField()
-    stockrecords = StockRecordSerializer(many=True, read_only=True)
 
     def get_attribute_values(self, product):
         request = self.context.get('request')
@@ -121,6 +121,12 @@ class ProductSerializer(ProductPaymentInfoMixin, serializers.HyperlinkedModelSer
     def get_product_class(self, product):
         return product.get_product_class().name
 
+
+class ProductSerializer(ProductPaymentInfoMixin, ProductAttributesMixin, serializers.HyperlinkedModelSerializer):
+    """ Serializer for Products. """
+    is_available_to_buy = serializers.SerializerMethodField()
+    stockrecords = StockRecordSerializer(many=True, read_only=True)
+
     def get_is_available_to_buy(self, product):
         info = self._get_info(product)
         return info.availability.is_available_to_buy
@@ -134,6 +140,14 @@ class ProductSerializer(ProductPaymentInfoMixin, serializers.HyperlinkedModelSer
         }
 
 
+class ProductSummarySerializer(ProductAttributesMixin, serializers.ModelSerializer):
+    """ Serializer for the products of order summaries, which omits their prices, availability and stock records. """
+
+    class Meta(object):
+        model = Product
+        fields = ('id', 'structure', 'product_class', 'title', 'expires', 'attribute_values',)
+
+
 class LineSerializer(serializers.ModelSerializer):
     """Serializer for parsing line item data."""
     product = ProductSerializer()
@@ -143,17 +157,54 @@ class LineSerializer(serializers.ModelSerializer):
         fields = ('title', 'quantity', 'description', 'status', 'line_price_excl_tax', 'unit_price_excl_tax', 'product')
 
 
+class LineSummarySerializer(LineSerializer):
+    """Serializer for the line items of order summaries."""
+    product = ProductSummarySerializer()
+
+
 class OrderSerializer(serializers.ModelSerializer):
     """Serializer for parsing order data."""
     date_placed = serializers.DateTimeField(format=ISO_8601_FORMAT)
     lines = LineSerializer(many=True)
     billing_address = BillingAddressSerializer(allow_null=True)
 
+    # Relations of each line's product, which are serialized for every line.
+    product_prefetches = ('product__stockrecords',)
+
+    @classmethod
+    def prefetch_queryset(cls, queryset):
+        """
+        Returns the given queryset of orders, with the relations serialized for each order loaded in bulk.
+
+        Serializing an order from the returned queryset requires no queries, other than those of the voucher
+        attributes of coupon products.
+        """
+        lines = Line.objects.select_related(
+            'product__product_class', 'product__parent__product_class'
+        ).prefetch_related(
+            Prefetch(
+                'product__attribute_values', queryset=ProductAttributeValue.objects.select_related('attribute')
+            ),
+            *cls.product_prefetches
+        )
+
+        return queryset.select_related('billing_address__country').prefetch_related(Prefetch('lines', queryset=lines))
+
     class Meta(object):
         model = Order
         fields = ('number', 'date_placed', 'status', 'currency', 'total_excl_tax', 'lines', 'billing_address')
 
 
+class OrderSummarySerializer(OrderSerializer):
+    """
+    Serializer for order summaries (e.g. for receipts), whose lines' products are serialized without purchase
+    information, which would otherwise be determined by the pricing strategy for each line.
+    """
+    lines = LineSummarySerializer(many=True)
+
+    product_prefetches = ()
+
+
 class PaymentProcessorSerializer(serializers.Serializer):  # pylint: disable=abstract-method
     """ Serializer to use with instances of processors.BasePaymentProcessor """
 
@@ -420,3 +471,13 @@ class CouponSerializer(ProductPaymentInfoMixin, serializers.ModelSerializer):
     class Meta(object):
         model = Product
         fields = ('id', 'title', 'coupon_type', 'last_edited', 'seats', 'client', 'price', 'vouchers',)
+
+
+class CouponCreationJobSerializer(serializers.ModelSerializer):
+    """ Serializer for CouponCreationJob objects. """
+    progress = serializers.ReadOnlyField()
+    result = serializers.ReadOnlyField()
+
+    class Meta(object):
+        model = CouponCreationJob
+        fields = ('id', 'status', 'quantity', 'progress', 'result', 'error', 'created', 'modified',)
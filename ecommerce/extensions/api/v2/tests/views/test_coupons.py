@@ -5,7 +5,8 @@ import json
 
 from django.core.urlresolvers import reverse
 from django.db.utils import IntegrityError
-from django.test import RequestFactory
+from django.test import RequestFactory, override_settings
+import mock
 from oscar.core.loading import get_model
 
 from ecommerce.core.models import Client
@@ -19,6 +20,7 @@ Basket = get_model('basket', 'Basket')
 Benefit = get_model('offer', 'Benefit')
 Catalog = get_model('catalogue', 'Catalog')
 Course = get_model('courses', 'Course')
+CouponCreationJob = get_model('voucher', 'CouponCreationJob')
 Order = get_model('order', 'Order')
 Product = get_model('catalogue', 'Product')
 ProductClass = get_model('catalogue', 'ProductClass')
@@ -287,3 +289,84 @@ class CouponViewSetFunctionalTest(TestCase):
         response_data = json.loads(response.content)
         self.assertEqual(response_data['results'][0]['coupon_type'], 'Discount code')
         self.assertEqual(response_data['results'][0]['vouchers'][0]['benefit'][1], 20.0)
+
+
+@override_settings(COUPON_CREATION_ASYNC_THRESHOLD=1)
+class CouponCreationJobTests(TestCase):
+    """Test the creation of coupons in the background."""
+
+    def setUp(self):
+        super(CouponCreationJobTests, self).setUp()
+        self.user = self.create_user(is_staff=True)
+        self.client.login(username=self.user.username, password=self.password)
+
+        course = Course.objects.create(id='edx/Demo_Course/DemoX')
+        course.create_or_update_seat('verified', True, 50, self.partner)
+
+        self.data = {
+            'title': 'Test coupon',
+            'client_username': 'TestX',
+            'stock_record_ids': [1],
+            'start_date': '2015-01-01',
+            'end_date': '2020-01-01',
+            'code': '',
+            'benefit_type': Benefit.PERCENTAGE,
+            'benefit_value': 100,
+            'voucher_type': Voucher.SINGLE_USE,
+            'quantity': 2,
+            'price': 100
+        }
+
+    def test_create_in_background(self):
+        """Verify large coupons are created by a job whose status can be monitored."""
+        response = self.client.post(COUPONS_LINK, data=self.data, format='json')
+        self.assertEqual(response.status_code, 202)
+
+        job = CouponCreationJob.objects.get()
+        self.assertEqual(job.status, CouponCreationJob.SUCCEEDED)
+        self.assertEqual(job.requested_by, self.user)
+        self.assertEqual(job.progress, 2)
+        coupon = Product.objects.get(id=job.result[AC.KEYS.COUPON_ID])
+        self.assertEqual(coupon.attr.coupon_vouchers.vouchers.count(), 2)
+
+        response_data = json.loads(response.content)
+        self.assertEqual(response_data[AC.KEYS.JOB_ID], job.id)
+
+        response = self.client.get(response_data[AC.KEYS.JOB_URL])
+        self.assertEqual(response.status_code, 200)
+        job_data = json.loads(response.content)
+        self.assertEqual(job_data['status'], CouponCreationJob.SUCCEEDED)
+        self.assertEqual(job_data['progress'], 2)
+        self.assertEqual(job_data['result'][AC.KEYS.COUPON_ID], coupon.id)
+
+    def test_create_in_background_failure(self):
+        """Verify nothing is left behind by a failed job."""
+        with mock.patch('ecommerce.extensions.api.v2.views.coupons.create_vouchers', side_effect=ValueError('Boom')):
+            response = self.client.post(COUPONS_LINK, data=self.data, format='json')
+        self.assertEqual(response.status_code, 202)
+
+        job = CouponCreationJob.objects.get()
+        self.assertEqual(job.status, CouponCreationJob.FAILED)
+        self.assertEqual(job.error, 'Boom')
+        self.assertEqual(job.progress, 0)
+        self.assertFalse(Product.objects.filter(title='Test coupon').exists())
+        self.assertFalse(Basket.objects.exists())
+        self.assertFalse(Order.objects.exists())
+
+    def test_progress(self):
+        """Verify the progress of running jobs is read from the cache."""
+        job = CouponCreationJob.objects.create(parameters=self.data, quantity=2)
+        job.set_progress(1)
+        self.assertEqual(job.progress, 0)
+
+        job.status = CouponCreationJob.RUNNING
+        self.assertEqual(job.progress, 1)
+
+    def test_job_authorization_required(self):
+        """Verify only staff can monitor jobs."""
+        job = CouponCreationJob.objects.create(parameters=self.data, quantity=2)
+        path = reverse('api:v2:coupon-jobs-detail', kwargs={'pk': job.id})
+
+        user = self.create_user(is_staff=False)
+        self.client.login(username=user.username, password=self.password)
+        self.assertEqual(self.client.get(path).status_code, 403)
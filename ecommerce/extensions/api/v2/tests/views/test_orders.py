@@ -1,3 +1,4 @@
+import datetime
 import json
 
 import ddt
@@ -5,7 +6,9 @@ import httpretty
 import mock
 from django.contrib.auth.models import Permission
 from django.core.urlresolvers import reverse
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from oscar.core.loading import get_model
 from oscar.test import factories
 
@@ -105,6 +108,66 @@ class OrderListViewTests(AccessTokenMixin, ThrottlingMixin, TestCase):
         self.assertEqual(content['count'], 1)
         self.assertEqual(content['results'][0]['number'], unicode(order.number))
 
+    def test_cursor_pagination(self):
+        """ The view should paginate orders with a cursor, reverse chronologically, if the client opts in. """
+        orders = [factories.create_order(user=self.user) for __ in range(3)]
+        Order.objects.filter(id=orders[2].id).update(date_placed=orders[1].date_placed)
+
+        numbers = []
+        path = '{}?pagination=cursor&page_size=2'.format(self.path)
+        while path:
+            response = self.client.get(path, HTTP_AUTHORIZATION=self.token)
+            self.assertEqual(response.status_code, 200)
+            content = json.loads(response.content)
+            self.assertNotIn('count', content)
+            numbers += [result['number'] for result in content['results']]
+            path = content['next']
+
+        # Orders placed at the same time should be ordered by ID.
+        self.assertEqual(numbers, [unicode(order.number) for order in (orders[2], orders[1], orders[0])])
+
+    @ddt.data('', '?summary=1')
+    def test_num_queries(self, query_string):
+        """ The number of queries run by the view should not depend on the number of orders, or their lines. """
+        path = self.path + query_string
+        factories.create_order(user=self.user)
+
+        # The first request may populate caches, so the queries of the second are counted.
+        self.client.get(path, HTTP_AUTHORIZATION=self.token)
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(path, HTTP_AUTHORIZATION=self.token)
+
+        for __ in range(3):
+            basket = factories.create_basket(empty=True)
+            basket.add_product(factories.create_product(), 1)
+            basket.add_product(factories.create_product(), 1)
+            factories.create_order(basket=basket, user=self.user)
+
+        with self.assertNumQueries(len(queries)):
+            response = self.client.get(path, HTTP_AUTHORIZATION=self.token)
+        self.assertEqual(json.loads(response.content)['count'], 4)
+
+    @ddt.data('?summary=0', '?summary=false', '?summary=')
+    def test_summary_disabled(self, query):
+        """ The view should only return order summaries if the summary parameter is true. """
+        factories.create_order(user=self.user)
+        response = self.client.get(self.path + query, HTTP_AUTHORIZATION=self.token)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('stockrecords', json.loads(response.content)['results'][0]['lines'][0]['product'])
+
+    def test_summary(self):
+        """ The view should omit the purchase information of products from order summaries. """
+        order = factories.create_order(user=self.user)
+        response = self.client.get(self.path + '?summary=1', HTTP_AUTHORIZATION=self.token)
+        self.assertEqual(response.status_code, 200)
+
+        content = json.loads(response.content)
+        self.assertEqual(content['results'][0]['number'], unicode(order.number))
+        product = content['results'][0]['lines'][0]['product']
+        self.assertEqual(product['id'], order.lines.first().product.id)
+        for field in ('price', 'is_available_to_buy', 'stockrecords'):
+            self.assertNotIn(field, product)
+
 
 @ddt.ddt
 @override_settings(ECOMMERCE_SERVICE_WORKER_USERNAME='test-service-user')
@@ -218,3 +281,51 @@ class OrderDetailViewTests(OrderDetailViewTestMixin, TestCase):
     @property
     def url(self):
         return reverse('api:v2:order-detail', kwargs={'number': self.order.number})
+
+
+@ddt.ddt
+class OrderExportViewTests(TestCase):
+    def setUp(self):
+        super(OrderExportViewTests, self).setUp()
+        self.order = factories.create_order()
+        self.user = self.create_user(is_staff=True)
+        self.client.login(username=self.user.username, password=self.password)
+
+    def get_export(self, **params):
+        query = {
+            'start': (self.order.date_placed - datetime.timedelta(days=1)).isoformat(),
+            'end': (self.order.date_placed + datetime.timedelta(days=1)).isoformat(),
+        }
+        query.update(params)
+        query = {name: value for name, value in query.items() if value is not None}
+        return self.client.get(reverse('api:v2:order-export'), query)
+
+    def test_staff_required(self):
+        """ The view should return HTTP 403 if the user is not staff. """
+        user = self.create_user()
+        self.client.login(username=user.username, password=self.password)
+        self.assertEqual(self.get_export().status_code, 403)
+
+    @ddt.data(('csv', 'text/csv', 2), ('jsonl', 'application/x-ndjson', 1))
+    @ddt.unpack
+    def test_export(self, export_format, content_type, num_lines):
+        """ The view should stream the orders placed within the range in the requested format. """
+        response = self.get_export(export_format=export_format)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], content_type)
+        self.assertTrue(response['Content-Disposition'].endswith('.' + export_format))
+
+        lines = ''.join(response.streaming_content).splitlines()
+        self.assertEqual(len(lines), num_lines)
+        self.assertIn(self.order.number, lines[-1])
+
+    def test_export_outside_range(self):
+        """ The view should not export orders placed outside the range. """
+        response = self.get_export(export_format='jsonl', end=self.order.date_placed.isoformat())
+        self.assertEqual(''.join(response.streaming_content), '')
+
+    @ddt.data({'start': None}, {'end': 'not-a-date'}, {'export_format': 'xml'})
+    def test_invalid_parameters(self, params):
+        """ The view should return HTTP 400 if the range or format are invalid. """
+        self.assertEqual(self.get_export(**params).status_code, 400)
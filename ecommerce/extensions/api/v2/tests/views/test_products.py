@@ -168,3 +168,21 @@ class ProductViewSetTests(ProductSerializerMixin, CourseCatalogTestMixin, TestCa
         response_data = json.loads(response.content)
         self.assertEqual(response_data['count'], 1)
         self.assertEqual(response_data['results'][0]['product_class'], 'Coupon')
+
+    def test_list_cursor_pagination(self):
+        """ Verify products are paginated with a cursor, in order of ID, if the client opts in. """
+        path = '{}?pagination=cursor&page_size=1'.format(reverse('api:v2:product-list'))
+        products = list(Product.objects.order_by('id'))
+
+        response = self.client.get(path)
+        self.assertEqual(response.status_code, 200)
+        content = json.loads(response.content)
+        self.assertNotIn('count', content)
+        self.assertIsNone(content['previous'])
+        self.assertEqual(content['results'], [self.serialize_product(products[0])])
+        self.assertIn('pagination=cursor', content['next'])
+
+        response = self.client.get(content['next'])
+        content = json.loads(response.content)
+        self.assertEqual(content['results'], [self.serialize_product(products[1])])
+        self.assertIsNone(content['next'])
@@ -72,6 +72,7 @@ router.register(r'catalogs', catalog_views.CatalogViewSet) \
               parents_query_lookups=['stockrecords__catalogs'])
 
 router.register(r'coupons', coupon_views.CouponViewSet, base_name='coupons')
+router.register(r'coupon_jobs', coupon_views.CouponCreationJobViewSet, base_name='coupon-jobs')
 router.register(r'orders', order_views.OrderViewSet)
 
 urlpatterns += router.urls
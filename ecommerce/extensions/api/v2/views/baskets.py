@@ -300,7 +300,7 @@ class OrderByBasketRetrieveView(generics.RetrieveAPIView):
     permission_classes = (IsAuthenticated,)
     serializer_class = OrderSerializer
     lookup_field = AC.KEYS.ORDER_NUMBER
-    queryset = Order.objects.all()
+    queryset = OrderSerializer.prefetch_queryset(Order.objects.all())
 
     def dispatch(self, request, *args, **kwargs):
         warnings.warn('The basket-order API view is deprecated. Use the order API (e.g. /api/v2/orders/<order-number>/',
@@ -4,22 +4,26 @@ import logging
 from decimal import Decimal
 import dateutil.parser
 
+from django.conf import settings
+from django.core.urlresolvers import reverse
 from django.db import transaction
 from django.db.utils import IntegrityError
 from oscar.core.loading import get_model
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from rest_framework.response import Response
+from rest_framework.viewsets import ReadOnlyModelViewSet
 
 from ecommerce.core.models import Client
 from ecommerce.extensions.api import data as data_api
 from ecommerce.extensions.api.constants import APIConstants as AC
-from ecommerce.extensions.api.serializers import CouponSerializer
+from ecommerce.extensions.api.serializers import CouponCreationJobSerializer, CouponSerializer
 from ecommerce.extensions.api.v2.views import NonDestroyableModelViewSet
 from ecommerce.extensions.catalogue.utils import generate_sku, get_or_create_catalog, generate_coupon_slug
 from ecommerce.extensions.checkout.mixins import EdxOrderPlacementMixin
 from ecommerce.extensions.payment.processors.invoice import InvoicePayment
-from ecommerce.extensions.voucher.models import CouponVouchers
+from ecommerce.extensions.voucher.models import CouponCreationJob, CouponVouchers
+from ecommerce.extensions.voucher.tasks import create_coupon
 from ecommerce.extensions.voucher.utils import create_vouchers
 
 Basket = get_model('basket', 'Basket')
@@ -30,6 +34,12 @@ Product = get_model('catalogue', 'Product')
 ProductClass = get_model('catalogue', 'ProductClass')
 StockRecord = get_model('partner', 'StockRecord')
 
+# Parameters of the coupon creation endpoint, recorded by CouponCreationJob.
+COUPON_PARAMETER_KEYS = (
+    AC.KEYS.TITLE, AC.KEYS.CLIENT_USERNAME, AC.KEYS.STOCK_RECORD_IDS, AC.KEYS.START_DATE, AC.KEYS.END_DATE,
+    AC.KEYS.CODE, AC.KEYS.BENEFIT_TYPE, AC.KEYS.BENEFIT_VALUE, AC.KEYS.VOUCHER_TYPE, AC.KEYS.QUANTITY, AC.KEYS.PRICE,
+)
+
 
 class CouponViewSet(EdxOrderPlacementMixin, NonDestroyableModelViewSet):
     """Endpoint for creating coupons.
@@ -56,62 +66,105 @@ class CouponViewSet(EdxOrderPlacementMixin, NonDestroyableModelViewSet):
         Returns:
             200 if the order was created successfully; the basket ID is included in the response
                 body along with the order ID and payment information.
+            202 if more than COUPON_CREATION_ASYNC_THRESHOLD vouchers are requested; the coupon is created in the
+                background, and the ID and URL of the job tracking its creation are included in the response body.
             401 if an unauthenticated request is denied permission to access the endpoint.
             429 if the client has made requests at a rate exceeding that allowed by the configured rate limit.
             500 if an error occurs when attempting to create a coupon.
         """
+        quantity = int(request.data[AC.KEYS.QUANTITY])
+        if quantity > settings.COUPON_CREATION_ASYNC_THRESHOLD:
+            return self.create_coupon_in_background(request, quantity)
+
         with transaction.atomic():
-            title = request.data[AC.KEYS.TITLE]
-            client_username = request.data[AC.KEYS.CLIENT_USERNAME]
-            stock_record_ids = request.data[AC.KEYS.STOCK_RECORD_IDS]
-            start_date = dateutil.parser.parse(request.data[AC.KEYS.START_DATE])
-            end_date = dateutil.parser.parse(request.data[AC.KEYS.END_DATE])
-            code = request.data[AC.KEYS.CODE]
-            benefit_type = request.data[AC.KEYS.BENEFIT_TYPE]
-            benefit_value = request.data[AC.KEYS.BENEFIT_VALUE]
-            voucher_type = request.data[AC.KEYS.VOUCHER_TYPE]
-            quantity = request.data[AC.KEYS.QUANTITY]
-            price = request.data[AC.KEYS.PRICE]
-            partner = request.site.siteconfiguration.partner
-
-            client, __ = Client.objects.get_or_create(username=client_username)
-
-            stock_records_string = ' '.join(str(id) for id in stock_record_ids)
-
-            coupon_catalog, __ = get_or_create_catalog(
-                name='Catalog for stock records: {}'.format(stock_records_string),
-                partner=partner,
-                stock_record_ids=stock_record_ids
-            )
+            response_data = self.create_coupon(request.site, request.data)
+            return Response(response_data, status=status.HTTP_200_OK)
 
-            data = {
-                'partner': partner,
-                'title': title,
-                'benefit_type': benefit_type,
-                'benefit_value': benefit_value,
-                'catalog': coupon_catalog,
-                'end_date': end_date,
-                'code': code,
-                'quantity': quantity,
-                'start_date': start_date,
-                'voucher_type': voucher_type
-            }
-
-            coupon_product = self.create_coupon_product(title, price, data)
-
-            basket = self.add_product_to_basket(
-                product=coupon_product,
-                client=client,
-                site=request.site,
-                partner=partner
-            )
+    def create_coupon_in_background(self, request, quantity):
+        """Schedules the creation of a coupon with a large number of vouchers.
+
+        Returns:
+            202, with the ID and URL of the CouponCreationJob tracking the creation, in the response body.
+        """
+        job = CouponCreationJob.objects.create(
+            site=request.site,
+            requested_by=request.user,
+            parameters={key: request.data[key] for key in COUPON_PARAMETER_KEYS},
+            quantity=quantity
+        )
+        create_coupon.delay(job.id)
+        logger.info('Scheduled creation of [%d] vouchers by coupon creation job [%d].', quantity, job.id)
+
+        return Response(
+            {
+                AC.KEYS.JOB_ID: job.id,
+                AC.KEYS.JOB_URL: reverse('api:v2:coupon-jobs-detail', kwargs={'pk': job.id}),
+            },
+            status=status.HTTP_202_ACCEPTED
+        )
 
-            # Create an order now since payment is handled out of band via an invoice.
-            response_data = self.create_order_for_invoice(basket, coupon_id=coupon_product.id)
+    def create_coupon(self, site, data, progress_callback=None):
+        """Creates a coupon product, adds it to a basket and creates an order from it.
 
-            return Response(response_data, status=status.HTTP_200_OK)
+        Must be called within a transaction.
 
-    def create_coupon_product(self, title, price, data):
+        Arguments:
+            site (Site): Site for which the coupon is created.
+            data (dict): Parameters of the coupon creation endpoint.
+            progress_callback (callable): Called with the number of vouchers created, after each is created.
+
+        Returns:
+            dict: The coupon, basket and order IDs, and payment information.
+        """
+        title = data[AC.KEYS.TITLE]
+        client_username = data[AC.KEYS.CLIENT_USERNAME]
+        stock_record_ids = data[AC.KEYS.STOCK_RECORD_IDS]
+        start_date = dateutil.parser.parse(data[AC.KEYS.START_DATE])
+        end_date = dateutil.parser.parse(data[AC.KEYS.END_DATE])
+        code = data[AC.KEYS.CODE]
+        benefit_type = data[AC.KEYS.BENEFIT_TYPE]
+        benefit_value = data[AC.KEYS.BENEFIT_VALUE]
+        voucher_type = data[AC.KEYS.VOUCHER_TYPE]
+        quantity = data[AC.KEYS.QUANTITY]
+        price = data[AC.KEYS.PRICE]
+        partner = site.siteconfiguration.partner
+
+        client, __ = Client.objects.get_or_create(username=client_username)
+
+        stock_records_string = ' '.join(str(id) for id in stock_record_ids)
+
+        coupon_catalog, __ = get_or_create_catalog(
+            name='Catalog for stock records: {}'.format(stock_records_string),
+            partner=partner,
+            stock_record_ids=stock_record_ids
+        )
+
+        data = {
+            'partner': partner,
+            'title': title,
+            'benefit_type': benefit_type,
+            'benefit_value': benefit_value,
+            'catalog': coupon_catalog,
+            'end_date': end_date,
+            'code': code,
+            'quantity': quantity,
+            'start_date': start_date,
+            'voucher_type': voucher_type
+        }
+
+        coupon_product = self.create_coupon_product(title, price, data, progress_callback=progress_callback)
+
+        basket = self.add_product_to_basket(
+            product=coupon_product,
+            client=client,
+            site=site,
+            partner=partner
+        )
+
+        # Create an order now since payment is handled out of band via an invoice.
+        return self.create_order_for_invoice(basket, coupon_id=coupon_product.id)
+
+    def create_coupon_product(self, title, price, data, progress_callback=None):
         """Creates a coupon product and a stock record for it.
 
         Arguments:
@@ -127,6 +180,7 @@ class CouponViewSet(EdxOrderPlacementMixin, NonDestroyableModelViewSet):
                 - quantity (int)
                 - start_date (Datetime)
                 - voucher_type (str)
+            progress_callback (callable): Called with the number of vouchers created, after each is created.
 
         Returns:
             A coupon product object.
@@ -159,7 +213,8 @@ class CouponViewSet(EdxOrderPlacementMixin, NonDestroyableModelViewSet):
                 code=data['code'] or None,
                 quantity=int(data['quantity']),
                 start_datetime=data['start_date'],
-                voucher_type=data['voucher_type']
+                voucher_type=data['voucher_type'],
+                progress_callback=progress_callback
             )
         except IntegrityError as ex:
             logger.exception('Failed to create vouchers for [%s] coupon.', coupon_product.title)
@@ -236,3 +291,10 @@ class CouponViewSet(EdxOrderPlacementMixin, NonDestroyableModelViewSet):
         )
 
         return response_data
+
+
+class CouponCreationJobViewSet(ReadOnlyModelViewSet):
+    """Endpoint for monitoring the creation of coupons in the background."""
+    queryset = CouponCreationJob.objects.all().order_by('-id')
+    serializer_class = CouponCreationJobSerializer
+    permission_classes = (IsAuthenticated, IsAdminUser)
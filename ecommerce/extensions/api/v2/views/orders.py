@@ -1,29 +1,55 @@
 """HTTP endpoints for interacting with orders."""
 import logging
 
+from django.http import StreamingHttpResponse
 from oscar.core.loading import get_model, get_class
 from rest_framework import status, viewsets
-from rest_framework.decorators import detail_route
-from rest_framework.permissions import IsAuthenticated, DjangoModelPermissions
+from rest_framework.decorators import detail_route, list_route
+from rest_framework.exceptions import ParseError
+from rest_framework.permissions import IsAuthenticated, IsAdminUser, DjangoModelPermissions
 from rest_framework.response import Response
 
 from ecommerce.extensions.api import serializers
 from ecommerce.extensions.api.constants import APIConstants as AC
+from ecommerce.extensions.api.pagination import OptionalCursorPagination
 from ecommerce.extensions.api.permissions import IsStaffOrOwner
 from ecommerce.extensions.api.throttles import ServiceUserThrottle
+from ecommerce.extensions.order import exports
 
 logger = logging.getLogger(__name__)
 
 Order = get_model('order', 'Order')
 
+EXPORT_CONTENT_TYPES = {
+    exports.CSV: 'text/csv',
+    exports.JSON_LINES: 'application/x-ndjson',
+}
+
 
 class OrderViewSet(viewsets.ReadOnlyModelViewSet):
+    cursor_ordering = ('-date_placed', '-id')
     lookup_field = AC.KEYS.ORDER_NUMBER
+    pagination_class = OptionalCursorPagination
     permission_classes = (IsAuthenticated, IsStaffOrOwner, DjangoModelPermissions,)
     queryset = Order.objects.all()
     serializer_class = serializers.OrderSerializer
     throttle_classes = (ServiceUserThrottle,)
 
+    def get_serializer_class(self):
+        if self.request.GET.get('summary', '').lower() in ('1', 'true'):
+            return serializers.OrderSummarySerializer
+
+        return super(OrderViewSet, self).get_serializer_class()
+
+    def get_queryset(self):
+        queryset = super(OrderViewSet, self).get_queryset()
+
+        # Orders are fulfilled using their lines, which should not be cached before fulfillment.
+        if self.action in ('list', 'retrieve'):
+            queryset = self.get_serializer_class().prefetch_queryset(queryset)
+
+        return queryset
+
     def filter_queryset(self, queryset):
         queryset = super(OrderViewSet, self).filter_queryset(queryset)
         user = self.request.user
@@ -52,3 +78,33 @@ class OrderViewSet(viewsets.ReadOnlyModelViewSet):
 
         serializer = self.get_serializer(order)
         return Response(serializer.data)
+
+    @list_route(methods=['get'], permission_classes=(IsAuthenticated, IsAdminUser,))
+    def export(self, request):
+        """
+        Stream the orders placed within a date range, with their lines, payment sources and refunds.
+
+        The range is given by the `start` (inclusive) and `end` (exclusive) query parameters, as ISO 8601 dates or
+        times, which are UTC unless they specify an offset. The `export_format` parameter may be `csv` (the default),
+        or `jsonl` for JSON lines.
+        """
+        start = self._parse_export_date(request, 'start')
+        end = self._parse_export_date(request, 'end')
+        export_format = request.query_params.get('export_format', exports.CSV)
+        if export_format not in exports.EXPORT_FORMATS:
+            raise ParseError('Export format must be one of [{}].'.format(', '.join(exports.EXPORT_FORMATS)))
+
+        response = StreamingHttpResponse(
+            exports.export_orders(exports.iter_orders(start, end), export_format),
+            content_type=EXPORT_CONTENT_TYPES[export_format]
+        )
+        response['Content-Disposition'] = 'attachment; filename=orders-{start}-{end}.{extension}'.format(
+            start=start.strftime('%Y%m%dT%H%M%S'), end=end.strftime('%Y%m%dT%H%M%S'), extension=export_format
+        )
+        return response
+
+    def _parse_export_date(self, request, name):
+        try:
+            return exports.parse_date(request.query_params[name])
+        except (KeyError, ValueError):
+            raise ParseError('The [{}] parameter must be an ISO 8601 date or time.'.format(name))
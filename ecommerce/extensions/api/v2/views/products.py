@@ -6,6 +6,7 @@ from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from rest_framework_extensions.mixins import NestedViewSetMixin
 
 from ecommerce.extensions.api import serializers
+from ecommerce.extensions.api.pagination import OptionalCursorPagination
 from ecommerce.extensions.api.v2.views import NonDestroyableModelViewSet
 
 
@@ -30,4 +31,6 @@ class ProductViewSet(NestedViewSetMixin, NonDestroyableModelViewSet):
     serializer_class = serializers.ProductSerializer
     filter_backends = (filters.DjangoFilterBackend,)
     filter_class = ProductFilter
+    pagination_class = OptionalCursorPagination
+    cursor_ordering = ('id',)
     permission_classes = (IsAuthenticated, IsAdminUser,)
@@ -0,0 +1,126 @@
+"""
+Management command that archives, and then deletes, abandoned baskets.
+
+A basket is created for every visitor to the basket API, but most are never used to place an order. Left alone, these
+baskets slow down basket lookups. This command exports them to compressed JSON-lines files before deleting them.
+"""
+from __future__ import unicode_literals
+import datetime
+import gzip
+import json
+import os
+import time
+
+from django.core.management import BaseCommand
+from django.db.models import Count, Min
+from django.utils import timezone
+from oscar.core.loading import get_model
+
+from ecommerce.extensions.basket.utils import delete_baskets, serialize_basket
+
+Basket = get_model('basket', 'Basket')
+Line = get_model('basket', 'Line')
+
+
+class Command(BaseCommand):
+    help = 'Archive and delete open and frozen baskets which have not been used recently.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('-d', '--days',
+                            action='store',
+                            dest='days',
+                            default=30,
+                            type=int,
+                            help='Number of days after which an unused basket is considered abandoned.')
+        parser.add_argument('-o', '--output-dir',
+                            action='store',
+                            dest='output_dir',
+                            default='.',
+                            help='Directory to which the archive file should be written.')
+        parser.add_argument('-b', '--batch-size',
+                            action='store',
+                            dest='batch_size',
+                            default=1000,
+                            type=int,
+                            help='Size of each batch of baskets to be archived and deleted.')
+        parser.add_argument('-s', '--sleep-time',
+                            action='store',
+                            dest='sleep_time',
+                            default=0,
+                            type=float,
+                            help='Number of seconds to sleep between batches, to give replicas time to catch up.')
+        parser.add_argument('--commit',
+                            action='store_true',
+                            dest='commit',
+                            default=False,
+                            help='Actually archive and delete the baskets.')
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - datetime.timedelta(days=options['days'])
+        # Baskets with recently-added lines are still in use, regardless of when they were created. Baskets with
+        # orders are left for the delete_ordered_baskets command.
+        queryset = Basket.objects.filter(
+            status__in=(Basket.OPEN, Basket.FROZEN),
+            date_created__lt=cutoff,
+            order__isnull=True
+        ).exclude(lines__date_created__gte=cutoff)
+        count = queryset.count()
+
+        if options['commit']:
+            if count:
+                path = os.path.join(
+                    options['output_dir'],
+                    'abandoned-baskets-{}.jsonl.gz'.format(timezone.now().strftime('%Y%m%dT%H%M%S'))
+                )
+                self.stderr.write('Archiving [{count}] baskets to [{path}]...'.format(count=count, path=path))
+                self.archive(queryset, path, options['batch_size'], options['sleep_time'])
+                self.stderr.write('Done.')
+            else:
+                self.stderr.write('No baskets to archive.')
+        else:
+            self.write_statistics(queryset, count)
+            msg = 'This has been an example operation. If the --commit flag had been included, the command ' \
+                  'would have archived and deleted [{}] baskets.'.format(count)
+            self.stderr.write(msg)
+
+    def archive(self, queryset, path, batch_size, sleep_time):
+        """ Write the baskets to a gzipped JSON-lines file, in batches, deleting each batch once it is written. """
+        ids = queryset.order_by('id').values_list('id', flat=True).distinct()
+        last_id = 0
+
+        with gzip.open(path, 'wb') as archive:
+            while True:
+                batch = list(ids.filter(id__gt=last_id)[:batch_size])
+                if not batch:
+                    break
+
+                self.stderr.write(
+                    '...archiving baskets [{start}] through [{end}]...'.format(start=batch[0], end=batch[-1]))
+                baskets = Basket.objects.filter(id__in=batch).order_by('id').prefetch_related(
+                    'lines__attributes__option', 'vouchers'
+                )
+                for basket in baskets:
+                    archive.write(json.dumps(serialize_basket(basket)) + '\n')
+
+                # Ensure the batch is on disk before its baskets are removed from the database.
+                archive.flush()
+                delete_baskets(batch)
+                last_id = batch[-1]
+
+                if sleep_time:
+                    time.sleep(sleep_time)
+
+    def write_statistics(self, queryset, count):
+        """ Describe the baskets that would be archived. """
+        self.stderr.write('Abandoned baskets: [{}]'.format(count))
+        if not count:
+            return
+
+        statuses = queryset.order_by().values('status').annotate(count=Count('id', distinct=True))
+        for status in sorted(statuses, key=lambda s: s['status']):
+            self.stderr.write('...with status [{status}]: [{count}]'.format(**status))
+
+        lines = Line.objects.filter(basket__in=queryset.values('id')).count()
+        oldest = queryset.aggregate(oldest=Min('date_created'))['oldest']
+        self.stderr.write('Lines: [{}]'.format(lines))
+        self.stderr.write('Oldest basket created: [{}]'.format(oldest.isoformat()))
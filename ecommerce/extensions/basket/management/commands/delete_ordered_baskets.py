@@ -4,10 +4,13 @@ Management command that deletes baskets associated with orders.
 These baskets don't have much value once the order is placed, and unnecessarily take up space.
 """
 from __future__ import unicode_literals
+import time
+
 from django.core.management import BaseCommand
-from django.db import transaction
 from oscar.core.loading import get_model
 
+from ecommerce.extensions.basket.utils import delete_baskets
+
 Basket = get_model('basket', 'Basket')
 
 
@@ -21,6 +24,12 @@ class Command(BaseCommand):
                             default=1000,
                             type=int,
                             help='Size of each batch of baskets to be deleted.')
+        parser.add_argument('-s', '--sleep-time',
+                            action='store',
+                            dest='sleep_time',
+                            default=0,
+                            type=float,
+                            help='Number of seconds to sleep between batches, to give replicas time to catch up.')
         parser.add_argument('--commit',
                             action='store_true',
                             dest='commit',
@@ -35,12 +44,23 @@ class Command(BaseCommand):
             if count:
                 self.stderr.write('Deleting [{}] baskets...'.format(count))
                 batch_size = options['batch_size']
-                max_id = queryset.order_by('-id')[0].id
-                for start in range(0, max_id, batch_size):
-                    end = min(start + batch_size, max_id)
-                    self.stderr.write('...deleting baskets [{start}] through [{end}]...'.format(start=start, end=end))
-                    with transaction.atomic():
-                        queryset.filter(pk__gte=start, pk__lte=end).delete()
+                sleep_time = options['sleep_time']
+                ids = queryset.order_by('id').values_list('id', flat=True)
+                last_id = 0
+
+                while True:
+                    # Paginate over the IDs of baskets that actually have orders, rather than the entire ID space.
+                    batch = list(ids.filter(id__gt=last_id)[:batch_size])
+                    if not batch:
+                        break
+
+                    self.stderr.write(
+                        '...deleting baskets [{start}] through [{end}]...'.format(start=batch[0], end=batch[-1]))
+                    delete_baskets(batch)
+                    last_id = batch[-1]
+
+                    if sleep_time:
+                        time.sleep(sleep_time)
 
                 self.stderr.write('Done.')
             else:
@@ -0,0 +1,54 @@
+"""
+Management command that merges a user's editable baskets into a single basket.
+
+Basket.get_basket returns the oldest editable basket belonging to a user and site, and leaves any others untouched
+so that merging does not slow down requests. This command merges those stale baskets into the basket in use.
+"""
+from __future__ import unicode_literals
+from django.core.management import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+from oscar.core.loading import get_model
+
+Basket = get_model('basket', 'Basket')
+
+
+class Command(BaseCommand):
+    help = 'Merge stale editable baskets into the basket used for each user and site.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--commit',
+                            action='store_true',
+                            dest='commit',
+                            default=False,
+                            help='Actually merge the baskets.')
+
+    def handle(self, *args, **options):
+        queryset = Basket.objects.filter(owner__isnull=False, status__in=Basket.editable_statuses)
+        groups = queryset.values('owner_id', 'site_id').annotate(basket_count=Count('id')).filter(basket_count__gt=1)
+        groups = list(groups)
+        count = sum(group['basket_count'] - 1 for group in groups)
+
+        if options['commit']:
+            if count:
+                self.stderr.write('Merging [{}] stale baskets...'.format(count))
+
+                for group in groups:
+                    with transaction.atomic():
+                        baskets = list(
+                            queryset.filter(owner_id=group['owner_id'], site_id=group['site_id'])
+                            .select_for_update()
+                            .order_by('id')
+                        )
+                        basket = baskets.pop(0)
+                        for stale_basket in baskets:
+                            # Don't add line quantities when merging baskets
+                            basket.merge(stale_basket, add_quantities=False)
+
+                self.stderr.write('Done.')
+            else:
+                self.stderr.write('No baskets to merge.')
+        else:
+            msg = 'This has been an example operation. If the --commit flag had been included, the command ' \
+                  'would have merged [{}] stale baskets.'.format(count)
+            self.stderr.write(msg)
@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('basket', '0006_basket_site'),
+    ]
+
+    operations = [
+        migrations.AlterIndexTogether(
+            name='basket',
+            index_together=set([('status', 'date_created'), ('site', 'owner', 'status')]),
+        ),
+    ]
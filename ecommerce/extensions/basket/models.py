@@ -1,4 +1,6 @@
-from django.db import models
+from django.contrib.auth import get_user_model
+from django.db import models, transaction
+from django.utils.functional import cached_property
 from django.utils.translation import ugettext_lazy as _
 from oscar.apps.basket.abstract_models import AbstractBasket
 from oscar.core.loading import get_class
@@ -11,30 +13,42 @@ class Basket(AbstractBasket):
     site = models.ForeignKey('sites.Site', verbose_name=_("Site"), null=True, blank=True, default=None,
                              on_delete=models.SET_NULL)
 
-    @property
+    class Meta(AbstractBasket.Meta):
+        # Support the lookup performed by get_basket, and the search for abandoned baskets.
+        index_together = (
+            ('site', 'owner', 'status'),
+            ('status', 'date_created'),
+        )
+
+    @cached_property
     def order_number(self):
+        """ Order number for this basket. Computed once per instance, since it is read repeatedly during checkout. """
         return OrderNumberGenerator().order_number(self)
 
     @classmethod
     def get_basket(cls, user, site):
         """Retrieve the basket belonging to the indicated user.
 
-        If no such basket exists, create a new one. If multiple such baskets exist,
-        merge them into one.
+        If no such basket exists, create a new one. If multiple such baskets exist, the oldest is returned;
+        the others are merged into it, outside of the request cycle, by the merge_stale_baskets command.
         """
-        editable_baskets = cls.objects.filter(site=site, owner=user, status__in=Basket.editable_statuses)
-        if len(editable_baskets) == 0:
-            basket = cls.objects.create(site=site, owner=user)
-        else:
-            stale_baskets = list(editable_baskets)
-            basket = stale_baskets.pop(0)
-            for stale_basket in stale_baskets:
-                # Don't add line quantities when merging baskets
-                basket.merge(stale_basket, add_quantities=False)
+        editable_baskets = cls.objects.filter(site=site, owner=user, status__in=cls.editable_statuses).order_by('id')
+
+        with transaction.atomic():
+            basket = editable_baskets.select_for_update().first()
+
+            if basket is None:
+                # Lock the user so that concurrent requests do not each create a basket, and check again
+                # in case a basket was created while we waited for the lock.
+                get_user_model().objects.select_for_update().get(pk=user.pk)
+                basket = editable_baskets.first() or cls.objects.create(site=site, owner=user)
 
         # Assign the appropriate strategy class to the basket
         basket.strategy = Selector().strategy(user=user)
 
+        # Load the lines, with their products and stock records, now rather than on first use.
+        len(basket.all_lines())
+
         return basket
 
     def __unicode__(self):
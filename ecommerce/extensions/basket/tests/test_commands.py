@@ -1,14 +1,25 @@
 from __future__ import unicode_literals
+import datetime
+import gzip
+import itertools
+import json
+import os
+import shutil
 from StringIO import StringIO
+import tempfile
 
 from django.contrib.sites.models import Site
 from django.core.management import call_command, CommandError
+from django.utils import timezone
+import mock
 from oscar.core.loading import get_model
 from oscar.test import factories
 
 from ecommerce.tests.testcases import TestCase
 
 Basket = get_model('basket', 'Basket')
+Line = get_model('basket', 'Line')
+LineAttribute = get_model('basket', 'LineAttribute')
 
 
 class DeleteOrderedBasketsCommandTests(TestCase):
@@ -54,6 +65,34 @@ class DeleteOrderedBasketsCommandTests(TestCase):
         self.assertTrue(actual.startswith('Deleting [{}] baskets...'.format(len(self.orders))))
         self.assertTrue(actual.endswith('Done.'))
 
+    def test_with_commit_in_batches(self):
+        """ Verify the command deletes baskets, and their lines, line attributes, and vouchers, in batches. """
+        basket = self.orders[0].basket
+        factories.BasketLineAttributeFactory(line=basket.lines.first())
+        basket.vouchers.add(factories.VoucherFactory())
+        unordered_lines = list(Line.objects.filter(basket__in=self.unordered_baskets))
+
+        out = StringIO()
+        with mock.patch('time.sleep') as mock_sleep:
+            call_command(self.command, commit=True, batch_size=1, sleep_time=0.5, stderr=out)
+
+        self.assertEqual(list(Basket.objects.all()), self.unordered_baskets)
+        self.assertEqual(list(Line.objects.all()), unordered_lines)
+        self.assertFalse(LineAttribute.objects.exists())
+        self.assertFalse(Basket.vouchers.through.objects.exists())
+
+        # Verify the orders are retained
+        for order in self.orders:
+            order = order.__class__.objects.get(id=order.id)
+            self.assertIsNone(order.basket)
+
+        # Verify each batch is logged, and followed by a pause
+        for order in self.orders:
+            msg = '...deleting baskets [{id}] through [{id}]...'.format(id=order.basket_id)
+            self.assertIn(msg, out.getvalue())
+        self.assertEqual(mock_sleep.call_count, len(self.orders))
+        mock_sleep.assert_called_with(0.5)
+
     def test_commit_without_baskets(self):
         """ Verify the command does nothing if there are no baskets to delete. """
         # Delete all baskets
@@ -66,6 +105,157 @@ class DeleteOrderedBasketsCommandTests(TestCase):
         self.assertEqual(out.getvalue().strip(), 'No baskets to delete.')
 
 
+class ArchiveAbandonedBasketsCommandTests(TestCase):
+    command = 'archive_abandoned_baskets'
+
+    def setUp(self):
+        super(ArchiveAbandonedBasketsCommandTests, self).setUp()
+        self.output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.output_dir)
+
+        # Create abandoned baskets, and baskets which should be retained
+        self.abandoned_baskets = [self.create_basket(Basket.OPEN), self.create_basket(Basket.FROZEN)]
+        self.retained_baskets = [
+            self.create_basket(Basket.OPEN, days=1),
+            self.create_basket(Basket.SUBMITTED),
+            factories.create_order().basket,
+        ]
+
+        # A basket created long ago, but still in use, should also be retained
+        basket = self.create_basket(Basket.OPEN)
+        Line.objects.filter(basket=basket).update(date_created=timezone.now())
+        self.retained_baskets.append(basket)
+
+    def create_basket(self, status, days=60):
+        """ Create a new Basket, with a single line, created the specified number of days ago. """
+        date_created = timezone.now() - datetime.timedelta(days=days)
+        basket = factories.create_basket()
+        basket.status = status
+        basket.save()
+        Basket.objects.filter(id=basket.id).update(date_created=date_created)
+        Line.objects.filter(basket=basket).update(date_created=date_created)
+        return basket
+
+    def test_without_commit(self):
+        """ Verify the command does not archive baskets if the commit flag is not set, but prints statistics. """
+        expected = Basket.objects.count()
+
+        out = StringIO()
+        call_command(self.command, commit=False, output_dir=self.output_dir, stderr=out)
+
+        self.assertEqual(Basket.objects.count(), expected)
+        self.assertEqual(os.listdir(self.output_dir), [])
+
+        actual = out.getvalue()
+        self.assertIn('Abandoned baskets: [2]', actual)
+        self.assertIn('...with status [{}]: [1]'.format(Basket.OPEN), actual)
+        self.assertIn('...with status [{}]: [1]'.format(Basket.FROZEN), actual)
+        self.assertIn('Lines: [2]', actual)
+
+        expected = 'This has been an example operation. If the --commit flag had been included, the command ' \
+                   'would have archived and deleted [2] baskets.'
+        self.assertTrue(actual.strip().endswith(expected))
+
+    def test_with_commit(self):
+        """ Verify the command, when called with the commit flag, archives and deletes abandoned baskets. """
+        out = StringIO()
+        call_command(self.command, commit=True, output_dir=self.output_dir, batch_size=1, stderr=out)
+
+        self.assertEqual(set(Basket.objects.all()), set(self.retained_baskets))
+
+        # Verify the baskets were archived
+        filenames = os.listdir(self.output_dir)
+        self.assertEqual(len(filenames), 1)
+        with gzip.open(os.path.join(self.output_dir, filenames[0])) as archive:
+            archived = [json.loads(line) for line in archive]
+
+        self.assertEqual([basket['id'] for basket in archived], [basket.id for basket in self.abandoned_baskets])
+        self.assertEqual([basket['status'] for basket in archived], [Basket.OPEN, Basket.FROZEN])
+        for basket in archived:
+            self.assertEqual(len(basket['lines']), 1)
+            self.assertEqual(basket['lines'][0]['quantity'], 1)
+
+        actual = out.getvalue().strip()
+        self.assertTrue(actual.startswith('Archiving [2] baskets'))
+        self.assertTrue(actual.endswith('Done.'))
+
+    def test_commit_without_baskets(self):
+        """ Verify the command does nothing if there are no baskets to archive. """
+        out = StringIO()
+        call_command(self.command, commit=True, output_dir=self.output_dir, days=90, stderr=out)
+
+        self.assertEqual(out.getvalue().strip(), 'No baskets to archive.')
+        self.assertEqual(os.listdir(self.output_dir), [])
+
+
+class MergeStaleBasketsCommandTests(TestCase):
+    command = 'merge_stale_baskets'
+
+    def setUp(self):
+        super(MergeStaleBasketsCommandTests, self).setUp()
+        self.user = factories.UserFactory()
+
+        # Create a basket per editable state, which should be merged, and a basket which should not be merged.
+        self.editable_baskets = [self.create_basket(status) for status in Basket.editable_statuses]
+        self.frozen_basket = self.create_basket(Basket.FROZEN)
+
+        # Create a single basket for another user, which should not be merged.
+        self.other_basket = factories.create_basket()
+        self.other_basket.owner = factories.UserFactory()
+        self.other_basket.site = self.site
+        self.other_basket.save()
+
+    def create_basket(self, status):
+        """ Create a new Basket, with a single line, for the user. """
+        basket = factories.create_basket()
+        basket.owner = self.user
+        basket.site = self.site
+        basket.status = status
+        basket.save()
+        return basket
+
+    def test_without_commit(self):
+        """ Verify the command does not merge baskets if the commit flag is not set. """
+        out = StringIO()
+        call_command(self.command, commit=False, stderr=out)
+
+        statuses = [Basket.objects.get(id=basket.id).status for basket in self.editable_baskets]
+        self.assertEqual(statuses, list(Basket.editable_statuses))
+
+        expected = 'This has been an example operation. If the --commit flag had been included, the command ' \
+                   'would have merged [{}] stale baskets.'.format(len(self.editable_baskets) - 1)
+        self.assertEqual(out.getvalue().strip(), expected)
+
+    def test_with_commit(self):
+        """ Verify the command merges stale baskets into the oldest editable basket. """
+        expected_lines = list(itertools.chain.from_iterable([list(b.lines.all()) for b in self.editable_baskets]))
+
+        out = StringIO()
+        call_command(self.command, commit=True, stderr=out)
+
+        basket = Basket.objects.get(id=self.editable_baskets[0].id)
+        self.assertEqual(basket.status, Basket.OPEN)
+        self.assertEqual(list(basket.lines.all()), expected_lines)
+
+        for stale_basket in self.editable_baskets[1:]:
+            self.assertEqual(Basket.objects.get(id=stale_basket.id).status, Basket.MERGED)
+
+        self.assertEqual(Basket.objects.get(id=self.frozen_basket.id).status, Basket.FROZEN)
+        self.assertEqual(Basket.objects.get(id=self.other_basket.id).status, Basket.OPEN)
+
+        actual = out.getvalue().strip()
+        self.assertTrue(actual.startswith('Merging [{}] stale baskets...'.format(len(self.editable_baskets) - 1)))
+        self.assertTrue(actual.endswith('Done.'))
+
+    def test_commit_without_stale_baskets(self):
+        """ Verify the command does nothing if there are no baskets to merge. """
+        call_command(self.command, commit=True, stderr=StringIO())
+
+        out = StringIO()
+        call_command(self.command, commit=True, stderr=out)
+        self.assertEqual(out.getvalue().strip(), 'No baskets to merge.')
+
+
 class AddSiteToBasketsBasketsCommandTests(TestCase):
     command = 'add_site_to_baskets'
 
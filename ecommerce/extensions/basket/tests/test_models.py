@@ -37,6 +37,14 @@ class BasketTests(TestCase):
         expected = OrderNumberGenerator().order_number(basket)
         self.assertEqual(basket.order_number, expected)
 
+    def test_order_number_cached(self):
+        """ The order number should only be computed once per Basket instance. """
+        basket = factories.create_basket()
+        expected = basket.order_number
+
+        with self.assertNumQueries(0):
+            self.assertEqual(basket.order_number, expected)
+
     def test_unicode(self):
         """ Verify the __unicode__ method returns the correct value. """
         basket = factories.create_basket()
@@ -69,18 +77,17 @@ class BasketTests(TestCase):
         self.assertEqual(user.baskets.count(), 2, 'A new basket was not created for the second site.')
 
     def test_get_basket_with_existing_baskets(self):
-        """ If the user has existing baskets in editable states, the method should return a single merged basket. """
+        """ If the user has existing baskets in editable states, the method should return the oldest basket. """
         user = factories.UserFactory()
 
-        # Create baskets in a state that qualifies them for merging
+        # Create baskets in a state that qualifies them for use
         editable_baskets = []
         for status in Basket.editable_statuses:
             editable_baskets.append(self._create_basket(user, self.site1, status))
 
-        # Create baskets that should NOT be merged
-        non_editable_baskets = []
+        # Create baskets that should NOT be used
         for status in (Basket.MERGED, Basket.FROZEN, Basket.SUBMITTED):
-            non_editable_baskets.append(self._create_basket(user, self.site1, status))
+            self._create_basket(user, self.site1, status)
 
         # Create a basket for the other site/tenant
         Basket.get_basket(user, self.site2)
@@ -92,17 +99,18 @@ class BasketTests(TestCase):
         # No new basket should be created
         self.assertEqual(user.baskets.count(), 6)
 
-        # Check the basic details of the new basket
+        # The oldest editable basket should be returned, with its lines loaded.
+        self.assertEqual(basket, editable_baskets[0])
         self.assertEqual(basket.status, Basket.OPEN)
         self.assertEqual(basket.owner, user)
 
-        # One of the previously editable baskets should be in the merged state.
-        actual_states = [Basket.objects.get(id=eb.id).status for eb in editable_baskets]
-        self.assertEqual(actual_states, [Basket.OPEN, Basket.MERGED])
+        expected_lines = list(editable_baskets[0].lines.all())
+        with self.assertNumQueries(0):
+            self.assertEqual(list(basket.all_lines()), expected_lines)
 
-        # The merged basket should include the products from the original baskets
-        expected_lines = list(itertools.chain.from_iterable([list(eb.lines.all()) for eb in editable_baskets]))
-        self.assertEqual(list(basket.lines.all()), expected_lines)
+        # Stale baskets are left for the merge_stale_baskets command.
+        actual_states = [Basket.objects.get(id=eb.id).status for eb in editable_baskets]
+        self.assertEqual(actual_states, list(Basket.editable_statuses))
 
         # Verify the basket for the second site/tenant is not modified
         self.assert_basket_state(user.baskets.get(site=self.site2), Basket.OPEN, user, self.site2)
@@ -0,0 +1,85 @@
+from __future__ import unicode_literals
+
+from django.db import connection, transaction
+from oscar.core.loading import get_model
+
+Basket = get_model('basket', 'Basket')
+Line = get_model('basket', 'Line')
+LineAttribute = get_model('basket', 'LineAttribute')
+
+
+def delete_baskets(basket_ids):
+    """ Delete the indicated baskets.
+
+    Lines, line attributes, and voucher associations are removed with bulk DELETE statements. This avoids
+    the ORM loading every related row in order to delete it individually.
+
+    Arguments:
+        basket_ids (list): IDs of the baskets to delete.
+    """
+    qn = connection.ops.quote_name
+    placeholders = ', '.join(['%s'] * len(basket_ids))
+    statements = (
+        'DELETE FROM {line_attribute} WHERE {line_id} IN (SELECT {id} FROM {line} WHERE {basket_id} IN ({ids}))',
+        'DELETE FROM {line} WHERE {basket_id} IN ({ids})',
+        'DELETE FROM {vouchers} WHERE {basket_id} IN ({ids})',
+    )
+
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            for statement in statements:
+                sql = statement.format(
+                    line_attribute=qn(LineAttribute._meta.db_table),
+                    line=qn(Line._meta.db_table),
+                    vouchers=qn(Basket.vouchers.through._meta.db_table),
+                    line_id=qn('line_id'),
+                    basket_id=qn('basket_id'),
+                    id=qn('id'),
+                    ids=placeholders
+                )
+                cursor.execute(sql, basket_ids)
+
+        # The remaining relations (e.g. orders and payment processor responses) are few and require the ORM
+        # to nullify their foreign keys, so the baskets themselves are deleted via the ORM.
+        Basket.objects.filter(id__in=basket_ids).delete()
+
+
+def serialize_basket(basket):
+    """ Serialize a basket, its lines, and its vouchers for archival.
+
+    Arguments:
+        basket (Basket): Basket to serialize. Lines (with attributes and options) and vouchers should be prefetched.
+
+    Returns:
+        dict
+    """
+    def _isoformat(value):
+        return value.isoformat() if value else None
+
+    return {
+        'id': basket.id,
+        'site_id': basket.site_id,
+        'owner_id': basket.owner_id,
+        'status': basket.status,
+        'date_created': _isoformat(basket.date_created),
+        'date_merged': _isoformat(basket.date_merged),
+        'date_submitted': _isoformat(basket.date_submitted),
+        'vouchers': [voucher.code for voucher in basket.vouchers.all()],
+        'lines': [
+            {
+                'line_reference': line.line_reference,
+                'product_id': line.product_id,
+                'stockrecord_id': line.stockrecord_id,
+                'quantity': line.quantity,
+                'price_currency': line.price_currency,
+                'price_excl_tax': None if line.price_excl_tax is None else unicode(line.price_excl_tax),
+                'price_incl_tax': None if line.price_incl_tax is None else unicode(line.price_incl_tax),
+                'date_created': _isoformat(line.date_created),
+                'attributes': [
+                    {'option': attribute.option.code, 'value': attribute.value}
+                    for attribute in line.attributes.all()
+                ],
+            }
+            for line in basket.lines.all()
+        ],
+    }
@@ -3,3 +3,10 @@ from oscar.apps.catalogue import config
 
 class CatalogueConfig(config.CatalogueConfig):
     name = 'ecommerce.extensions.catalogue'
+
+    def ready(self):
+        super(CatalogueConfig, self).ready()
+
+        # Register signal handlers
+        # noinspection PyUnresolvedReferences
+        import ecommerce.extensions.catalogue.receivers  # pylint: disable=unused-variable
@@ -2,18 +2,19 @@
 from django.db import models
 from django.utils.translation import ugettext_lazy as _
 from oscar.apps.catalogue.abstract_models import AbstractProduct, AbstractProductAttributeValue
-from simple_history.models import HistoricalRecords
+
+from ecommerce.core.history import DeferrableHistoricalRecords
 
 
 class Product(AbstractProduct):
     course = models.ForeignKey('courses.Course', null=True, blank=True, related_name='products')
     expires = models.DateTimeField(null=True, blank=True,
                                    help_text=_('Last date/time on which this product can be purchased.'))
-    history = HistoricalRecords()
+    history = DeferrableHistoricalRecords()
 
 
 class ProductAttributeValue(AbstractProductAttributeValue):
-    history = HistoricalRecords()
+    history = DeferrableHistoricalRecords()
 
 
 class Catalog(models.Model):
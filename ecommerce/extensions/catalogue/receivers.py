@@ -0,0 +1,43 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from oscar.core.loading import get_model
+
+from ecommerce.extensions.catalogue.utils import clear_catalog_product_ids_cache, clear_product_class_cache
+
+Catalog = get_model('catalogue', 'Catalog')
+ProductClass = get_model('catalogue', 'ProductClass')
+StockRecord = get_model('partner', 'StockRecord')
+
+
+@receiver(post_save, sender=ProductClass, dispatch_uid='catalogue.product_class_saved')
+@receiver(post_delete, sender=ProductClass, dispatch_uid='catalogue.product_class_deleted')
+def invalidate_product_class_cache(sender, **kwargs):  # pylint: disable=unused-argument
+    """ Clear the cached ProductClasses when any ProductClass is modified. """
+    clear_product_class_cache()
+
+
+@receiver(m2m_changed, sender=Catalog.stock_records.through, dispatch_uid='catalogue.catalog_stock_records_changed')
+def invalidate_catalog_product_ids(sender, instance, action, reverse, pk_set,
+                                   **kwargs):  # pylint: disable=unused-argument
+    """ Clear the cached product IDs of the catalogs whose stock records have been modified. """
+    if not action.startswith('post_'):
+        return
+
+    if not reverse:
+        catalog_ids = [instance.id]
+    elif action == 'post_clear':
+        # The catalogs from which the stock record was removed are no longer known.
+        catalog_ids = Catalog.objects.values_list('id', flat=True)
+    else:
+        catalog_ids = pk_set
+
+    clear_catalog_product_ids_cache(catalog_ids)
+
+
+@receiver(post_save, sender=StockRecord, dispatch_uid='catalogue.catalog_stock_record_saved')
+@receiver(pre_delete, sender=StockRecord, dispatch_uid='catalogue.catalog_stock_record_deleted')
+def invalidate_stock_record_catalogs(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """ Clear the cached product IDs of the catalogs containing the modified stock record. """
+    # New stock records do not yet belong to any catalog.
+    if not kwargs.get('created'):
+        clear_catalog_product_ids_cache(instance.catalogs.values_list('id', flat=True))
@@ -2,11 +2,20 @@ from __future__ import unicode_literals
 
 from hashlib import md5
 
+from django.conf import settings
+from django.core.cache import cache
 from oscar.core.loading import get_model
 
 Catalog = get_model('catalogue', 'Catalog')
+ProductClass = get_model('catalogue', 'ProductClass')
 StockRecord = get_model('partner', 'StockRecord')
 
+SEAT_PRODUCT_CLASS_SLUG = 'seat'
+
+# ProductClasses keyed by slug, cached for the lifetime of the process. Cleared by the receivers in
+# ecommerce.extensions.catalogue.receivers whenever a ProductClass is modified.
+_product_classes = {}
+
 
 def generate_sku(product, partner, **kwargs):
     """
@@ -39,6 +48,59 @@ def generate_sku(product, partner, **kwargs):
     return digest.upper()
 
 
+def get_seat_product_class():
+    """
+    Returns the course seat ProductClass.
+
+    Raises:
+        ProductClass.DoesNotExist: If the seat ProductClass has not been created.
+    """
+    product_class = _product_classes.get(SEAT_PRODUCT_CLASS_SLUG)
+    if product_class is None:
+        product_class = ProductClass.objects.get(slug=SEAT_PRODUCT_CLASS_SLUG)
+        _product_classes[SEAT_PRODUCT_CLASS_SLUG] = product_class
+
+    return product_class
+
+
+def clear_product_class_cache():
+    """ Removes all cached ProductClasses. """
+    _product_classes.clear()
+
+
+def get_catalog_product_ids(catalog_id):
+    """
+    Returns the IDs of the products whose stock records belong to the given catalog.
+
+    The IDs are cached, and the cache is cleared by the receivers in ecommerce.extensions.catalogue.receivers
+    whenever the catalog's stock records are modified.
+
+    Arguments:
+        catalog_id (int)
+
+    Returns:
+        frozenset
+    """
+    key = _get_catalog_product_ids_cache_key(catalog_id)
+    product_ids = cache.get(key)
+    if product_ids is None:
+        product_ids = frozenset(
+            StockRecord.objects.filter(catalogs__id=catalog_id).values_list('product_id', flat=True)
+        )
+        cache.set(key, product_ids, settings.CATALOG_PRODUCT_IDS_CACHE_TIMEOUT)
+
+    return product_ids
+
+
+def clear_catalog_product_ids_cache(catalog_ids):
+    """ Removes the cached product IDs of the given catalogs. """
+    cache.delete_many([_get_catalog_product_ids_cache_key(catalog_id) for catalog_id in catalog_ids])
+
+
+def _get_catalog_product_ids_cache_key(catalog_id):
+    return 'catalog_product_ids_{}'.format(catalog_id)
+
+
 def get_or_create_catalog(name, partner, stock_record_ids):
     """
     Returns the catalog which has the same name, partner and stock records.
@@ -0,0 +1,100 @@
+"""
+Celery tasks run after an order is placed.
+
+Work which is not required to fulfill an order (e.g. tracking and notifications) is performed by these tasks, rather
+than inline, so that the buyer does not wait on third-party services.
+"""
+import logging
+
+from celery import shared_task
+from celery.exceptions import Ignore
+from oscar.core.loading import get_model
+
+from ecommerce.extensions.analytics.emitters import get_emitter
+from ecommerce.extensions.analytics.events import COMPLETED_ORDER, build_completed_order_event
+from ecommerce.extensions.checkout.utils import get_provider_data
+from ecommerce.notifications.notifications import send_notification
+from ecommerce.settings import get_lms_url
+
+
+logger = logging.getLogger(__name__)
+Order = get_model('order', 'Order')
+
+MAX_RETRIES = 5
+# Seconds to wait before the first retry. Each subsequent retry waits twice as long as the previous one.
+RETRY_BASE_DELAY = 30
+# Seconds to wait for the transaction which placed the order to be committed, and the number of times to do so.
+UNCOMMITTED_ORDER_RETRY_DELAY = 5
+UNCOMMITTED_ORDER_MAX_RETRIES = 5
+
+
+def get_retry_countdown(retries):
+    """ Returns the number of seconds to wait before the next retry, given the number of retries already made. """
+    return RETRY_BASE_DELAY * (2 ** retries)
+
+
+def get_order(task, order_number, uncommitted_retries):
+    """ Returns the order with the given number, queueing the task again if the order does not exist.
+
+    Tasks are queued by post_checkout receivers, which may run before the transaction placing the order has been
+    committed. The order is then not yet visible to the worker. The task is queued again, rather than retried, so
+    that waiting for the order does not use up the retries of the task; `uncommitted_retries` counts the waits.
+    """
+    try:
+        return Order.objects.select_related('user').get(number=order_number)
+    except Order.DoesNotExist:
+        if uncommitted_retries >= UNCOMMITTED_ORDER_MAX_RETRIES:
+            logger.error('Order [%s] does not exist.', order_number)
+            raise
+
+        logger.warning('Order [%s] does not exist. Retrying.', order_number)
+        task.apply_async(
+            args=(order_number,),
+            kwargs={'uncommitted_retries': uncommitted_retries + 1},
+            countdown=UNCOMMITTED_ORDER_RETRY_DELAY
+        )
+        raise Ignore()
+
+
+@shared_task(bind=True, ignore_result=True)
+def track_completed_order(self, order_number, uncommitted_retries=0):
+    """Emit a tracking event for a placed order.
+
+    The event is not retried if it cannot be emitted: the analytics client queues events, and delivers them in the
+    background, so emitting an event does not fail if Segment cannot be reached.
+    """
+    order = get_order(self, order_number, uncommitted_retries)
+    user_tracking_id, properties, context = build_completed_order_event(order)
+    get_emitter().track(user_tracking_id, COMPLETED_ORDER, properties, context=context)
+
+
+@shared_task(bind=True, ignore_result=True, max_retries=MAX_RETRIES)
+def send_course_purchase_email(self, order_number, uncommitted_retries=0):
+    """Send a credit receipt notification for a placed order."""
+    order = get_order(self, order_number, uncommitted_retries)
+    product = order.lines.all()[0].product
+    provider_id = getattr(product.attr, 'credit_provider', None)
+
+    if not provider_id:
+        logger.error(
+            'Failed to send credit receipt notification. Credit seat product [%s] has not provider.', product.id
+        )
+        return
+    elif product.get_product_class().name == 'Seat':
+        provider_data = get_provider_data(provider_id)
+        if not provider_data:
+            logger.warning('Failed to retrieve data for provider [%s]. Retrying.', provider_id)
+            raise self.retry(countdown=get_retry_countdown(self.request.retries))
+
+        send_notification(
+            order.user,
+            'CREDIT_RECEIPT',
+            {
+                'course_title': product.title,
+                'receipt_page_url': get_lms_url(
+                    '/commerce/checkout/receipt/?orderNum={}'.format(order.number)
+                ),
+                'credit_hours': product.attr.credit_hours,
+                'credit_provider': provider_data['display_name'],
+            }
+        )
@@ -2,6 +2,7 @@
 Tests for the ecommerce.extensions.checkout.mixins module.
 """
 from decimal import Decimal
+import json
 
 from django.test import override_settings
 from mock import Mock, patch
@@ -30,6 +31,8 @@ class EdxOrderPlacementMixinTests(BusinessIntelligenceMixin, RefundTestMixin, Te
 
         self.user = UserFactory()
         self.order = self.create_order(status=ORDER.OPEN)
+        # Events are built from the order as stored, whose number is a string.
+        self.order.refresh_from_db()
 
     def test_handle_payment_logging(self, __):
         """
@@ -60,15 +63,15 @@ class EdxOrderPlacementMixinTests(BusinessIntelligenceMixin, RefundTestMixin, Te
                     (
                         LOGGER_NAME,
                         'INFO',
-                        'payment_received: amount="{}", basket_id="{}", currency="{}", '
-                        'processor_name="{}", reference="{}", user_id="{}"'.format(
-                            amount,
-                            basket_id,
-                            currency,
-                            processor_name,
-                            reference,
-                            user_id
-                        )
+                        json.dumps({
+                            'event': 'payment_received',
+                            'amount': unicode(amount),
+                            'basket_id': basket_id,
+                            'currency': currency,
+                            'processor_name': processor_name,
+                            'reference': reference,
+                            'user_id': user_id,
+                        }, sort_keys=True)
                     )
                 )
 
@@ -100,13 +103,14 @@ class EdxOrderPlacementMixinTests(BusinessIntelligenceMixin, RefundTestMixin, Te
                 (
                     LOGGER_NAME,
                     'INFO',
-                    'order_placed: amount="{}", basket_id="{}", currency="{}", order_number="{}", user_id="{}"'.format(
-                        self.order.total_excl_tax,
-                        self.order.basket.id,
-                        self.order.currency,
-                        self.order.number,
-                        self.order.user.id
-                    )
+                    json.dumps({
+                        'event': 'order_placed',
+                        'amount': unicode(self.order.total_excl_tax),
+                        'basket_id': self.order.basket.id,
+                        'currency': self.order.currency,
+                        'order_number': self.order.number,
+                        'user_id': self.order.user.id,
+                    }, sort_keys=True)
                 )
             )
 
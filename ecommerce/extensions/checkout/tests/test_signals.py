@@ -1,5 +1,6 @@
 from django.conf import settings
 from django.core import mail
+from django.core.cache import cache
 import httpretty
 from oscar.test import factories
 from oscar.test.newfactories import BasketFactory, UserFactory
@@ -13,6 +14,10 @@ from ecommerce.tests.testcases import TestCase
 
 
 class SignalTests(CourseCatalogTestMixin, TestCase):
+    def setUp(self):
+        super(SignalTests, self).setUp()
+        cache.clear()
+
     @httpretty.activate
     def test_post_checkout_callback(self):
         """
@@ -20,8 +25,8 @@ class SignalTests(CourseCatalogTestMixin, TestCase):
         to fulfill the newly-placed order and send receipt email.
         """
         httpretty.register_uri(
-            httpretty.GET, get_lms_url('api/credit/v1/providers/ASU'),
-            body='{"display_name": "Hogwarts"}',
+            httpretty.GET, get_lms_url('api/credit/v1/providers/'),
+            body='[{"id": "ASU", "display_name": "Hogwarts"}]',
             content_type="application/json"
         )
         toggle_switch('ENABLE_NOTIFICATIONS', True)
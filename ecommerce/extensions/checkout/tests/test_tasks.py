@@ -0,0 +1,81 @@
+from celery.exceptions import Ignore
+from django.core import mail
+from django.test import override_settings
+import mock
+from oscar.core.loading import get_model
+from oscar.test import factories
+from oscar.test.newfactories import BasketFactory, UserFactory
+
+from ecommerce.core.tests import toggle_switch
+from ecommerce.courses.models import Course
+from ecommerce.extensions.catalogue.tests.mixins import CourseCatalogTestMixin
+from ecommerce.extensions.checkout import tasks
+from ecommerce.extensions.checkout.signals import send_course_purchase_email, track_completed_order
+from ecommerce.tests.testcases import TestCase
+
+Order = get_model('order', 'Order')
+
+
+class PostCheckoutTaskTests(CourseCatalogTestMixin, TestCase):
+    def setUp(self):
+        super(PostCheckoutTaskTests, self).setUp()
+        course = Course.objects.create(id='edX/DemoX/Demo_Course', name='Demo Course')
+        seat = course.create_or_update_seat('credit', False, 50, self.partner, 'ASU', None, 2)
+
+        basket = BasketFactory()
+        basket.add_product(seat, 1)
+        self.order = factories.create_order(number=1, basket=basket, user=UserFactory())
+
+    def test_get_retry_countdown(self):
+        """ Verify the delay before each retry doubles. """
+        self.assertEqual(
+            [tasks.get_retry_countdown(retries) for retries in range(3)],
+            [tasks.RETRY_BASE_DELAY, tasks.RETRY_BASE_DELAY * 2, tasks.RETRY_BASE_DELAY * 4]
+        )
+
+    @override_settings(SEGMENT_KEY='dummy-key')
+    def test_track_completed_order_enqueued(self):
+        """ Verify the receiver delegates tracking to a task. """
+        with mock.patch.object(tasks.track_completed_order, 'delay') as mock_delay:
+            track_completed_order(None, order=self.order)
+            mock_delay.assert_called_once_with(self.order.number)
+
+    def test_send_course_purchase_email_enqueued(self):
+        """ Verify the receiver delegates sending the email to a task. """
+        toggle_switch('ENABLE_NOTIFICATIONS', True)
+        with mock.patch.object(tasks.send_course_purchase_email, 'delay') as mock_delay:
+            send_course_purchase_email(None, order=self.order)
+            mock_delay.assert_called_once_with(self.order.number)
+
+    def test_send_course_purchase_email_retried(self):
+        """ Verify the email task is retried if the credit provider's data cannot be retrieved. """
+        provider_data = [None, {'display_name': 'Hogwarts'}]
+        with mock.patch.object(tasks, 'get_provider_data', side_effect=provider_data) as mock_get_provider_data:
+            tasks.send_course_purchase_email.delay(self.order.number)
+
+        self.assertEqual(mock_get_provider_data.call_count, 2)
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_uncommitted_order_retried(self):
+        """ Verify the tasks are queued again, without using up their retries, if the order has not been committed
+        when they run. """
+        for task in (tasks.track_completed_order, tasks.send_course_purchase_email):
+            with mock.patch.object(task, 'apply_async') as mock_apply_async:
+                with mock.patch.object(task, 'retry') as mock_retry:
+                    with self.assertRaises(Ignore):
+                        task('uncommitted-order', uncommitted_retries=1)
+                    self.assertFalse(mock_retry.called)
+
+            mock_apply_async.assert_called_once_with(
+                args=('uncommitted-order',),
+                kwargs={'uncommitted_retries': 2},
+                countdown=tasks.UNCOMMITTED_ORDER_RETRY_DELAY
+            )
+
+    def test_uncommitted_order_max_retries(self):
+        """ Verify the tasks give up once they have waited for the order the maximum number of times. """
+        for task in (tasks.track_completed_order, tasks.send_course_purchase_email):
+            with mock.patch.object(task, 'apply_async') as mock_apply_async:
+                with self.assertRaises(Order.DoesNotExist):
+                    task('uncommitted-order', uncommitted_retries=tasks.UNCOMMITTED_ORDER_MAX_RETRIES)
+                self.assertFalse(mock_apply_async.called)
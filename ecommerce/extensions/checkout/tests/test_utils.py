@@ -1,28 +1,31 @@
-import ddt
 import httpretty
-import mock
-import requests
-from requests import ConnectionError, Timeout
+from django.core.cache import cache
+from requests import Timeout
 
 from ecommerce.extensions.checkout.utils import get_provider_data
 from ecommerce.settings import get_lms_url
 from ecommerce.tests.testcases import TestCase
 
 
-@ddt.ddt
 class UtilTests(TestCase):
+    def setUp(self):
+        super(UtilTests, self).setUp()
+        cache.clear()
+
     @httpretty.activate
     def test_get_provider_data(self):
         """
         Check if correct data returns on the full filled request.
         """
         httpretty.register_uri(
-            httpretty.GET, get_lms_url('api/credit/v1/providers/ASU'),
-            body='{"display_name": "Arizona State University"}',
+            httpretty.GET, get_lms_url('api/credit/v1/providers/'),
+            body='[{"id": "ASU", "display_name": "Arizona State University"}]',
             content_type="application/json"
         )
         provider_data = get_provider_data('ASU')
-        self.assertDictEqual(provider_data, {"display_name": "Arizona State University"})
+        self.assertDictEqual(provider_data, {"id": "ASU", "display_name": "Arizona State University"})
+        self.assertEqual(httpretty.last_request().querystring, {'provider_ids': ['ASU']})
+        self.assertEqual(httpretty.last_request().headers['X-Edx-Api-Key'], 'replace-me')
 
     @httpretty.activate
     def test_get_provider_data_unavailable_request(self):
@@ -30,14 +33,17 @@ class UtilTests(TestCase):
         Check if None return on the bad request
         """
         httpretty.register_uri(
-            httpretty.GET, get_lms_url('api/credit/v1/providers/ABC'),
+            httpretty.GET, get_lms_url('api/credit/v1/providers/'),
             status=400
         )
         provider_data = get_provider_data('ABC')
         self.assertEqual(provider_data, None)
 
-    @ddt.data(ConnectionError, Timeout)
-    def test_exceptions(self, exception):
+    @httpretty.activate
+    def test_exceptions(self):
         """ Verify the function returns None when a request exception is raised. """
-        with mock.patch.object(requests, 'get', mock.Mock(side_effect=exception)):
-            self.assertIsNone(get_provider_data('ABC'))
+        def callback(request, uri, headers):  # pylint: disable=unused-argument
+            raise Timeout
+
+        httpretty.register_uri(httpretty.GET, get_lms_url('api/credit/v1/providers/'), body=callback)
+        self.assertIsNone(get_provider_data('ABC'))
@@ -24,7 +24,8 @@ def fulfill_order(order, lines):
     Attempts to fulfill the products in the Order. Checks the mapping of fulfillment modules to product types, and
     will fulfill the order line items in the specified order. If a line item cannot be fulfilled, either because
     of an error, or no existing fulfillment logic, the Order is marked with "Fulfillment Error" and the status of
-    each line is marked according to its success or failure.
+    each line is marked according to its success or failure. Lines which have already been fulfilled (e.g. when
+    re-fulfilling an Order after a fulfillment error) are not fulfilled again.
 
     Args:
         order (Order): The Order associated with this line item. The status of the Order may be altered based on
@@ -42,8 +43,9 @@ def fulfill_order(order, lines):
         logger.error(error_msg)
         raise exceptions.IncorrectOrderStatusError(error_msg)
 
-    # Construct a dict of lines by their product type.
-    line_items = list(lines.all())
+    # Only fulfill the lines which have not already been fulfilled.
+    pending_lines = list(lines.exclude(status=LINE.COMPLETE))
+    line_items = pending_lines
 
     try:
         # Iterate over the Fulfillment Modules defined in our configuration and determine if they support
@@ -53,8 +55,9 @@ def fulfill_order(order, lines):
         for module_class in get_fulfillment_modules():
             module = module_class()
             supported_lines = module.get_supported_lines(line_items)
-            line_items = list(set(line_items) - set(supported_lines))
-            module.fulfill_product(order, supported_lines)
+            if supported_lines:
+                line_items = list(set(line_items) - set(supported_lines))
+                module.fulfill_product(order, supported_lines)
 
         # Check to see if any line items in the order have not been accounted for by a FulfillmentModule
         # Any product does not line up with a module, we have to mark a fulfillment error.
@@ -62,17 +65,16 @@ def fulfill_order(order, lines):
             product_type = line.product.get_product_class().name
             logger.error("Product Type [%s] does not have an associated Fulfillment Module. It cannot be fulfilled.",
                          product_type)
-            line.set_status(LINE.FULFILLMENT_CONFIGURATION_ERROR)
+        order.lines.model.bulk_set_status(line_items, LINE.FULFILLMENT_CONFIGURATION_ERROR)
     except Exception:   # pylint: disable=broad-except
         logger.exception('An unexpected error occurred while fulfilling order [%s].', order.number)
     finally:
-        # Check if all lines are successful, or there were errors, and set the status of the Order.
+        # Check if all lines are successful, or there were errors, and set the status of the Order. The fulfillment
+        # modules update the status of the lines they are given, so the lines need not be reloaded.
         order_status = ORDER.COMPLETE
-        for line in lines.all():
-            if line.status != LINE.COMPLETE:
-                logger.error('There was an error while fulfilling order [%s]', order.number)
-                order_status = ORDER.FULFILLMENT_ERROR
-                break
+        if any(line.status != LINE.COMPLETE for line in pending_lines):
+            logger.error('There was an error while fulfilling order [%s]', order.number)
+            order_status = ORDER.FULFILLMENT_ERROR
 
         order.set_status(order_status)
         logger.info("Finished fulfilling order [%s] with status [%s]", order.number, order.status)
@@ -118,20 +120,25 @@ def revoke_fulfillment_for_refund(refund):
     # prevents deadlocking with the LMS which occurs when Otto attempts to revoke an
     # automatically-approved refund.
     if refund.total_credit_excl_tax == 0:
-        for refund_line in refund.lines.all():
-            refund_line.set_status(REFUND_LINE.COMPLETE)
+        refund.lines.model.bulk_set_status(refund.lines.all(), REFUND_LINE.COMPLETE)
     else:
+        revoked_lines = []
+        failed_lines = []
+
         # TODO (CCB): As our list of product types and fulfillment modules grows, this may become slow,
         # and should be updated. Runtime is O(n^2).
-        for refund_line in refund.lines.all():
+        for refund_line in refund.lines.select_related('order_line'):
             order_line = refund_line.order_line
             modules = get_fulfillment_modules_for_line(order_line)
 
             for module in modules:
                 if module().revoke_line(order_line):
-                    refund_line.set_status(REFUND_LINE.COMPLETE)
+                    revoked_lines.append(refund_line)
                 else:
                     succeeded = False
-                    refund_line.set_status(REFUND_LINE.REVOCATION_ERROR)
+                    failed_lines.append(refund_line)
+
+        refund.lines.model.bulk_set_status(revoked_lines, REFUND_LINE.COMPLETE)
+        refund.lines.model.bulk_set_status(failed_lines, REFUND_LINE.REVOCATION_ERROR)
 
     return succeeded
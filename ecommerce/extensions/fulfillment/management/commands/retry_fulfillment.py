@@ -0,0 +1,161 @@
+"""
+Management command that retries the fulfillment of orders whose lines failed to be fulfilled because of errors which
+may be temporary, such as the LMS being unavailable.
+
+Only the lines which have not been fulfilled are retried. Each order is retried with exponential backoff: the delay
+before each retry doubles, up to a maximum number of retries, after which the order must be fulfilled manually.
+Retries are recorded as notes on the order, which are visible in the dashboard, and from which the backoff is computed.
+"""
+from __future__ import unicode_literals
+import datetime
+import logging
+from multiprocessing.pool import ThreadPool
+
+from django.core.management import BaseCommand
+from django.db import connection
+from django.db.models import Prefetch
+from django.utils import timezone
+from oscar.core.loading import get_class, get_model
+
+from ecommerce.extensions.fulfillment.signals import SHIPPING_EVENT_NAME
+from ecommerce.extensions.fulfillment.status import LINE, ORDER
+
+EventHandler = get_class('order.processing', 'EventHandler')
+Order = get_model('order', 'Order')
+OrderNote = get_model('order', 'OrderNote')
+ShippingEventType = get_model('order', 'ShippingEventType')
+
+logger = logging.getLogger(__name__)
+
+# Statuses of lines which failed to be fulfilled because of errors that may not recur.
+RETRIABLE_LINE_STATUSES = (
+    LINE.FULFILLMENT_NETWORK_ERROR,
+    LINE.FULFILLMENT_TIMEOUT_ERROR,
+    LINE.FULFILLMENT_SERVER_ERROR,
+)
+RETRY_NOTE_TYPE = 'Fulfillment Retry'
+
+
+class Command(BaseCommand):
+    help = 'Retry the fulfillment of orders whose lines failed to be fulfilled because of network or server errors.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('-b', '--batch-size',
+                            action='store',
+                            dest='batch_size',
+                            default=100,
+                            type=int,
+                            help='Number of orders to be retried in each batch.')
+        parser.add_argument('-d', '--base-delay',
+                            action='store',
+                            dest='base_delay',
+                            default=300,
+                            type=int,
+                            help='Number of seconds after which an order is first retried. The delay doubles with '
+                                 'each retry.')
+        parser.add_argument('-r', '--max-retries',
+                            action='store',
+                            dest='max_retries',
+                            default=10,
+                            type=int,
+                            help='Number of retries after which an order is left to be fulfilled manually.')
+        parser.add_argument('-c', '--concurrency',
+                            action='store',
+                            dest='concurrency',
+                            default=4,
+                            type=int,
+                            help='Maximum number of orders fulfilled at once, to limit the load placed on the LMS.')
+        parser.add_argument('--commit',
+                            action='store_true',
+                            dest='commit',
+                            default=False,
+                            help='Actually retry fulfillment.')
+
+    def handle(self, *args, **options):
+        self.base_delay = options['base_delay']
+        self.max_retries = options['max_retries']
+        self.shipping_event_type = None
+        now = timezone.now()
+        statuses = []
+
+        if options['commit']:
+            self.shipping_event_type, __ = ShippingEventType.objects.get_or_create(name=SHIPPING_EVENT_NAME)
+
+            pool = ThreadPool(options['concurrency']) if options['concurrency'] > 1 else None
+            try:
+                for orders in self.get_due_orders(options['batch_size'], now):
+                    if pool:
+                        statuses += pool.map(self.retry_in_thread, orders)
+                    else:
+                        statuses += [self.retry(order) for order in orders]
+            finally:
+                if pool:
+                    pool.close()
+                    pool.join()
+
+            completed = statuses.count(ORDER.COMPLETE)
+            self.stderr.write('Retried the fulfillment of [{count}] orders: [{completed}] completed, [{failed}] '
+                              'failed.'.format(count=len(statuses), completed=completed,
+                                               failed=len(statuses) - completed))
+        else:
+            count = sum(len(orders) for orders in self.get_due_orders(options['batch_size'], now))
+            msg = 'This has been an example operation. If the --commit flag had been included, the command ' \
+                  'would have retried the fulfillment of [{}] orders.'.format(count)
+            self.stderr.write(msg)
+
+    def get_due_orders(self, batch_size, now):
+        """ Yields batches of the orders due to be retried. """
+        ids = Order.objects.filter(
+            status=ORDER.FULFILLMENT_ERROR,
+            lines__status__in=RETRIABLE_LINE_STATUSES
+        ).order_by('id').values_list('id', flat=True).distinct()
+        last_id = 0
+
+        while True:
+            batch = list(ids.filter(id__gt=last_id)[:batch_size])
+            if not batch:
+                break
+
+            last_id = batch[-1]
+            orders = Order.objects.filter(id__in=batch).order_by('id').select_related('user').prefetch_related(
+                Prefetch(
+                    'notes',
+                    queryset=OrderNote.objects.filter(note_type=RETRY_NOTE_TYPE).order_by('date_created'),
+                    to_attr='fulfillment_retries'
+                )
+            )
+            yield [order for order in orders if self.is_due(order, now)]
+
+    def is_due(self, order, now):
+        """ Returns True if the order's backoff has elapsed, and it has not exhausted its retries. """
+        retries = order.fulfillment_retries
+        if len(retries) >= self.max_retries:
+            return False
+
+        last_attempt = retries[-1].date_created if retries else order.date_placed
+        return now >= last_attempt + datetime.timedelta(seconds=self.base_delay * 2 ** len(retries))
+
+    def retry(self, order):
+        """ Fulfills the order's incomplete lines, returning the order's resulting status. """
+        lines = order.lines.exclude(status=LINE.COMPLETE)
+        try:
+            EventHandler().handle_shipping_event(order, self.shipping_event_type, lines,
+                                                 [line.quantity for line in lines])
+        except Exception:  # pylint: disable=broad-except
+            logger.exception('An unexpected error occurred while retrying the fulfillment of order [%s].',
+                             order.number)
+
+        order.notes.create(
+            note_type=RETRY_NOTE_TYPE,
+            message='Fulfillment retry [{retry}] finished with order status [{status}].'.format(
+                retry=len(order.fulfillment_retries) + 1, status=order.status
+            )
+        )
+        return order.status
+
+    def retry_in_thread(self, order):
+        """ Retries the order from a pool thread, closing the thread's database connection when done. """
+        try:
+            return self.retry(order)
+        finally:
+            connection.close()
@@ -322,8 +322,7 @@ class CouponFulfillmentModule(BaseFulfillmentModule):
         """
         logger.info("Attempting to fulfill 'Coupon' product types for order [%s]", order.number)
 
-        for line in lines:
-            line.set_status(LINE.COMPLETE)
+        order.lines.model.bulk_set_status(lines, LINE.COMPLETE)
 
         logger.info("Finished fulfilling 'Coupon' product types for order [%s]", order.number)
         return order, lines
@@ -1,7 +1,9 @@
 """Tests for the Fulfillment API"""
 import ddt
 from django.test.utils import override_settings
+import mock
 from nose.tools import raises
+from oscar.test import factories
 from testfixtures import LogCapture
 
 from ecommerce.extensions.fulfillment import api, exceptions
@@ -51,6 +53,25 @@ class FulfillmentApiTests(FulfillmentTestMixin, TestCase):
         self.assertEquals(ORDER.FULFILLMENT_ERROR, self.order.status)
         self.assertEquals(LINE.FULFILLMENT_CONFIGURATION_ERROR, self.order.lines.all()[0].status)
 
+    @override_settings(FULFILLMENT_MODULES=['ecommerce.extensions.fulfillment.tests.modules.FakeFulfillmentModule', ])
+    def test_fulfill_order_incomplete_lines(self):
+        """ Verify only the lines which have not been fulfilled are fulfilled when re-fulfilling an order. """
+        basket = factories.create_basket(empty=True)
+        for __ in range(2):
+            basket.add_product(factories.create_product(), 1)
+        order = factories.create_order(basket=basket, user=self.create_user())
+        order.set_status(ORDER.FULFILLMENT_ERROR)
+        complete_line, failed_line = order.lines.order_by('id')
+        order.lines.filter(id=complete_line.id).update(status=LINE.COMPLETE)
+        order.lines.filter(id=failed_line.id).update(status=LINE.FULFILLMENT_NETWORK_ERROR)
+
+        with mock.patch.object(FakeFulfillmentModule, 'fulfill_product',
+                               side_effect=FakeFulfillmentModule().fulfill_product) as mock_fulfill:
+            api.fulfill_order(order, order.lines)
+
+        mock_fulfill.assert_called_once_with(order, [failed_line])
+        self.assert_order_fulfilled(order)
+
     @override_settings(FULFILLMENT_MODULES=['ecommerce.extensions.fulfillment.tests.modules.FakeFulfillmentModule',
                                             'ecommerce.extensions.fulfillment.tests.modules.NotARealModule'])
     def test_get_fulfillment_modules(self):
@@ -0,0 +1,99 @@
+from __future__ import unicode_literals
+import datetime
+from StringIO import StringIO
+
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+from oscar.core.loading import get_model
+from oscar.test import factories
+
+from ecommerce.extensions.fulfillment.management.commands.retry_fulfillment import RETRY_NOTE_TYPE
+from ecommerce.extensions.fulfillment.status import LINE, ORDER
+from ecommerce.extensions.fulfillment.tests.mixins import FulfillmentTestMixin
+from ecommerce.tests.testcases import TestCase
+
+Order = get_model('order', 'Order')
+
+
+@override_settings(FULFILLMENT_MODULES=['ecommerce.extensions.fulfillment.tests.modules.FakeFulfillmentModule'])
+class RetryFulfillmentCommandTests(FulfillmentTestMixin, TestCase):
+    command = 'retry_fulfillment'
+
+    def setUp(self):
+        super(RetryFulfillmentCommandTests, self).setUp()
+        self.order = self.create_failed_order(LINE.FULFILLMENT_NETWORK_ERROR)
+
+    def create_failed_order(self, line_status):
+        """ Returns an order whose first line failed to be fulfilled, and whose second line was fulfilled. """
+        basket = factories.create_basket(empty=True)
+        for __ in range(2):
+            basket.add_product(factories.create_product(), 1)
+
+        order = factories.create_order(basket=basket, user=self.create_user(), status=ORDER.FULFILLMENT_ERROR)
+        lines = order.lines.order_by('id')
+        lines.filter(id=lines[0].id).update(status=line_status)
+        lines.filter(id=lines[1].id).update(status=LINE.COMPLETE)
+        return order
+
+    def call_command(self, **kwargs):
+        options = {'base_delay': 0, 'concurrency': 1, 'commit': True}
+        options.update(kwargs)
+        out = StringIO()
+        call_command(self.command, stderr=out, **options)
+        return out.getvalue().strip()
+
+    def test_without_commit(self):
+        """ Verify the command does not fulfill orders if the commit flag is not set. """
+        output = self.call_command(commit=False)
+
+        self.assertEqual(Order.objects.get(id=self.order.id).status, ORDER.FULFILLMENT_ERROR)
+        self.assertFalse(self.order.notes.exists())
+        expected = 'This has been an example operation. If the --commit flag had been included, the command ' \
+                   'would have retried the fulfillment of [1] orders.'
+        self.assertEqual(output, expected)
+
+    def test_with_commit(self):
+        """ Verify the command fulfills the incomplete lines of orders which failed to be fulfilled. """
+        # Orders whose lines cannot be fulfilled without intervention should be ignored.
+        ignored = self.create_failed_order(LINE.FULFILLMENT_CONFIGURATION_ERROR)
+
+        output = self.call_command(batch_size=1)
+
+        self.assert_order_fulfilled(Order.objects.get(id=self.order.id))
+        self.assertEqual(output, 'Retried the fulfillment of [1] orders: [1] completed, [0] failed.')
+
+        note = self.order.notes.get()
+        self.assertEqual(note.note_type, RETRY_NOTE_TYPE)
+        self.assertEqual(note.message, 'Fulfillment retry [1] finished with order status [Complete].')
+        self.assertFalse(ignored.notes.exists())
+
+    @override_settings(FULFILLMENT_MODULES=['ecommerce.extensions.fulfillment.tests.modules.FulfillmentNothingModule'])
+    def test_failure(self):
+        """ Verify failed retries are recorded. """
+        output = self.call_command()
+
+        self.assertEqual(Order.objects.get(id=self.order.id).status, ORDER.FULFILLMENT_ERROR)
+        self.assertEqual(output, 'Retried the fulfillment of [1] orders: [0] completed, [1] failed.')
+        self.assertEqual(
+            self.order.notes.get().message, 'Fulfillment retry [1] finished with order status [Fulfillment Error].'
+        )
+
+    def test_backoff(self):
+        """ Verify orders are only retried once the delay, which doubles with each retry, has elapsed. """
+        self.order.notes.create(note_type=RETRY_NOTE_TYPE, message='Retry')
+        self.order.notes.update(date_created=timezone.now() - datetime.timedelta(seconds=150))
+
+        self.call_command(base_delay=100)
+        self.assertEqual(Order.objects.get(id=self.order.id).status, ORDER.FULFILLMENT_ERROR)
+
+        self.call_command(base_delay=50)
+        self.assertEqual(Order.objects.get(id=self.order.id).status, ORDER.COMPLETE)
+
+    def test_max_retries(self):
+        """ Verify orders are not retried once they have exhausted their retries. """
+        self.order.notes.create(note_type=RETRY_NOTE_TYPE, message='Retry')
+
+        output = self.call_command(max_retries=1)
+        self.assertEqual(Order.objects.get(id=self.order.id).status, ORDER.FULFILLMENT_ERROR)
+        self.assertEqual(output, 'Retried the fulfillment of [0] orders: [0] completed, [0] failed.')
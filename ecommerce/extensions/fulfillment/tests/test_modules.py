@@ -94,16 +94,16 @@ class EnrollmentFulfillmentModuleTests(CourseCatalogTestMixin, FulfillmentTestMi
                 (
                     LOGGER_NAME,
                     'INFO',
-                    'line_fulfilled: course_id="{}", credit_provider="{}", mode="{}", order_line_id="{}", '
-                    'order_number="{}", product_class="{}", user_id="{}"'.format(
-                        line.product.attr.course_key,
-                        None,
-                        mode_for_seat(line.product),
-                        line.id,
-                        line.order.number,
-                        line.product.get_product_class().name,
-                        line.order.user.id,
-                    )
+                    json.dumps({
+                        'event': 'line_fulfilled',
+                        'course_id': line.product.attr.course_key,
+                        'credit_provider': None,
+                        'mode': mode_for_seat(line.product),
+                        'order_line_id': line.id,
+                        'order_number': line.order.number,
+                        'product_class': line.product.get_product_class().name,
+                        'user_id': line.order.user.id,
+                    }, sort_keys=True)
                 )
             )
 
@@ -186,15 +186,15 @@ class EnrollmentFulfillmentModuleTests(CourseCatalogTestMixin, FulfillmentTestMi
                 (
                     LOGGER_NAME,
                     'INFO',
-                    'line_revoked: certificate_type="{}", course_id="{}", order_line_id="{}", order_number="{}", '
-                    'product_class="{}", user_id="{}"'.format(
-                        getattr(line.product.attr, 'certificate_type', ''),
-                        line.product.attr.course_key,
-                        line.id,
-                        line.order.number,
-                        line.product.get_product_class().name,
-                        line.order.user.id
-                    )
+                    json.dumps({
+                        'event': 'line_revoked',
+                        'certificate_type': getattr(line.product.attr, 'certificate_type', ''),
+                        'course_id': line.product.attr.course_key,
+                        'order_line_id': line.id,
+                        'order_number': line.order.number,
+                        'product_class': line.product.get_product_class().name,
+                        'user_id': line.order.user.id,
+                    }, sort_keys=True)
                 )
             )
 
@@ -290,16 +290,16 @@ class EnrollmentFulfillmentModuleTests(CourseCatalogTestMixin, FulfillmentTestMi
                 (
                     LOGGER_NAME,
                     'INFO',
-                    'line_fulfilled: course_id="{}", credit_provider="{}", mode="{}", order_line_id="{}", '
-                    'order_number="{}", product_class="{}", user_id="{}"'.format(
-                        line.product.attr.course_key,
-                        line.product.attr.credit_provider,
-                        mode_for_seat(line.product),
-                        line.id,
-                        line.order.number,
-                        line.product.get_product_class().name,
-                        line.order.user.id,
-                    )
+                    json.dumps({
+                        'event': 'line_fulfilled',
+                        'course_id': line.product.attr.course_key,
+                        'credit_provider': line.product.attr.credit_provider,
+                        'mode': mode_for_seat(line.product),
+                        'order_line_id': line.id,
+                        'order_number': line.order.number,
+                        'product_class': line.product.get_product_class().name,
+                        'user_id': line.order.user.id,
+                    }, sort_keys=True)
                 )
             )
 
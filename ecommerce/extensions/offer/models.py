@@ -1,15 +1,33 @@
 # noinspection PyUnresolvedReferences
 from django.db import models
 from oscar.apps.offer.abstract_models import AbstractRange
+from oscar.core.loading import get_model
 
 
 class Range(AbstractRange):
     catalog = models.ForeignKey('catalogue.Catalog', blank=True, null=True, related_name='ranges')
 
+    _catalog_product_ids_cache = None
+
+    def catalog_product_ids(self):
+        """
+        Returns the IDs of the products in the range's catalog.
+
+        The IDs are retrieved from the cache maintained by get_catalog_product_ids, once per instance.
+        """
+        if not self.catalog_id:
+            return frozenset()
+
+        if self._catalog_product_ids_cache is None:
+            from ecommerce.extensions.catalogue.utils import get_catalog_product_ids
+            self._catalog_product_ids_cache = get_catalog_product_ids(self.catalog_id)
+
+        return self._catalog_product_ids_cache
+
     def contains_product(self, product):
-        if self.catalog:
+        if self.catalog_id:
             return (
-                product.id in self.catalog.stock_records.values_list('product', flat=True) or
+                product.id in self.catalog_product_ids() or
                 super(Range, self).contains_product(product)
             )
         return super(Range, self).contains_product(product)
@@ -20,8 +38,9 @@ class Range(AbstractRange):
         return len(self.all_products())
 
     def all_products(self):
-        if self.catalog:
-            catalog_products = [record.product for record in self.catalog.stock_records.all()]
+        if self.catalog_id:
+            Product = get_model('catalogue', 'Product')
+            catalog_products = list(Product.objects.filter(id__in=self.catalog_product_ids()))
             return catalog_products + list(super(Range, self).all_products())
         return super(Range, self).all_products()
 
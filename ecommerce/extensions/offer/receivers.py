@@ -0,0 +1,49 @@
+from django.db.models.signals import m2m_changed, post_delete, post_init, post_save, pre_save
+from django.dispatch import receiver
+from oscar.core.loading import get_model
+
+from ecommerce.extensions.offer.utils import clear_site_offer_index, flag_usage_update, is_usage_update, record_state
+
+Catalog = get_model('catalogue', 'Catalog')
+Condition = get_model('offer', 'Condition')
+ConditionalOffer = get_model('offer', 'ConditionalOffer')
+Range = get_model('offer', 'Range')
+RangeProduct = get_model('offer', 'RangeProduct')
+Voucher = get_model('voucher', 'Voucher')
+
+
+@receiver(post_init, sender=ConditionalOffer, dispatch_uid='offer.record_offer_state')
+@receiver(post_init, sender=Voucher, dispatch_uid='offer.record_voucher_state')
+def record_offer_state(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """ Record the state of offers and vouchers as they are loaded, so that usage updates can be recognized. """
+    record_state(instance)
+
+
+@receiver(pre_save, sender=ConditionalOffer, dispatch_uid='offer.flag_offer_usage_update')
+@receiver(pre_save, sender=Voucher, dispatch_uid='offer.flag_voucher_usage_update')
+def flag_offer_usage_update(sender, instance, update_fields=None, **kwargs):  # pylint: disable=unused-argument
+    """ Flag saves of offers and vouchers which only record their usage, which need not invalidate any caches. """
+    flag_usage_update(instance, update_fields)
+
+
+@receiver(post_save, sender=ConditionalOffer, dispatch_uid='offer.invalidate_index_on_offer_save')
+def invalidate_site_offer_index_on_offer_save(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """ Clear the site offer index when an offer is modified, unless only its usage was recorded. """
+    if not is_usage_update(instance):
+        clear_site_offer_index()
+
+
+@receiver(post_delete, sender=ConditionalOffer, dispatch_uid='offer.invalidate_index_on_offer_delete')
+@receiver(post_save, sender=Condition, dispatch_uid='offer.invalidate_index_on_condition_save')
+@receiver(post_delete, sender=Condition, dispatch_uid='offer.invalidate_index_on_condition_delete')
+@receiver(post_save, sender=Range, dispatch_uid='offer.invalidate_index_on_range_save')
+@receiver(post_delete, sender=Range, dispatch_uid='offer.invalidate_index_on_range_delete')
+@receiver(post_save, sender=RangeProduct, dispatch_uid='offer.invalidate_index_on_range_product_save')
+@receiver(post_delete, sender=RangeProduct, dispatch_uid='offer.invalidate_index_on_range_product_delete')
+@receiver(m2m_changed, sender=Range.classes.through, dispatch_uid='offer.invalidate_index_on_range_classes_change')
+@receiver(m2m_changed, sender=Range.included_categories.through,
+          dispatch_uid='offer.invalidate_index_on_range_categories_change')
+@receiver(m2m_changed, sender=Catalog.stock_records.through, dispatch_uid='offer.invalidate_index_on_catalog_change')
+def invalidate_site_offer_index(sender, **kwargs):  # pylint: disable=unused-argument
+    """ Clear the site offer index when any offer, condition, range or catalog is modified. """
+    clear_site_offer_index()
@@ -1,3 +1,4 @@
+from django.core.cache import cache
 from oscar.core.loading import get_model
 from oscar.test import factories
 
@@ -5,11 +6,13 @@ from ecommerce.tests.testcases import TestCase
 
 
 Catalog = get_model('catalogue', 'Catalog')
+Range = get_model('offer', 'Range')
 
 
 class RangeTests(TestCase):
     def setUp(self):
         super(RangeTests, self).setUp()
+        cache.clear()
 
         self.range = factories.RangeFactory()
         self.range_with_catalog = factories.RangeFactory()
@@ -49,3 +52,27 @@ class RangeTests(TestCase):
 
         self.assertIn(self.product, self.range_with_catalog.all_products())
         self.assertEqual(len(self.range_with_catalog.all_products()), 1)
+
+    def test_catalog_membership_cached(self):
+        """ Verify membership of catalog-backed ranges is checked against the cached product IDs of the catalog. """
+        self.range_with_catalog.save()
+        self.assertEqual(self.range_with_catalog.catalog_product_ids(), {self.product.id})
+
+        product_range = Range.objects.get(id=self.range_with_catalog.id)
+        with self.assertNumQueries(0):
+            self.assertTrue(product_range.contains_product(self.product))
+
+    def test_catalog_membership_synchronized(self):
+        """ Verify the cached product IDs are updated when the catalog's stock records are modified. """
+        self.assertTrue(self.range_with_catalog.contains_product(self.product))
+        product = factories.create_product()
+        stock_record = factories.create_stockrecord(product, num_in_stock=2)
+
+        stock_record.catalogs.add(self.catalog)
+        self.assertEqual(Range(catalog=self.catalog).catalog_product_ids(), {self.product.id, product.id})
+
+        self.catalog.stock_records.remove(self.stock_record)
+        self.assertEqual(Range(catalog=self.catalog).catalog_product_ids(), {product.id})
+
+        stock_record.delete()
+        self.assertEqual(Range(catalog=self.catalog).catalog_product_ids(), set())
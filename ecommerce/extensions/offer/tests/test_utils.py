@@ -0,0 +1,114 @@
+from django.core.cache import cache
+import mock
+from oscar.core.loading import get_class, get_model
+from oscar.test import factories
+from oscar.test.newfactories import BasketFactory
+
+from ecommerce.courses.models import Course
+from ecommerce.extensions.offer.utils import get_site_offer_index
+from ecommerce.tests.testcases import TestCase
+
+Applicator = get_class('offer.utils', 'Applicator')
+Catalog = get_model('catalogue', 'Catalog')
+ConditionalOffer = get_model('offer', 'ConditionalOffer')
+
+
+class ApplicatorTests(TestCase):
+    def setUp(self):
+        super(ApplicatorTests, self).setUp()
+        cache.clear()
+
+        self.product = factories.create_product(price=10)
+        self.catalog_product = factories.create_product(price=20)
+        self.other_product = factories.create_product(price=30, product_class='Other')
+
+        self.catalog = Catalog.objects.create(partner=self.partner)
+        self.catalog.stock_records.add(self.catalog_product.stockrecords.first())
+
+        self.product_offer = self.create_offer(factories.RangeFactory(products=[self.product]))
+        self.catalog_offer = self.create_offer(factories.RangeFactory(catalog=self.catalog))
+        self.class_offer = self.create_offer(factories.RangeFactory())
+        self.class_offer.condition.range.classes.add(self.other_product.product_class)
+        self.global_offer = self.create_offer(factories.RangeFactory(includes_all_products=True))
+
+    def create_offer(self, product_range):
+        return factories.ConditionalOfferFactory(
+            name=product_range.name,
+            offer_type=ConditionalOffer.SITE,
+            condition=factories.ConditionFactory(range=product_range)
+        )
+
+    def create_basket(self, *products):
+        basket = BasketFactory()
+        for product in products:
+            basket.add_product(product)
+        return basket
+
+    def test_get_site_offer_index(self):
+        """ Verify offers are indexed by the products and product classes in the ranges of their conditions. """
+        index = get_site_offer_index()
+        self.assertEqual(index['global'], {self.global_offer.id})
+        self.assertEqual(index['products'], {
+            self.product.id: {self.product_offer.id},
+            self.catalog_product.id: {self.catalog_offer.id},
+        })
+        self.assertEqual(index['classes'], {self.other_product.product_class_id: {self.class_offer.id}})
+
+    def test_get_site_offer_index_custom_condition(self):
+        """ Verify offers with custom conditions are indexed as global offers, even if their conditions have ranges. """
+        offer = self.create_offer(factories.RangeFactory(products=[self.product]))
+        offer.condition.proxy_class = 'oscar.apps.offer.conditions.CountCondition'
+        offer.condition.save()
+
+        index = get_site_offer_index()
+        self.assertEqual(index['global'], {self.global_offer.id, offer.id})
+        self.assertEqual(index['products'][self.product.id], {self.product_offer.id})
+
+        basket = self.create_basket(self.other_product)
+        self.assertIn(offer, Applicator().get_site_offers(basket))
+
+    def test_get_site_offers(self):
+        """ Verify only the site offers which may apply to the basket's products are returned. """
+        applicator = Applicator()
+        self.assertEqual(set(applicator.get_site_offers()), set(ConditionalOffer.objects.all()))
+
+        basket = self.create_basket(self.product)
+        self.assertEqual(set(applicator.get_site_offers(basket)), {self.product_offer, self.global_offer})
+
+        basket = self.create_basket(self.catalog_product, self.other_product)
+        self.assertEqual(
+            set(applicator.get_offers(basket)),
+            {self.catalog_offer, self.class_offer, self.global_offer}
+        )
+
+    def test_get_site_offers_child_product(self):
+        """ Verify offers whose ranges contain the class of a child product's parent apply to the child. """
+        seat = Course.objects.create(id='org/course/run').create_or_update_seat('verified', True, 50, self.partner)
+        self.assertIsNone(seat.product_class_id)
+        self.class_offer.condition.range.classes.add(seat.parent.product_class)
+
+        basket = self.create_basket(seat)
+        self.assertEqual(set(Applicator().get_site_offers(basket)), {self.class_offer, self.global_offer})
+
+    def test_index_retained_on_usage(self):
+        """ Verify the index is not rebuilt when only the usage of an offer is recorded. """
+        get_site_offer_index()
+
+        with mock.patch('ecommerce.extensions.offer.utils._build_site_offer_index') as mock_build:
+            self.product_offer.record_usage({'freq': 1, 'discount': 10})
+            get_site_offer_index()
+            self.assertFalse(mock_build.called)
+
+    def test_index_invalidated(self):
+        """ Verify the index is rebuilt when offers, ranges and catalogs are modified. """
+        get_site_offer_index()
+
+        self.catalog.stock_records.add(self.other_product.stockrecords.first())
+        self.assertEqual(get_site_offer_index()['products'][self.other_product.id], {self.catalog_offer.id})
+
+        self.product_offer.condition.range.remove_product(self.product)
+        self.assertNotIn(self.product.id, get_site_offer_index()['products'])
+
+        self.global_offer.status = ConditionalOffer.SUSPENDED
+        self.global_offer.save()
+        self.assertEqual(get_site_offer_index()['global'], set())
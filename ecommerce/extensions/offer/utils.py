@@ -0,0 +1,169 @@
+"""Offer Utility Classes. """
+from itertools import chain
+
+from django.conf import settings
+from django.core.cache import cache
+from oscar.apps.offer.applicator import Applicator as OscarApplicator
+from oscar.core.loading import get_model
+
+ConditionalOffer = get_model('offer', 'ConditionalOffer')
+
+SITE_OFFER_INDEX_CACHE_KEY = 'site_offer_index'
+
+# Counters of offers and vouchers which are updated whenever they are used. Changes to them alone do not affect which
+# offers apply, or what they apply to, so cached offer data need not be invalidated when only they are saved.
+USAGE_FIELDS = ('num_orders', 'num_applications', 'total_discount', 'num_basket_additions')
+
+
+def get_site_offer_index():
+    """
+    Returns an index of the open site offers which may apply to a given product.
+
+    Offers are indexed by the products and product classes in the ranges of their conditions, since a condition
+    cannot be satisfied by a basket containing none of them. Offers whose ranges cannot be enumerated (e.g. ranges
+    including all products, or backed by a proxy class or categories) apply to every basket. Products are indexed
+    without their children; the parent of each basket product is looked up as well.
+
+    The index is cached, and invalidated by the receivers in ecommerce.extensions.offer.receivers whenever an offer,
+    condition, range or catalog is modified. Offer dates are not indexed, and must be checked by the caller.
+
+    Returns:
+        dict: Sets of offer IDs keyed by product ID ('products') and by product class ID ('classes'), and a set of
+            IDs of offers applying to all baskets ('global').
+    """
+    index = cache.get(SITE_OFFER_INDEX_CACHE_KEY)
+    if index is None:
+        index = _build_site_offer_index()
+        cache.set(SITE_OFFER_INDEX_CACHE_KEY, index, settings.SITE_OFFER_INDEX_CACHE_TIMEOUT)
+
+    return index
+
+
+def clear_site_offer_index():
+    """ Removes the cached site offer index. """
+    cache.delete(SITE_OFFER_INDEX_CACHE_KEY)
+
+
+def record_state(instance):
+    """ Records the fields, other than usage counters, of an offer or voucher, as loaded or last saved. """
+    instance._recorded_state = _get_state(instance)  # pylint: disable=protected-access
+
+
+def flag_usage_update(instance, update_fields=None):
+    """
+    Flags whether the offer or voucher about to be saved has been modified other than by recording its usage, e.g. by
+    ConditionalOffer.record_usage or Voucher.record_usage. Called before the instance is saved; see is_usage_update.
+
+    Arguments:
+        instance (ConditionalOffer or Voucher): The instance about to be saved.
+        update_fields (frozenset): Names of the fields to be saved, or None if all of them are.
+    """
+    if update_fields is not None:
+        usage_update = set(update_fields).issubset(USAGE_FIELDS)
+    else:
+        usage_update = (
+            not instance._state.adding and  # pylint: disable=protected-access
+            getattr(instance, '_recorded_state', None) == _get_state(instance)
+        )
+
+    instance._usage_update = usage_update  # pylint: disable=protected-access
+    record_state(instance)
+
+
+def is_usage_update(instance):
+    """ Returns True if the last save of the offer or voucher only updated its usage counters. """
+    return getattr(instance, '_usage_update', False)
+
+
+def _get_state(instance):
+    # Deferred fields are not loaded, so that recording the state does not require any queries.
+    return tuple(
+        instance.__dict__.get(field.attname)
+        for field in instance._meta.concrete_fields  # pylint: disable=protected-access
+        if field.name not in USAGE_FIELDS
+    )
+
+
+def _build_site_offer_index():
+    index = {'global': set(), 'products': {}, 'classes': {}}
+    offers = ConditionalOffer.objects.filter(
+        offer_type=ConditionalOffer.SITE,
+        status=ConditionalOffer.OPEN
+    ).select_related('condition__range')
+
+    # Offers frequently share ranges, so the members of each range are only retrieved once.
+    ranges = {}
+    for offer in offers:
+        product_range = offer.condition.range
+        if product_range is None or offer.condition.proxy_class:
+            # Custom conditions need not be tied to a range, nor limited to the range they have.
+            index['global'].add(offer.id)
+            continue
+
+        if product_range.id not in ranges:
+            ranges[product_range.id] = _get_range_members(product_range)
+
+        members = ranges[product_range.id]
+        if members is None:
+            index['global'].add(offer.id)
+            continue
+
+        product_ids, class_ids = members
+        for product_id in product_ids:
+            index['products'].setdefault(product_id, set()).add(offer.id)
+        for class_id in class_ids:
+            index['classes'].setdefault(class_id, set()).add(offer.id)
+
+    return index
+
+
+def _get_range_members(product_range):
+    """ Returns the IDs of the products and product classes in the range, or None if they cannot be enumerated. """
+    if product_range.proxy_class or product_range.includes_all_products or product_range.included_categories.exists():
+        return None
+
+    product_ids = set(product_range.included_products.values_list('id', flat=True))
+    product_ids.update(product_range.catalog_product_ids())
+
+    return product_ids, set(product_range.classes.values_list('id', flat=True))
+
+
+class Applicator(OscarApplicator):
+    """ Applicator which only loads the site offers which may apply to the basket's products. """
+
+    def get_offers(self, basket, user=None, request=None):
+        site_offers = self.get_site_offers(basket)
+        basket_offers = self.get_basket_offers(basket, user)
+        user_offers = self.get_user_offers(user)
+        session_offers = self.get_session_offers(request)
+
+        return list(sorted(chain(
+            session_offers, basket_offers, user_offers, site_offers),
+            key=lambda o: o.priority, reverse=True))
+
+    def get_site_offers(self, basket=None):  # pylint: disable=arguments-differ
+        """
+        Return site offers that are available to all users
+
+        If a basket is provided, only the offers which may apply to its products, according to the site offer index,
+        are returned.
+        """
+        offers = super(Applicator, self).get_site_offers()
+        if basket is None:
+            return offers
+
+        index = get_site_offer_index()
+        offer_ids = set(index['global'])
+        for line in basket.all_lines():
+            product = line.product
+            for product_id in (product.id, product.parent_id):
+                offer_ids.update(index['products'].get(product_id, ()))
+            # Child products, such as seats, have no class of their own, and belong to that of their parent. Only
+            # the class ID is needed, so the class itself is not loaded, as by get_product_class.
+            product_class_id = product.parent.product_class_id if product.is_child else product.product_class_id
+            offer_ids.update(index['classes'].get(product_class_id, ()))
+
+        if not offer_ids:
+            return offers.none()
+
+        return offers.filter(id__in=offer_ids)
@@ -0,0 +1,210 @@
+"""
+Exports of orders, with their lines, payment sources and refunds, for financial reconciliation.
+
+Orders are loaded in batches, with their relations prefetched, and serialized one at a time, so the memory used by an
+export does not depend on the number of orders exported. Exports are produced as an iterator of strings, which can be
+streamed to a client or written to a file.
+"""
+from __future__ import unicode_literals
+import csv
+from decimal import Decimal
+import itertools
+import json
+
+from dateutil.parser import parse
+from django.utils import timezone
+from oscar.core.loading import get_model
+import pytz
+
+from ecommerce.extensions.refund.status import REFUND
+
+Order = get_model('order', 'Order')
+
+CSV = 'csv'
+JSON_LINES = 'jsonl'
+EXPORT_FORMATS = (CSV, JSON_LINES)
+ZERO = Decimal('0.00')
+
+# Refunds whose credit has been issued to the customer.
+CREDITED_REFUND_STATUSES = (REFUND.PAYMENT_REFUNDED, REFUND.REVOCATION_ERROR, REFUND.COMPLETE)
+
+# Each row of a CSV export describes a single order line. The order fields are repeated on every line of the order.
+CSV_FIELDS = (
+    'order_number', 'date_placed', 'username', 'order_status', 'currency', 'total_excl_tax', 'payment_processors',
+    'amount_debited', 'amount_refunded', 'line_id', 'product_id', 'partner_sku', 'title', 'quantity',
+    'line_price_excl_tax', 'line_status', 'refunded_quantity', 'refunded_credit_excl_tax',
+)
+
+
+def parse_date(value):
+    """ Parses an ISO 8601 date or time, which is UTC unless it specifies an offset. Raises ValueError if invalid. """
+    value = parse(value)
+    if timezone.is_naive(value):
+        value = timezone.make_aware(value, pytz.utc)
+
+    return value
+
+
+def iter_orders(start, end, batch_size=500):
+    """
+    Yields the orders placed within the given range, in order of ID.
+
+    Arguments:
+        start (datetime): Orders placed at or after this time are included.
+        end (datetime): Orders placed before this time are included.
+        batch_size (int): Number of orders loaded, with their relations, by each query.
+    """
+    ids = Order.objects.filter(
+        date_placed__gte=start, date_placed__lt=end
+    ).order_by('id').values_list('id', flat=True).iterator()
+
+    while True:
+        batch = list(itertools.islice(ids, batch_size))
+        if not batch:
+            break
+
+        orders = Order.objects.filter(id__in=batch).order_by('id').select_related('user').prefetch_related(
+            'lines', 'sources__source_type', 'refunds__lines'
+        )
+        for order in orders:
+            yield order
+
+
+def serialize_order(order):
+    """ Serialize an order, its lines, payment sources and refunds for export.
+
+    Arguments:
+        order (Order): Order to serialize. Its user should be selected, and its lines, sources (with source types)
+            and refunds (with lines) should be prefetched.
+
+    Returns:
+        dict
+    """
+    def _isoformat(value):
+        return value.isoformat() if value else None
+
+    def _decimal(value):
+        return None if value is None else unicode(value)
+
+    return {
+        'number': order.number,
+        'date_placed': _isoformat(order.date_placed),
+        'username': order.user.username if order.user else None,
+        'status': order.status,
+        'currency': order.currency,
+        'total_excl_tax': _decimal(order.total_excl_tax),
+        'lines': [
+            {
+                'id': line.id,
+                'product_id': line.product_id,
+                'partner_sku': line.partner_sku,
+                'title': line.title,
+                'quantity': line.quantity,
+                'line_price_excl_tax': _decimal(line.line_price_excl_tax),
+                'status': line.status,
+            }
+            for line in order.lines.all()
+        ],
+        'sources': [
+            {
+                'processor': source.source_type.name,
+                'reference': source.reference,
+                'currency': source.currency,
+                'amount_allocated': _decimal(source.amount_allocated),
+                'amount_debited': _decimal(source.amount_debited),
+                'amount_refunded': _decimal(source.amount_refunded),
+            }
+            for source in order.sources.all()
+        ],
+        'refunds': [
+            {
+                'id': refund.id,
+                'status': refund.status,
+                'created': _isoformat(refund.created),
+                'total_credit_excl_tax': _decimal(refund.total_credit_excl_tax),
+                'lines': [
+                    {
+                        'order_line_id': refund_line.order_line_id,
+                        'quantity': refund_line.quantity,
+                        'line_credit_excl_tax': _decimal(refund_line.line_credit_excl_tax),
+                        'status': refund_line.status,
+                    }
+                    for refund_line in refund.lines.all()
+                ],
+            }
+            for refund in order.refunds.all()
+        ],
+    }
+
+
+def get_csv_rows(order):
+    """ Returns the CSV rows, as dicts keyed by the names in CSV_FIELDS, describing the lines of an order. """
+    data = serialize_order(order)
+    sources = order.sources.all()
+    refund_lines = [
+        refund_line
+        for refund in order.refunds.all() if refund.status in CREDITED_REFUND_STATUSES
+        for refund_line in refund.lines.all()
+    ]
+
+    rows = []
+    for line in data['lines']:
+        credited = [refund_line for refund_line in refund_lines if refund_line.order_line_id == line['id']]
+        rows.append({
+            'order_number': data['number'],
+            'date_placed': data['date_placed'],
+            'username': data['username'],
+            'order_status': data['status'],
+            'currency': data['currency'],
+            'total_excl_tax': data['total_excl_tax'],
+            'payment_processors': ';'.join(source['processor'] for source in data['sources']),
+            'amount_debited': unicode(sum((source.amount_debited for source in sources), ZERO)),
+            'amount_refunded': unicode(sum((source.amount_refunded for source in sources), ZERO)),
+            'line_id': line['id'],
+            'product_id': line['product_id'],
+            'partner_sku': line['partner_sku'],
+            'title': line['title'],
+            'quantity': line['quantity'],
+            'line_price_excl_tax': line['line_price_excl_tax'],
+            'line_status': line['status'],
+            'refunded_quantity': sum(refund_line.quantity for refund_line in credited),
+            'refunded_credit_excl_tax': unicode(
+                sum((refund_line.line_credit_excl_tax for refund_line in credited), ZERO)
+            ),
+        })
+
+    return rows
+
+
+class _Echo(object):
+    """ File-like object which returns, rather than stores, the values written to it. """
+
+    def write(self, value):
+        return value
+
+
+def export_orders(orders, export_format):
+    """
+    Yields the given orders, serialized in the given format, as strings. CSV values are encoded as UTF-8.
+
+    CSV exports start with a header row, and contain a row for each order line. JSON-lines exports contain a line,
+    holding the output of `serialize_order`, for each order.
+
+    Arguments:
+        orders (iterable): Orders to be exported, with their relations loaded as by `iter_orders`.
+        export_format (str): One of EXPORT_FORMATS.
+    """
+    if export_format == CSV:
+        writer = csv.DictWriter(_Echo(), fieldnames=CSV_FIELDS)
+        yield writer.writerow({field: field for field in CSV_FIELDS})
+
+        for order in orders:
+            for row in get_csv_rows(order):
+                yield writer.writerow({
+                    field: '' if value is None else unicode(value).encode('utf-8') for field, value in row.items()
+                })
+    elif export_format == JSON_LINES:
+        for order in orders:
+            yield json.dumps(serialize_order(order), sort_keys=True) + '\n'
+    else:
+        raise ValueError('Unsupported export format [{}].'.format(export_format))
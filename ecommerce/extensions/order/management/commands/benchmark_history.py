@@ -0,0 +1,79 @@
+"""
+Management command that measures the rate at which order line changes, and their history, can be written.
+
+Lines are changed in three ways: saved one at a time, with each historical record written as the line is saved;
+saved one at a time, with the historical records deferred and written together; and updated together with
+`bulk_update`. All data created by the benchmark is rolled back.
+"""
+from __future__ import unicode_literals
+import time
+import uuid
+
+from django.core.management import BaseCommand
+from django.db import transaction
+from django.test import override_settings
+from oscar.core.loading import get_model
+
+from ecommerce.core.history import bulk_update, deferred_history
+
+Line = get_model('order', 'Line')
+Order = get_model('order', 'Order')
+
+MODES = ('immediate', 'deferred', 'bulk')
+
+
+class Command(BaseCommand):
+    help = 'Measure the number of order line changes, with their history, which can be written per second.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('-n', '--lines',
+                            action='store',
+                            dest='lines',
+                            default=1000,
+                            type=int,
+                            help='Number of lines to change in each mode.')
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            order = Order.objects.create(number='benchmark-{}'.format(uuid.uuid4().hex[:20]), total_incl_tax=0,
+                                         total_excl_tax=0)
+            lines = [self.create_line(order) for __ in range(options['lines'])]
+
+            for mode in MODES:
+                self.stderr.write('Changing [{}] lines in [{}] mode...'.format(options['lines'], mode))
+                elapsed = self.benchmark(lines, mode)
+                msg = 'Changed [{count}] lines in [{elapsed:.3f}] seconds ([{rate:.1f}] per second).'
+                self.stderr.write(msg.format(count=options['lines'], elapsed=elapsed, rate=options['lines'] / elapsed))
+
+            transaction.set_rollback(True)
+
+        self.stderr.write('Done.')
+
+    def create_line(self, order):
+        return Line.objects.create(
+            order=order,
+            partner_name='Benchmark',
+            partner_sku='BENCHMARK',
+            title='Benchmark',
+            quantity=1,
+            line_price_incl_tax=0,
+            line_price_excl_tax=0,
+            line_price_before_discounts_incl_tax=0,
+            line_price_before_discounts_excl_tax=0
+        )
+
+    def benchmark(self, lines, mode):
+        """ Change the status of the given lines in the given mode, and return the number of seconds taken. """
+        status = 'Benchmark ({})'.format(mode)
+
+        start = time.time()
+        if mode == 'bulk':
+            bulk_update(lines, status=status)
+        else:
+            with override_settings(HISTORY_DEFERRED_MODELS=('order.Line',) if mode == 'deferred' else ()):
+                with deferred_history():
+                    for line in lines:
+                        line.status = status
+                        line.save()
+
+        return time.time() - start
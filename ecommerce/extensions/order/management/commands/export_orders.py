@@ -0,0 +1,80 @@
+"""
+Management command that exports the orders placed within a date range to a compressed file, for reconciliation.
+
+Orders are exported with their lines, payment sources and refunds, as CSV or JSON lines. See
+`ecommerce.extensions.order.exports` for the contents of each format.
+"""
+from __future__ import unicode_literals
+import gzip
+import os
+
+from django.core.management import BaseCommand, CommandError
+
+from ecommerce.extensions.order import exports
+
+
+class Command(BaseCommand):
+    help = 'Export the orders placed within a date range, with their lines, payment sources and refunds.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--start',
+                            action='store',
+                            dest='start',
+                            default=None,
+                            help='ISO 8601 date or time (UTC, unless an offset is given) at or after which orders '
+                                 'were placed.')
+        parser.add_argument('--end',
+                            action='store',
+                            dest='end',
+                            default=None,
+                            help='ISO 8601 date or time (UTC, unless an offset is given) before which orders were '
+                                 'placed.')
+        parser.add_argument('-f', '--format',
+                            action='store',
+                            dest='export_format',
+                            default=exports.CSV,
+                            choices=exports.EXPORT_FORMATS,
+                            help='Format of the export file.')
+        parser.add_argument('-o', '--output-dir',
+                            action='store',
+                            dest='output_dir',
+                            default='.',
+                            help='Directory to which the export file should be written.')
+        parser.add_argument('-b', '--batch-size',
+                            action='store',
+                            dest='batch_size',
+                            default=500,
+                            type=int,
+                            help='Number of orders to be loaded, with their lines, sources and refunds, at a time.')
+
+    def handle(self, *args, **options):
+        if not (options['start'] and options['end']):
+            raise CommandError('Both the --start and --end of the date range are required.')
+
+        start = self.parse_date(options['start'])
+        end = self.parse_date(options['end'])
+        if start >= end:
+            raise CommandError('The start of the date range must precede its end.')
+
+        path = os.path.join(
+            options['output_dir'],
+            'orders-{start}-{end}.{extension}.gz'.format(
+                start=start.strftime('%Y%m%dT%H%M%S'), end=end.strftime('%Y%m%dT%H%M%S'),
+                extension=options['export_format']
+            )
+        )
+        self.stderr.write('Exporting orders placed from [{start}] to [{end}] to [{path}]...'.format(
+            start=start.isoformat(), end=end.isoformat(), path=path))
+
+        orders = exports.iter_orders(start, end, batch_size=options['batch_size'])
+        with gzip.open(path, 'wb') as export_file:
+            for chunk in exports.export_orders(orders, options['export_format']):
+                export_file.write(chunk)
+
+        self.stderr.write('Done.')
+
+    def parse_date(self, value):
+        try:
+            return exports.parse_date(value)
+        except ValueError:
+            raise CommandError('[{}] is not an ISO 8601 date or time.'.format(value))
@@ -1,14 +1,15 @@
 # noinspection PyUnresolvedReferences
 from django.db import models
 from django.utils.translation import ugettext_lazy as _
+from oscar.apps.order import exceptions
 from oscar.apps.order.abstract_models import AbstractOrder, AbstractPaymentEvent, AbstractLine
-from simple_history.models import HistoricalRecords
 
+from ecommerce.core.history import bulk_update, DeferrableHistoricalRecords
 from ecommerce.extensions.fulfillment.status import ORDER
 
 
 class Order(AbstractOrder):
-    history = HistoricalRecords()
+    history = DeferrableHistoricalRecords()
 
     @property
     def is_fulfillable(self):
@@ -21,7 +22,24 @@ class PaymentEvent(AbstractPaymentEvent):
 
 
 class Line(AbstractLine):
-    history = HistoricalRecords()
+    history = DeferrableHistoricalRecords()
+
+    @classmethod
+    def bulk_set_status(cls, lines, new_status):
+        """
+        Set a new status for each of the given lines, with a single UPDATE.
+
+        As with `set_status`, lines which already have the new status are left unchanged. If the new status is not
+        valid for any of the other lines, ``InvalidLineStatus`` is raised, and none of the lines are updated.
+        """
+        lines = [line for line in lines if line.status != new_status]
+        for line in lines:
+            if new_status not in line.available_statuses():
+                raise exceptions.InvalidLineStatus(
+                    _("'%(new_status)s' is not a valid status (current status: '%(status)s')")
+                    % {'new_status': new_status, 'status': line.status})
+
+        bulk_update(lines, status=new_status)
 
 
 # If two models with the same name are declared within an app, Django will only use the first one.
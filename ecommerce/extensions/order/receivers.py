@@ -0,0 +1,21 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from oscar.core.loading import get_model
+
+from ecommerce.core.models import SiteConfiguration
+from ecommerce.extensions.order.utils import clear_partner_short_code_cache
+
+Partner = get_model('partner', 'Partner')
+
+
+@receiver(post_save, sender=SiteConfiguration, dispatch_uid='order.invalidate_site_short_code')
+@receiver(post_delete, sender=SiteConfiguration, dispatch_uid='order.invalidate_site_short_code_on_delete')
+def invalidate_site_short_code(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """ Remove the cached Partner short code for the modified SiteConfiguration's Site. """
+    clear_partner_short_code_cache(instance.site_id)
+
+
+@receiver(post_save, sender=Partner, dispatch_uid='order.invalidate_partner_short_codes')
+def invalidate_partner_short_codes(sender, **kwargs):  # pylint: disable=unused-argument
+    """ Remove all cached Partner short codes, since any number of Sites may point to the modified Partner. """
+    clear_partner_short_code_cache()
@@ -0,0 +1,88 @@
+from __future__ import unicode_literals
+import datetime
+import gzip
+import json
+import os
+import shutil
+from StringIO import StringIO
+import tempfile
+
+from django.core.management import call_command, CommandError
+from oscar.core.loading import get_model
+from oscar.test import factories
+
+from ecommerce.extensions.order import exports
+from ecommerce.tests.testcases import TestCase
+
+Line = get_model('order', 'Line')
+Order = get_model('order', 'Order')
+
+
+class BenchmarkHistoryCommandTests(TestCase):
+    command = 'benchmark_history'
+
+    def test_benchmark(self):
+        """ Verify lines are changed in each mode, and all data created by the benchmark is rolled back. """
+        err = StringIO()
+        call_command(self.command, lines=2, stderr=err)
+
+        output = err.getvalue()
+        for mode in ('immediate', 'deferred', 'bulk'):
+            self.assertIn('Changing [2] lines in [{}] mode...'.format(mode), output)
+        self.assertEqual(output.count('per second'), 3)
+        self.assertTrue(output.endswith('Done.\n'))
+
+        for model in (Line, Line.history.model, Order):
+            self.assertFalse(model.objects.exists())
+
+
+class ExportOrdersCommandTests(TestCase):
+    command = 'export_orders'
+
+    def setUp(self):
+        super(ExportOrdersCommandTests, self).setUp()
+        self.order = factories.create_order()
+        self.output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.output_dir)
+
+    def call_command(self, **kwargs):
+        options = {
+            'start': (self.order.date_placed - datetime.timedelta(days=1)).isoformat(),
+            'end': (self.order.date_placed + datetime.timedelta(days=1)).isoformat(),
+            'output_dir': self.output_dir,
+        }
+        options.update(kwargs)
+        call_command(self.command, stderr=StringIO(), **options)
+
+    def read_export(self):
+        filenames = os.listdir(self.output_dir)
+        self.assertEqual(len(filenames), 1)
+        with gzip.open(os.path.join(self.output_dir, filenames[0]), 'rb') as export_file:
+            return filenames[0], export_file.read()
+
+    def test_export_csv(self):
+        """ Verify the orders placed within the range are written to a compressed CSV file. """
+        self.call_command()
+
+        filename, content = self.read_export()
+        self.assertTrue(filename.endswith('.csv.gz'))
+        lines = content.splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertIn(self.order.number, lines[1])
+
+    def test_export_json_lines(self):
+        """ Verify the orders placed within the range are written to a compressed JSON-lines file. """
+        self.call_command(export_format=exports.JSON_LINES)
+
+        filename, content = self.read_export()
+        self.assertTrue(filename.endswith('.jsonl.gz'))
+        self.assertEqual([json.loads(line)['number'] for line in content.splitlines()], [self.order.number])
+
+    def test_invalid_range(self):
+        """ Verify the command fails if the date range is missing, malformed or empty. """
+        date_placed = self.order.date_placed.isoformat()
+        for options in ({'start': None}, {'end': 'not-a-date'}, {'start': date_placed, 'end': date_placed}):
+            with self.assertRaises(CommandError):
+                self.call_command(**options)
+
+        self.assertEqual(os.listdir(self.output_dir), [])
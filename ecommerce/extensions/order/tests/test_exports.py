@@ -0,0 +1,117 @@
+from __future__ import unicode_literals
+import csv
+import datetime
+from decimal import Decimal
+import json
+from StringIO import StringIO
+
+from django.utils import timezone
+from oscar.core.loading import get_model
+from oscar.test import factories
+
+from ecommerce.extensions.order import exports
+from ecommerce.extensions.refund.status import REFUND
+from ecommerce.extensions.refund.tests.factories import RefundFactory
+from ecommerce.tests.testcases import TestCase
+
+Order = get_model('order', 'Order')
+Source = get_model('payment', 'Source')
+SourceType = get_model('payment', 'SourceType')
+
+
+class ExportTests(TestCase):
+    def setUp(self):
+        super(ExportTests, self).setUp()
+        self.refund = RefundFactory(status=REFUND.COMPLETE)
+        self.order = self.refund.order
+        source_type, __ = SourceType.objects.get_or_create(name='cybersource')
+        Source.objects.create(source_type=source_type, order=self.order, currency=self.order.currency,
+                              amount_allocated=self.order.total_excl_tax, amount_debited=self.order.total_excl_tax,
+                              amount_refunded=self.refund.total_credit_excl_tax, reference='ref-1')
+
+        self.start = self.order.date_placed - datetime.timedelta(minutes=1)
+        self.end = self.order.date_placed + datetime.timedelta(minutes=1)
+
+    def load_order(self):
+        return next(exports.iter_orders(self.start, self.end))
+
+    def test_iter_orders(self):
+        """ Verify only the orders placed within the range are yielded, in order of ID, in batches. """
+        orders = [self.order, factories.create_order(), factories.create_order()]
+        Order.objects.filter(id=orders[1].id).update(date_placed=self.end)
+        self.end = timezone.now() + datetime.timedelta(minutes=1)
+        Order.objects.filter(id=orders[2].id).update(date_placed=self.end)
+
+        self.assertEqual(list(exports.iter_orders(self.start, self.end, batch_size=1)), orders[:2])
+
+    def test_iter_orders_num_queries(self):
+        """ Verify the relations of each batch of orders are loaded together. """
+        orders = list(exports.iter_orders(self.start, self.end))
+        with self.assertNumQueries(0):
+            for order in orders:
+                exports.serialize_order(order)
+
+    def test_serialize_order(self):
+        """ Verify the order, its lines, payment sources and refunds are serialized. """
+        line = self.order.lines.get()
+        refund_line = self.refund.lines.get()
+        data = exports.serialize_order(self.load_order())
+
+        self.assertEqual(data['number'], self.order.number)
+        self.assertEqual(data['username'], self.order.user.username)
+        self.assertEqual(data['total_excl_tax'], unicode(self.order.total_excl_tax))
+        self.assertEqual(data['lines'], [{
+            'id': line.id,
+            'product_id': line.product_id,
+            'partner_sku': line.partner_sku,
+            'title': line.title,
+            'quantity': line.quantity,
+            'line_price_excl_tax': unicode(line.line_price_excl_tax),
+            'status': line.status,
+        }])
+        self.assertEqual(data['sources'][0]['processor'], 'cybersource')
+        self.assertEqual(data['sources'][0]['reference'], 'ref-1')
+        self.assertEqual(data['refunds'][0]['status'], REFUND.COMPLETE)
+        self.assertEqual(data['refunds'][0]['lines'], [{
+            'order_line_id': line.id,
+            'quantity': refund_line.quantity,
+            'line_credit_excl_tax': unicode(refund_line.line_credit_excl_tax),
+            'status': refund_line.status,
+        }])
+
+    def test_get_csv_rows(self):
+        """ Verify a row is returned for each line, with the credit of refunds which have been issued. """
+        row = exports.get_csv_rows(self.load_order())[0]
+        self.assertEqual(row['order_number'], self.order.number)
+        self.assertEqual(row['payment_processors'], 'cybersource')
+        self.assertEqual(row['amount_refunded'], unicode(self.refund.total_credit_excl_tax))
+        self.assertEqual(row['refunded_quantity'], 1)
+        self.assertEqual(row['refunded_credit_excl_tax'], unicode(self.refund.total_credit_excl_tax))
+
+        self.refund.status = REFUND.DENIED
+        self.refund.save()
+        row = exports.get_csv_rows(self.load_order())[0]
+        self.assertEqual(row['refunded_quantity'], 0)
+        self.assertEqual(row['refunded_credit_excl_tax'], unicode(Decimal('0.00')))
+
+    def test_export_csv(self):
+        """ Verify CSV exports have a header row, followed by a row for each order line. """
+        content = ''.join(exports.export_orders(exports.iter_orders(self.start, self.end), exports.CSV))
+        rows = list(csv.DictReader(StringIO(content)))
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(tuple(csv.reader(StringIO(content)).next()), exports.CSV_FIELDS)
+        self.assertEqual(rows[0]['order_number'], self.order.number)
+
+    def test_export_json_lines(self):
+        """ Verify JSON-lines exports contain the serialized form of each order. """
+        content = ''.join(exports.export_orders(exports.iter_orders(self.start, self.end), exports.JSON_LINES))
+        lines = content.splitlines()
+
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(json.loads(lines[0]), exports.serialize_order(self.load_order()))
+
+    def test_export_invalid_format(self):
+        """ Verify an error is raised if the export format is not supported. """
+        with self.assertRaises(ValueError):
+            list(exports.export_orders([], 'xml'))
@@ -1,9 +1,13 @@
 import ddt
+from oscar.apps.order.exceptions import InvalidLineStatus
+from oscar.core.loading import get_model
 from oscar.test import factories
 
-from ecommerce.extensions.fulfillment.status import ORDER
+from ecommerce.extensions.fulfillment.status import LINE, ORDER
 from ecommerce.tests.testcases import TestCase
 
+Line = get_model('order', 'Line')
+
 
 @ddt.ddt
 class OrderTests(TestCase):
@@ -27,3 +31,35 @@ class OrderTests(TestCase):
         self.order.status = status
         self.order.save()
         self.assertFalse(self.order.is_fulfillable)
+
+
+class LineTests(TestCase):
+    def setUp(self):
+        super(LineTests, self).setUp()
+        basket = factories.create_basket(empty=True)
+        for __ in range(3):
+            basket.add_product(factories.create_product(), 1)
+        self.order = factories.create_order(basket=basket)
+
+    def test_bulk_set_status(self):
+        """ Verify the statuses of the lines are updated, and recorded, with one query for each. """
+        lines = list(self.order.lines.all())
+        lines[0].set_status(LINE.COMPLETE)
+
+        with self.assertNumQueries(2):
+            Line.bulk_set_status(lines, LINE.COMPLETE)
+
+        for line in lines:
+            self.assertEqual(line.status, LINE.COMPLETE)
+            self.assertEqual(line.history.first().status, LINE.COMPLETE)
+
+        self.assertEqual(set(self.order.lines.values_list('status', flat=True)), {LINE.COMPLETE})
+        self.assertEqual(lines[0].history.count(), 2)
+
+    def test_bulk_set_status_invalid_status(self):
+        """ Verify no lines are updated if the new status is invalid for any of them. """
+        lines = list(self.order.lines.all())
+        lines[0].set_status(LINE.COMPLETE)
+
+        self.assertRaises(InvalidLineStatus, Line.bulk_set_status, lines, LINE.FULFILLMENT_NETWORK_ERROR)
+        self.assertEqual(self.order.lines.filter(status=LINE.FULFILLMENT_NETWORK_ERROR).count(), 0)
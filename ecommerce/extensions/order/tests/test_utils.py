@@ -5,6 +5,7 @@ from oscar.test.factories import create_basket as oscar_create_basket
 from oscar.test.newfactories import BasketFactory
 
 from ecommerce.extensions.fulfillment.status import ORDER
+from ecommerce.extensions.order.utils import clear_partner_short_code_cache
 from ecommerce.tests.factories import SiteConfigurationFactory, PartnerFactory
 from ecommerce.tests.testcases import TestCase
 
@@ -17,6 +18,10 @@ OrderTotalCalculator = get_class('checkout.calculators', 'OrderTotalCalculator')
 class OrderNumberGeneratorTests(TestCase):
     generator = OrderNumberGenerator()
 
+    def setUp(self):
+        super(OrderNumberGeneratorTests, self).setUp()
+        clear_partner_short_code_cache()
+
     def assert_order_number_matches_basket(self, basket, partner):
         expected = '{}-{}'.format(partner.short_code.upper(), 100000 + basket.id)
         self.assertEqual(self.generator.order_number(basket), expected)
@@ -36,6 +41,34 @@ class OrderNumberGeneratorTests(TestCase):
         with override_settings(SITE_ID=site.id):
             self.assert_order_number_matches_basket(basket, partner)
 
+    def test_order_number_caches_short_code(self):
+        """ Verify the Partner short code is only retrieved from the database once per Site. """
+        basket = BasketFactory(site=self.site)
+        self.generator.order_number(basket)
+
+        with self.assertNumQueries(0):
+            self.assert_order_number_matches_basket(basket, self.partner)
+
+    def test_order_number_after_site_configuration_change(self):
+        """ Verify the cached Partner short code is invalidated when a SiteConfiguration is modified. """
+        basket = BasketFactory(site=self.site)
+        self.assert_order_number_matches_basket(basket, self.partner)
+
+        acme = PartnerFactory(name='ACME')
+        site_configuration = self.site.siteconfiguration
+        site_configuration.partner = acme
+        site_configuration.save()
+        self.assert_order_number_matches_basket(basket, acme)
+
+    def test_order_number_after_partner_change(self):
+        """ Verify the cached Partner short codes are invalidated when a Partner is modified. """
+        basket = BasketFactory(site=self.site)
+        self.assert_order_number_matches_basket(basket, self.partner)
+
+        self.partner.short_code = 'acme'
+        self.partner.save()
+        self.assert_order_number_matches_basket(basket, self.partner)
+
     def test_order_number_from_basket_id(self):
         """ Verify the method returns an order number determined using the basket's ID, and the specified partner. """
         basket = BasketFactory()
@@ -7,6 +7,43 @@ from oscar.apps.order.utils import OrderCreator as OscarOrderCreator
 
 logger = logging.getLogger(__name__)
 
+# Partner short codes keyed by Site ID. Populated lazily by OrderNumberGenerator, and cleared by the receivers in
+# ecommerce.extensions.order.receivers whenever a SiteConfiguration or Partner is modified.
+_partner_short_codes = {}
+
+
+def get_partner_short_code(site):
+    """
+    Returns the short code of the Partner associated with the given Site.
+
+    The value is cached, by Site ID, for the lifetime of the process or until the cache is cleared.
+
+    Arguments:
+        site (Site)
+
+    Returns:
+        string: Partner short code
+    """
+    short_code = _partner_short_codes.get(site.id)
+    if short_code is None:
+        short_code = site.siteconfiguration.partner.short_code
+        _partner_short_codes[site.id] = short_code
+
+    return short_code
+
+
+def clear_partner_short_code_cache(site_id=None):
+    """
+    Removes cached Partner short codes.
+
+    Arguments:
+        site_id (int): ID of the Site whose entry should be removed. If not provided, all entries are removed.
+    """
+    if site_id is None:
+        _partner_short_codes.clear()
+    else:
+        _partner_short_codes.pop(site_id, None)
+
 
 class OrderNumberGenerator(object):
     OFFSET = 100000
@@ -21,13 +58,20 @@ class OrderNumberGenerator(object):
         Returns:
             string: Order number
         """
-        site = basket.site
-        if not site:
-            site = Site.objects.get_current()
-            logger.warning('Basket [%d] is not associated with a Site. Defaulting to Site [%d].', basket.id, site.id)
+        # Check the cache using the foreign key value to avoid loading the Site itself.
+        short_code = _partner_short_codes.get(basket.site_id)
 
-        partner = site.siteconfiguration.partner
-        return self.order_number_from_basket_id(partner, basket.id)
+        if short_code is None:
+            site = basket.site
+            if not site:
+                site = Site.objects.get_current()
+                logger.warning(
+                    'Basket [%d] is not associated with a Site. Defaulting to Site [%d].', basket.id, site.id
+                )
+
+            short_code = get_partner_short_code(site)
+
+        return self._format_order_number(short_code, basket.id)
 
     def order_number_from_basket_id(self, partner, basket_id):
         """
@@ -39,8 +83,11 @@ class OrderNumberGenerator(object):
         Returns:
             string: Order number.
         """
+        return self._format_order_number(partner.short_code, basket_id)
+
+    def _format_order_number(self, short_code, basket_id):
         order_id = int(basket_id) + self.OFFSET
-        return u'{prefix}-{order_id}'.format(prefix=partner.short_code.upper(), order_id=order_id)
+        return u'{prefix}-{order_id}'.format(prefix=short_code.upper(), order_id=order_id)
 
     def basket_id(self, order_number):
         """Inverse of order number generation.
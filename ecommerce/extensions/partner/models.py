@@ -2,11 +2,12 @@ from django.db import models
 from django.utils.translation import ugettext_lazy as _
 
 from oscar.apps.partner.abstract_models import AbstractPartner, AbstractStockRecord
-from simple_history.models import HistoricalRecords
+
+from ecommerce.core.history import DeferrableHistoricalRecords
 
 
 class StockRecord(AbstractStockRecord):
-    history = HistoricalRecords()
+    history = DeferrableHistoricalRecords()
 
 
 class Partner(AbstractPartner):
@@ -1,7 +1,6 @@
 from django.utils import timezone
 
 from oscar.apps.partner import availability, strategy
-from oscar.core.loading import get_model
 
 
 class CourseSeatAvailabilityPolicyMixin(strategy.StockRequired):
@@ -14,8 +13,9 @@ class CourseSeatAvailabilityPolicyMixin(strategy.StockRequired):
 
     @property
     def seat_class(self):
-        ProductClass = get_model('catalogue', 'ProductClass')
-        return ProductClass.objects.get(slug='seat')
+        # This module is loaded along with the basket models, before the catalogue utilities can be imported.
+        from ecommerce.extensions.catalogue.utils import get_seat_product_class
+        return get_seat_product_class()
 
     def availability_policy(self, product, stockrecord):
         """ A product is unavailable for non-admin users if the current date is
@@ -32,9 +32,44 @@ class CourseSeatAvailabilityPolicyMixin(strategy.StockRequired):
 
 class DefaultStrategy(strategy.UseFirstStockRecord, CourseSeatAvailabilityPolicyMixin,
                       strategy.NoTax, strategy.Structured):
-    pass
+    """
+    Default pricing and availability strategy.
+
+    Strategies are scoped to a single request (see `Selector`) or basket, so the purchase info for each
+    product is memoized for the lifetime of the instance.
+    """
+
+    def __init__(self, request=None):
+        super(DefaultStrategy, self).__init__(request)
+        self._purchase_info = {}
+
+    def fetch_for_product(self, product, stockrecord=None):
+        if product.id is None:
+            return super(DefaultStrategy, self).fetch_for_product(product, stockrecord)
+
+        key = (product.id, stockrecord.id if stockrecord else None)
+        info = self._purchase_info.get(key)
+        if info is None:
+            info = super(DefaultStrategy, self).fetch_for_product(product, stockrecord)
+            self._purchase_info[key] = info
+
+        return info
 
 
 class Selector(object):
+    # Name of the request attribute holding the strategy shared by all callers handling the request.
+    REQUEST_ATTRIBUTE = '_default_strategy'
+
     def strategy(self, request=None, user=None, **kwargs):  # pylint: disable=unused-argument
-        return DefaultStrategy(request if hasattr(request, 'user') else None)
+        if not hasattr(request, 'user'):
+            return DefaultStrategy()
+
+        # Reuse the strategy, and its memoized purchase info, for the remainder of the request. A new strategy
+        # is created if the user has changed (e.g. authentication by an API view after the middleware has run).
+        user = request.user if request.user.is_authenticated() else None
+        default_strategy = getattr(request, self.REQUEST_ATTRIBUTE, None)
+        if not isinstance(default_strategy, DefaultStrategy) or default_strategy.user != user:
+            default_strategy = DefaultStrategy(request)
+            setattr(request, self.REQUEST_ATTRIBUTE, default_strategy)
+
+        return default_strategy
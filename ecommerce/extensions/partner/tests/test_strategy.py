@@ -23,6 +23,24 @@ class DefaultStrategyTests(CourseCatalogTestMixin, TestCase):
         """ Verify the property returns the course seat Product Class. """
         self.assertEqual(self.strategy.seat_class, self.seat_product_class)
 
+    def test_seat_class_cached(self):
+        """ Verify the course seat Product Class is only retrieved from the database once. """
+        seat_product_class = self.seat_product_class
+        self.assertEqual(self.strategy.seat_class, seat_product_class)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(DefaultStrategy().seat_class, seat_product_class)
+
+    def test_fetch_for_product_memoized(self):
+        """ Verify purchase info is only computed once per product for a given strategy. """
+        info = self.strategy.fetch_for_product(self.honor_seat)
+
+        with self.assertNumQueries(0):
+            self.assertIs(self.strategy.fetch_for_product(self.honor_seat), info)
+
+        # Other strategy instances should compute their own purchase info.
+        self.assertIsNot(DefaultStrategy().fetch_for_product(self.honor_seat), info)
+
     def test_availability_policy_not_expired(self):
         """ If the course seat's expiration date has not passed, the seat should be available for purchase. """
         product = self.honor_seat
@@ -71,3 +89,17 @@ class SelectorTests(TestCase):
         """ Verify our own DefaultStrategy is returned. """
         actual = Selector().strategy()
         self.assertIsInstance(actual, DefaultStrategy)
+
+    def test_strategy_request_scoped(self):
+        """ Verify the same strategy is returned for every call made with a given request and user. """
+        request = RequestFactory().get('/')
+        request.user = self.create_user()
+
+        strategy = Selector().strategy(request=request)
+        self.assertIsInstance(strategy, DefaultStrategy)
+        self.assertIs(Selector().strategy(request=request), strategy)
+        self.assertIsNot(Selector().strategy(request=RequestFactory().get('/')), strategy)
+
+        # A new strategy should be returned if the request's user changes.
+        request.user = self.create_user()
+        self.assertIsNot(Selector().strategy(request=request), strategy)
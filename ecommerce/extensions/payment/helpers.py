@@ -44,6 +44,17 @@ def get_default_processor_class():
     return processor_class
 
 
+def get_enabled_processor_classes():
+    """Return the payment processor classes which are currently enabled.
+
+    Returns:
+        list: Payment processor classes, in the order in which they are specified
+            in the PAYMENT_PROCESSORS setting, whose Waffle switches are active.
+    """
+    processors = (get_processor_class(path) for path in settings.PAYMENT_PROCESSORS)
+    return [processor for processor in processors if processor.is_enabled()]
+
+
 def get_processor_class_by_name(name):
     """Return the payment processor class corresponding to the specified name.
 
@@ -0,0 +1,150 @@
+"""
+Management command that archives old payment processor responses.
+
+A response is recorded for every payment processor interaction, but only recent responses are needed to process
+payments. Moving older responses out of the table keeps it, and its indexes, small.
+"""
+from __future__ import unicode_literals
+from contextlib import closing
+import datetime
+import gzip
+import json
+import os
+import time
+
+from django.core.management import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+from oscar.core.loading import get_model
+
+ArchivedPaymentProcessorResponse = get_model('payment', 'ArchivedPaymentProcessorResponse')
+PaymentProcessorResponse = get_model('payment', 'PaymentProcessorResponse')
+
+FIELDS = ('id', 'processor_name', 'transaction_id', 'basket_id', 'response', 'created',)
+
+
+class Command(BaseCommand):
+    help = 'Archive payment processor responses older than the retention window.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('-d', '--days',
+                            action='store',
+                            dest='days',
+                            default=180,
+                            type=int,
+                            help='Number of days for which responses should be retained.')
+        parser.add_argument('-o', '--output-dir',
+                            action='store',
+                            dest='output_dir',
+                            default=None,
+                            help='Directory to which monthly archive files should be written.')
+        parser.add_argument('--cold-table',
+                            action='store_true',
+                            dest='cold_table',
+                            default=False,
+                            help='Move the responses to the archived responses table, instead of to files.')
+        parser.add_argument('-b', '--batch-size',
+                            action='store',
+                            dest='batch_size',
+                            default=1000,
+                            type=int,
+                            help='Size of each batch of responses to be archived.')
+        parser.add_argument('-s', '--sleep-time',
+                            action='store',
+                            dest='sleep_time',
+                            default=0,
+                            type=float,
+                            help='Number of seconds to sleep between batches, to give replicas time to catch up.')
+        parser.add_argument('--commit',
+                            action='store_true',
+                            dest='commit',
+                            default=False,
+                            help='Actually archive the responses.')
+
+    def handle(self, *args, **options):
+        output_dir = options['output_dir']
+        cold_table = options['cold_table']
+        if bool(output_dir) == cold_table:
+            raise CommandError('Exactly one of --output-dir and --cold-table must be specified!')
+
+        cutoff = timezone.now() - datetime.timedelta(days=options['days'])
+        queryset = PaymentProcessorResponse.objects.filter(created__lt=cutoff)
+        count = queryset.count()
+
+        if options['commit']:
+            if count:
+                self.stderr.write('Archiving [{}] payment processor responses...'.format(count))
+                archive = TableArchive() if cold_table else FileArchive(output_dir)
+                ids = queryset.order_by('id').values_list('id', flat=True)
+                last_id = 0
+
+                with closing(archive):
+                    while True:
+                        batch = list(ids.filter(id__gt=last_id)[:options['batch_size']])
+                        if not batch:
+                            break
+
+                        self.stderr.write(
+                            '...archiving responses [{start}] through [{end}]...'.format(start=batch[0], end=batch[-1]))
+                        # Load model instances, rather than values, so that the responses are deserialized.
+                        responses = PaymentProcessorResponse.objects.filter(id__in=batch).order_by('id')
+                        rows = [{field: getattr(response, field) for field in FIELDS} for response in responses]
+
+                        with transaction.atomic():
+                            archive.write(rows)
+                            PaymentProcessorResponse.objects.filter(id__in=batch).delete()
+
+                        last_id = batch[-1]
+
+                        if options['sleep_time']:
+                            time.sleep(options['sleep_time'])
+
+                self.stderr.write('Done.')
+            else:
+                self.stderr.write('No payment processor responses to archive.')
+        else:
+            msg = 'This has been an example operation. If the --commit flag had been included, the command ' \
+                  'would have archived [{}] payment processor responses.'.format(count)
+            self.stderr.write(msg)
+
+
+class TableArchive(object):
+    """ Moves responses to the archived responses table. """
+
+    def write(self, rows):
+        ArchivedPaymentProcessorResponse.objects.bulk_create(
+            [ArchivedPaymentProcessorResponse(**row) for row in rows]
+        )
+
+    def close(self):
+        pass
+
+
+class FileArchive(object):
+    """ Writes responses to gzipped JSON-lines files, one per month in which the responses were created.
+
+    Files are opened for appending, so that responses archived by successive runs accumulate in the same file.
+    """
+
+    def __init__(self, output_dir):
+        self.output_dir = output_dir
+        self.files = {}
+
+    def write(self, rows):
+        for row in rows:
+            row['created'] = row['created'].isoformat()
+            self.get_file(row['created'][:7]).write(json.dumps(row) + '\n')
+
+        # Ensure the batch is on disk before its rows are removed from the database.
+        for archive in self.files.values():
+            archive.flush()
+
+    def get_file(self, month):
+        if month not in self.files:
+            path = os.path.join(self.output_dir, 'payment-processor-responses-{}.jsonl.gz'.format(month))
+            self.files[month] = gzip.open(path, 'ab')
+        return self.files[month]
+
+    def close(self):
+        for archive in self.files.values():
+            archive.close()
@@ -0,0 +1,113 @@
+"""
+Management command that maps existing PayPal payments to their baskets.
+
+PayPal payment IDs were previously resolved to baskets by searching payment processor responses. This command
+creates the mappings for payments recorded before the mapping table existed.
+"""
+from __future__ import unicode_literals
+import time
+
+from django.core.management import BaseCommand
+from django.db import transaction
+from oscar.core.loading import get_model
+
+from ecommerce.extensions.payment.processors.paypal import Paypal
+
+PaymentProcessorResponse = get_model('payment', 'PaymentProcessorResponse')
+PaypalPaymentBasket = get_model('payment', 'PaypalPaymentBasket')
+
+# Responses are also recorded for refunds and errors. Only payments have IDs with this prefix.
+PAYMENT_ID_PREFIX = 'PAY-'
+
+
+class Command(BaseCommand):
+    help = 'Map PayPal payment IDs, recorded in payment processor responses, to baskets.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('-b', '--batch-size',
+                            action='store',
+                            dest='batch_size',
+                            default=1000,
+                            type=int,
+                            help='Size of each batch of payment processor responses to be read.')
+        parser.add_argument('-s', '--sleep-time',
+                            action='store',
+                            dest='sleep_time',
+                            default=0,
+                            type=float,
+                            help='Number of seconds to sleep between batches, to give replicas time to catch up.')
+        parser.add_argument('--commit',
+                            action='store_true',
+                            dest='commit',
+                            default=False,
+                            help='Actually create the mappings.')
+
+    def handle(self, *args, **options):
+        queryset = PaymentProcessorResponse.objects.filter(
+            processor_name=Paypal.NAME,
+            transaction_id__startswith=PAYMENT_ID_PREFIX,
+            basket__isnull=False
+        )
+        count = queryset.count()
+
+        if options['commit']:
+            if count:
+                self.stderr.write('Mapping payments from [{}] PayPal responses...'.format(count))
+                rows = queryset.order_by('id').values_list('id', 'transaction_id', 'basket_id')
+                last_id = 0
+                created = 0
+
+                while True:
+                    batch = list(rows.filter(id__gt=last_id)[:options['batch_size']])
+                    if not batch:
+                        break
+
+                    created += self.map_payments([(payment_id, basket_id) for __, payment_id, basket_id in batch])
+                    last_id = batch[-1][0]
+
+                    if options['sleep_time']:
+                        time.sleep(options['sleep_time'])
+
+                self.stderr.write('Created [{}] mappings.'.format(created))
+                self.stderr.write('Done.')
+            else:
+                self.stderr.write('No PayPal responses to map.')
+        else:
+            msg = 'This has been an example operation. If the --commit flag had been included, the command ' \
+                  'would have mapped payments from [{}] PayPal responses.'.format(count)
+            self.stderr.write(msg)
+
+    def map_payments(self, payments):
+        """ Create mappings for the given payments.
+
+        Payment IDs associated with multiple baskets are mapped to no basket, as they are by the payment processor.
+
+        Arguments:
+            payments (list): Tuples of payment ID and basket ID.
+
+        Returns:
+            int: Number of mappings created.
+        """
+        baskets = {}
+        ambiguous = set()
+        for payment_id, basket_id in payments:
+            if baskets.setdefault(payment_id, basket_id) != basket_id:
+                ambiguous.add(payment_id)
+
+        with transaction.atomic():
+            existing = dict(
+                PaypalPaymentBasket.objects.filter(payment_id__in=baskets.keys()).values_list('payment_id', 'basket_id')
+            )
+            ambiguous.update(
+                payment_id for payment_id, basket_id in existing.items()
+                if basket_id is not None and basket_id != baskets[payment_id]
+            )
+
+            PaypalPaymentBasket.objects.filter(payment_id__in=ambiguous).update(basket=None)
+            mappings = [
+                PaypalPaymentBasket(payment_id=payment_id, basket_id=None if payment_id in ambiguous else basket_id)
+                for payment_id, basket_id in baskets.items() if payment_id not in existing
+            ]
+            PaypalPaymentBasket.objects.bulk_create(mappings)
+
+        return len(mappings)
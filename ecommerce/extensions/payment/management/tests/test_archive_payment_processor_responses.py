@@ -0,0 +1,106 @@
+from __future__ import unicode_literals
+import datetime
+import gzip
+import json
+import os
+import shutil
+from StringIO import StringIO
+import tempfile
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.utils import timezone
+from oscar.test import factories
+
+from ecommerce.extensions.payment.models import ArchivedPaymentProcessorResponse, PaymentProcessorResponse
+from ecommerce.tests.testcases import TestCase
+
+
+class ArchivePaymentProcessorResponsesCommandTests(TestCase):
+    command = 'archive_payment_processor_responses'
+
+    def setUp(self):
+        super(ArchivePaymentProcessorResponsesCommandTests, self).setUp()
+        self.output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.output_dir)
+
+        basket = factories.BasketFactory()
+        self.old_responses = [
+            self.create_response(basket, datetime.datetime(2015, 1, 15, tzinfo=timezone.utc)),
+            self.create_response(basket, datetime.datetime(2015, 1, 20, tzinfo=timezone.utc)),
+            self.create_response(basket, datetime.datetime(2015, 2, 15, tzinfo=timezone.utc)),
+        ]
+        self.recent_response = self.create_response(basket, timezone.now())
+
+    def create_response(self, basket, created):
+        response = PaymentProcessorResponse.objects.create(
+            processor_name='paypal', transaction_id='PAY-{}'.format(created.isoformat()), basket=basket,
+            response={'state': 'approved'}
+        )
+        PaymentProcessorResponse.objects.filter(id=response.id).update(created=created)
+        return PaymentProcessorResponse.objects.get(id=response.id)
+
+    def test_invalid_destination(self):
+        """ Verify the command requires exactly one of a directory or the cold table. """
+        with self.assertRaises(CommandError):
+            call_command(self.command, commit=True)
+
+        with self.assertRaises(CommandError):
+            call_command(self.command, commit=True, cold_table=True, output_dir=self.output_dir)
+
+    def test_without_commit(self):
+        """ Verify the command does not archive responses if the commit flag is not set. """
+        out = StringIO()
+        call_command(self.command, output_dir=self.output_dir, stderr=out)
+
+        self.assertEqual(PaymentProcessorResponse.objects.count(), 4)
+        self.assertEqual(os.listdir(self.output_dir), [])
+
+        expected = 'This has been an example operation. If the --commit flag had been included, the command ' \
+                   'would have archived [3] payment processor responses.'
+        self.assertEqual(out.getvalue().strip(), expected)
+
+    def test_with_commit_to_files(self):
+        """ Verify the command writes old responses to monthly files, and deletes them. """
+        out = StringIO()
+        call_command(self.command, commit=True, output_dir=self.output_dir, batch_size=2, stderr=out)
+
+        self.assertEqual(list(PaymentProcessorResponse.objects.all()), [self.recent_response])
+        self.assertEqual(
+            sorted(os.listdir(self.output_dir)),
+            ['payment-processor-responses-2015-01.jsonl.gz', 'payment-processor-responses-2015-02.jsonl.gz']
+        )
+
+        with gzip.open(os.path.join(self.output_dir, 'payment-processor-responses-2015-01.jsonl.gz')) as archive:
+            archived = [json.loads(line) for line in archive]
+
+        self.assertEqual([row['id'] for row in archived], [response.id for response in self.old_responses[:2]])
+        self.assertEqual(archived[0]['transaction_id'], self.old_responses[0].transaction_id)
+        self.assertEqual(archived[0]['basket_id'], self.old_responses[0].basket_id)
+        self.assertEqual(archived[0]['response'], {'state': 'approved'})
+
+        actual = out.getvalue().strip()
+        self.assertTrue(actual.startswith('Archiving [3] payment processor responses...'))
+        self.assertTrue(actual.endswith('Done.'))
+
+    def test_with_commit_to_cold_table(self):
+        """ Verify the command moves old responses to the archived responses table. """
+        call_command(self.command, commit=True, cold_table=True, stderr=StringIO())
+
+        self.assertEqual(list(PaymentProcessorResponse.objects.all()), [self.recent_response])
+
+        archived = ArchivedPaymentProcessorResponse.objects.order_by('id')
+        self.assertEqual([row.id for row in archived], [response.id for response in self.old_responses])
+        for row, response in zip(archived, self.old_responses):
+            self.assertEqual(row.transaction_id, response.transaction_id)
+            self.assertEqual(row.basket_id, response.basket_id)
+            self.assertEqual(row.response, response.response)
+            self.assertEqual(row.created, response.created)
+
+    def test_commit_without_responses(self):
+        """ Verify the command does nothing if there are no responses to archive. """
+        out = StringIO()
+        call_command(self.command, commit=True, cold_table=True, days=100000, stderr=out)
+
+        self.assertEqual(out.getvalue().strip(), 'No payment processor responses to archive.')
+        self.assertEqual(PaymentProcessorResponse.objects.count(), 4)
@@ -0,0 +1,79 @@
+from __future__ import unicode_literals
+from StringIO import StringIO
+
+from django.core.management import call_command
+from oscar.test import factories
+
+from ecommerce.extensions.payment.models import PaymentProcessorResponse, PaypalPaymentBasket
+from ecommerce.extensions.payment.processors.paypal import Paypal
+from ecommerce.tests.testcases import TestCase
+
+
+class BackfillPaypalPaymentBasketsCommandTests(TestCase):
+    command = 'backfill_paypal_payment_baskets'
+
+    def setUp(self):
+        super(BackfillPaypalPaymentBasketsCommandTests, self).setUp()
+        self.basket = factories.BasketFactory()
+        self.other_basket = factories.BasketFactory()
+
+        # A payment creation and execution, for a single basket
+        self.create_response('PAY-1', self.basket)
+        self.create_response('PAY-1', self.basket)
+
+        # A payment ID PayPal has associated with multiple baskets
+        self.create_response('PAY-2', self.basket)
+        self.create_response('PAY-2', self.other_basket)
+
+        # Responses which should not be mapped
+        self.create_response('debug-id', self.basket)
+        self.create_response('PAY-3', None)
+        PaymentProcessorResponse.objects.create(processor_name='cybersource', transaction_id='PAY-4',
+                                                basket=self.basket, response={})
+
+    def create_response(self, payment_id, basket):
+        PaymentProcessorResponse.objects.create(processor_name=Paypal.NAME, transaction_id=payment_id, basket=basket,
+                                                response={})
+
+    def assert_mappings(self, expected):
+        actual = dict(PaypalPaymentBasket.objects.values_list('payment_id', 'basket_id'))
+        self.assertEqual(actual, expected)
+
+    def test_without_commit(self):
+        """ Verify the command does not create mappings if the commit flag is not set. """
+        out = StringIO()
+        call_command(self.command, stderr=out)
+
+        self.assertFalse(PaypalPaymentBasket.objects.exists())
+        expected = 'This has been an example operation. If the --commit flag had been included, the command ' \
+                   'would have mapped payments from [4] PayPal responses.'
+        self.assertEqual(out.getvalue().strip(), expected)
+
+    def test_with_commit(self):
+        """ Verify the command maps payment IDs to baskets, in batches. """
+        out = StringIO()
+        call_command(self.command, commit=True, batch_size=1, stderr=out)
+
+        self.assert_mappings({'PAY-1': self.basket.id, 'PAY-2': None})
+
+        actual = out.getvalue().strip()
+        self.assertTrue(actual.startswith('Mapping payments from [4] PayPal responses...'))
+        self.assertTrue(actual.endswith('Created [2] mappings.\nDone.'))
+
+    def test_with_commit_existing_mappings(self):
+        """ Verify the command retains existing mappings, unless they conflict with the responses. """
+        PaypalPaymentBasket.objects.create(payment_id='PAY-1', basket=self.basket)
+        PaypalPaymentBasket.objects.create(payment_id='PAY-2', basket=self.basket)
+
+        call_command(self.command, commit=True, stderr=StringIO())
+
+        self.assert_mappings({'PAY-1': self.basket.id, 'PAY-2': None})
+
+    def test_commit_without_responses(self):
+        """ Verify the command does nothing if there are no responses to map. """
+        PaymentProcessorResponse.objects.all().delete()
+
+        out = StringIO()
+        call_command(self.command, commit=True, stderr=out)
+
+        self.assertEqual(out.getvalue().strip(), 'No PayPal responses to map.')
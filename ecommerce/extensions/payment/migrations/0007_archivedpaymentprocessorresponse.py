@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import jsonfield.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payment', '0006_enable_payment_processors'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedPaymentProcessorResponse',
+            fields=[
+                ('id', models.IntegerField(serialize=False, primary_key=True)),
+                ('processor_name', models.CharField(max_length=255, verbose_name='Payment Processor')),
+                ('transaction_id', models.CharField(max_length=255, null=True, verbose_name='Transaction ID', blank=True)),
+                ('basket_id', models.IntegerField(null=True, verbose_name='Basket ID', blank=True)),
+                ('response', jsonfield.fields.JSONField()),
+                ('created', models.DateTimeField()),
+                ('archived', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Archived Payment Processor Response',
+                'verbose_name_plural': 'Archived Payment Processor Responses',
+            },
+        ),
+        migrations.AlterIndexTogether(
+            name='archivedpaymentprocessorresponse',
+            index_together=set([('processor_name', 'transaction_id')]),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('basket', '0007_basket_indexes'),
+        ('payment', '0007_archivedpaymentprocessorresponse'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PaypalPaymentBasket',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('payment_id', models.CharField(unique=True, max_length=255, verbose_name='Payment ID')),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('basket', models.ForeignKey(verbose_name='Basket', blank=True, to='basket.Basket', null=True)),
+            ],
+            options={
+                'verbose_name': 'PayPal Payment Basket',
+                'verbose_name_plural': 'PayPal Payment Baskets',
+            },
+        ),
+    ]
@@ -22,6 +22,26 @@ class PaymentProcessorResponse(models.Model):
         verbose_name_plural = _('Payment Processor Responses')
 
 
+class ArchivedPaymentProcessorResponse(models.Model):
+    """ Cold storage for PaymentProcessorResponse rows older than the retention window.
+
+    Rows keep their original ID. Baskets are referenced by ID alone, since they may since have been deleted.
+    """
+
+    id = models.IntegerField(primary_key=True)
+    processor_name = models.CharField(max_length=255, verbose_name=_('Payment Processor'))
+    transaction_id = models.CharField(max_length=255, verbose_name=_('Transaction ID'), null=True, blank=True)
+    basket_id = models.IntegerField(verbose_name=_('Basket ID'), null=True, blank=True)
+    response = JSONField()
+    created = models.DateTimeField()
+    archived = models.DateTimeField(auto_now_add=True)
+
+    class Meta(object):
+        index_together = ('processor_name', 'transaction_id')
+        verbose_name = _('Archived Payment Processor Response')
+        verbose_name_plural = _('Archived Payment Processor Responses')
+
+
 class Source(AbstractSource):
     card_type = models.CharField(max_length=255, choices=CARD_TYPE_CHOICES, null=True, blank=True)
 
@@ -31,5 +51,20 @@ class PaypalWebProfile(models.Model):
     name = models.CharField(max_length=255, unique=True)
 
 
+class PaypalPaymentBasket(models.Model):
+    """ Maps a PayPal payment ID to the basket for which the payment was created.
+
+    The basket is null if PayPal has associated the payment ID with more than one basket.
+    """
+
+    payment_id = models.CharField(max_length=255, unique=True, verbose_name=_('Payment ID'))
+    basket = models.ForeignKey('basket.Basket', verbose_name=_('Basket'), null=True, blank=True)
+    created = models.DateTimeField(auto_now_add=True)
+
+    class Meta(object):
+        verbose_name = _('PayPal Payment Basket')
+        verbose_name_plural = _('PayPal Payment Baskets')
+
+
 # noinspection PyUnresolvedReferences
 from oscar.apps.payment.models import *  # noqa pylint: disable=wildcard-import,unused-wildcard-import,wrong-import-position,wrong-import-order
@@ -12,6 +12,7 @@ from suds.sudsobject import asdict
 from suds.wsse import Security, UsernameToken
 
 from ecommerce.core.constants import ISO_8601_FORMAT
+from ecommerce.extensions.catalogue.utils import get_seat_product_class
 from ecommerce.extensions.order.constants import PaymentEventTypeName
 from ecommerce.extensions.payment.constants import CYBERSOURCE_CARD_TYPE_MAP
 from ecommerce.extensions.payment.exceptions import (InvalidSignatureError, InvalidCybersourceDecision,
@@ -125,7 +126,7 @@ class Cybersource(BasePaymentProcessor):
         class of 'seat'.  Return None if no such products were found.
         """
         try:
-            seat_class = ProductClass.objects.get(slug='seat')
+            seat_class = get_seat_product_class()
         except ProductClass.DoesNotExist:
             # this occurs in test configurations where the seat product class is not in use
             return None
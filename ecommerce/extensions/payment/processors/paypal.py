@@ -12,7 +12,7 @@ import waffle
 
 from ecommerce.extensions.order.constants import PaymentEventTypeName
 from ecommerce.extensions.payment.processors import BasePaymentProcessor
-from ecommerce.extensions.payment.models import PaypalWebProfile
+from ecommerce.extensions.payment.models import PaypalPaymentBasket, PaypalWebProfile
 from ecommerce.extensions.payment.utils import middle_truncate
 
 
@@ -128,6 +128,7 @@ class Paypal(BasePaymentProcessor):
 
         entry = self.record_processor_response(payment.to_dict(), transaction_id=payment.id, basket=basket)
         logger.info(u"Successfully created PayPal payment [%s] for basket [%d].", payment.id, basket.id)
+        self._map_payment_to_basket(payment.id, basket)
 
         for link in payment.links:
             if link.rel == 'approval_url':
@@ -234,6 +235,21 @@ class Paypal(BasePaymentProcessor):
 
         return source, event
 
+    def _map_payment_to_basket(self, payment_id, basket):
+        """
+        Record the basket for which a payment was created, so that the basket can be retrieved quickly when the
+        payment is executed.
+
+        If PayPal has already used the payment ID for a different basket, the payment cannot be attributed to
+        either basket, and the mapping is cleared.
+        """
+        mapping, created = PaypalPaymentBasket.objects.get_or_create(payment_id=payment_id, defaults={'basket': basket})
+
+        if not created and mapping.basket_id != basket.id:
+            logger.error(u"PayPal payment [%s] has been created for multiple baskets.", payment_id)
+            mapping.basket = None
+            mapping.save()
+
     def _get_error(self, payment):
         """
         Shameful workaround for mocking the `error` attribute on instances of
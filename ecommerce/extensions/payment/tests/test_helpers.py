@@ -1,5 +1,7 @@
 import ddt
+from django.conf import settings
 from django.test import override_settings
+from waffle.models import Switch
 
 from ecommerce.extensions.payment import helpers
 from ecommerce.extensions.payment.exceptions import ProcessorNotFoundError
@@ -22,6 +24,12 @@ class HelperTests(TestCase):
         """ Verify the function returns the first processor class defined in settings. """
         self.assertIs(helpers.get_default_processor_class(), DummyProcessor)
 
+    def test_get_enabled_processor_classes(self):
+        """ Verify the function returns only the processor classes whose switches are active. """
+        Switch.objects.create(name=settings.PAYMENT_PROCESSOR_SWITCH_PREFIX + DummyProcessor.NAME, active=False)
+        Switch.objects.create(name=settings.PAYMENT_PROCESSOR_SWITCH_PREFIX + AnotherDummyProcessor.NAME, active=True)
+        self.assertEqual(helpers.get_enabled_processor_classes(), [AnotherDummyProcessor])
+
     @ddt.data(DummyProcessor, AnotherDummyProcessor)
     def test_get_processor_class_by_name(self, processor):
         """ Verify the function returns the appropriate processor class or raises an exception, if not found. """
@@ -27,7 +27,7 @@ from ecommerce.extensions.catalogue.tests.mixins import CourseCatalogTestMixin
 from ecommerce.extensions.order.constants import PaymentEventTypeName
 from ecommerce.extensions.payment.exceptions import (InvalidSignatureError, InvalidCybersourceDecision,
                                                      PartialAuthorizationError)
-from ecommerce.extensions.payment.models import PaypalWebProfile
+from ecommerce.extensions.payment.models import PaypalPaymentBasket, PaypalWebProfile
 from ecommerce.extensions.payment.processors.invoice import InvoicePayment
 from ecommerce.extensions.payment.processors.cybersource import Cybersource, suds_response_to_dict
 from ecommerce.extensions.payment.processors.paypal import Paypal
@@ -368,11 +368,36 @@ class PaypalTests(PaypalMixin, PaymentProcessorTestCaseMixin, TestCase):
 
         self._assert_transaction_parameters()
         self.assert_processor_response_recorded(self.processor.NAME, self.PAYMENT_ID, response, basket=self.basket)
+        self.assertEqual(PaypalPaymentBasket.objects.get(payment_id=self.PAYMENT_ID).basket, self.basket)
 
         last_request_body = json.loads(httpretty.last_request().body)
         expected = urljoin(settings.ECOMMERCE_URL_ROOT, reverse('paypal_execute'))
         self.assertEqual(last_request_body['redirect_urls']['return_url'], expected)
 
+    @httpretty.activate
+    def test_get_transaction_parameters_duplicate_payment_id(self):
+        """Verify a payment ID is mapped to no basket if PayPal creates the same payment for multiple baskets."""
+        self.mock_oauth2_response()
+        self.mock_payment_creation_response(self.basket)
+        self.processor.get_transaction_parameters(self.basket, request=self.request)
+
+        # Repeating the request for the same basket should not affect the mapping.
+        self.processor.get_transaction_parameters(self.basket, request=self.request)
+        self.assertEqual(PaypalPaymentBasket.objects.get(payment_id=self.PAYMENT_ID).basket, self.basket)
+
+        logger_name = 'ecommerce.extensions.payment.processors.paypal'
+        with LogCapture(logger_name, level=logging.ERROR) as l:
+            self.processor.get_transaction_parameters(factories.create_basket(), request=self.request)
+            l.check(
+                (
+                    logger_name,
+                    'ERROR',
+                    'PayPal payment [{}] has been created for multiple baskets.'.format(self.PAYMENT_ID)
+                ),
+            )
+
+        self.assertIsNone(PaypalPaymentBasket.objects.get(payment_id=self.PAYMENT_ID).basket)
+
     @httpretty.activate
     @mock.patch('ecommerce.extensions.payment.processors.paypal.paypalrestsdk.Payment')
     @ddt.data(None, Paypal.DEFAULT_PROFILE_NAME, "some-other-name")
@@ -381,6 +406,7 @@ class PaypalTests(PaypalMixin, PaymentProcessorTestCaseMixin, TestCase):
         Verify that the payment creation payload references a web profile when one is enabled with the expected name.
         """
         mock_payment_instance = mock.Mock()
+        mock_payment_instance.id = self.PAYMENT_ID
         mock_payment_instance.to_dict.return_value = {}
         mock_payment_instance.links = [mock.Mock(rel='approval_url', href='dummy')]
         mock_payment.return_value = mock_payment_instance
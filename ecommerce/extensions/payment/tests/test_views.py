@@ -23,7 +23,7 @@ Basket = get_model('basket', 'Basket')
 Order = get_model('order', 'Order')
 PaymentEvent = get_model('order', 'PaymentEvent')
 PaymentEventType = get_model('order', 'PaymentEventType')
-PaymentProcessorResponse = get_model('payment', 'PaymentProcessorResponse')
+PaypalPaymentBasket = get_model('payment', 'PaypalPaymentBasket')
 SourceType = get_model('payment', 'SourceType')
 
 post_checkout = get_class('checkout.signals', 'post_checkout')
@@ -459,6 +459,14 @@ class PaypalPaymentExecutionViewTests(PaypalMixin, PaymentEventsMixin, TestCase)
             self._assert_order_placement_failure(error_message)
             self.assertTrue(fake_handle_order_placement.called)
 
+    def test_payment_execution_without_mapping(self):
+        """Verify that payments created before payment IDs were mapped to baskets can still be executed."""
+        with mock.patch.object(Paypal, '_map_payment_to_basket'):
+            self._assert_execution_redirect()
+
+        self.assertFalse(PaypalPaymentBasket.objects.exists())
+        self.get_order(self.basket)
+
     @httpretty.activate
     def test_payment_error_with_duplicate_payment_id(self):
         """
@@ -500,7 +508,7 @@ class PaypalPaymentExecutionViewTests(PaypalMixin, PaymentEventsMixin, TestCase)
         Verify that we fail gracefully when any Exception occurred in _get_basket() method,
         logging the exception and redirecting the user to an LMS checkout error page.
         """
-        with mock.patch.object(PaymentProcessorResponse.objects, 'get', side_effect=Exception):
+        with mock.patch.object(PaypalPaymentBasket.objects, 'select_related', side_effect=Exception):
             logger_name = 'ecommerce.extensions.payment.views'
             with LogCapture(logger_name) as l:
                 self.mock_oauth2_response()
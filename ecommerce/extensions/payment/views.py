@@ -30,6 +30,7 @@ NoShippingRequired = get_class('shipping.methods', 'NoShippingRequired')
 OrderNumberGenerator = get_class('order.utils', 'OrderNumberGenerator')
 OrderTotalCalculator = get_class('checkout.calculators', 'OrderTotalCalculator')
 PaymentProcessorResponse = get_model('payment', 'PaymentProcessorResponse')
+PaypalPaymentBasket = get_model('payment', 'PaypalPaymentBasket')
 
 
 class CybersourceNotifyView(EdxOrderPlacementMixin, View):
@@ -192,10 +193,19 @@ class PaypalPaymentExecutionView(EdxOrderPlacementMixin, View):
 
         """
         try:
-            basket = PaymentProcessorResponse.objects.get(
-                processor_name=self.payment_processor.NAME,
-                transaction_id=payment_id
-            ).basket
+            try:
+                mapping = PaypalPaymentBasket.objects.select_related('basket').get(payment_id=payment_id)
+            except PaypalPaymentBasket.DoesNotExist:
+                # Payments created before the mapping existed, and not yet backfilled, are only recorded as responses.
+                basket = PaymentProcessorResponse.objects.defer('response').select_related('basket').get(
+                    processor_name=self.payment_processor.NAME,
+                    transaction_id=payment_id
+                ).basket
+            else:
+                if mapping.basket is None:
+                    raise MultipleObjectsReturned
+                basket = mapping.basket
+
             basket.strategy = strategy.Default()
             return basket
         except MultipleObjectsReturned:
@@ -2,13 +2,14 @@ import logging
 
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import ugettext_lazy as _
 from django_extensions.db.models import TimeStampedModel
 from oscar.apps.payment.exceptions import PaymentError
 from oscar.core.loading import get_class
 from oscar.core.utils import get_default_currency
-from simple_history.models import HistoricalRecords
 
+from ecommerce.core.history import bulk_update, DeferrableHistoricalRecords
 from ecommerce.extensions.analytics.utils import audit_log
 from ecommerce.extensions.fulfillment.api import revoke_fulfillment_for_refund
 from ecommerce.extensions.payment.helpers import get_processor_class_by_name
@@ -52,6 +53,27 @@ class StatusMixin(object):
         self.status = new_status
         self.save()
 
+    @classmethod
+    def bulk_set_status(cls, instances, new_status):
+        """Set a new status for each of the given objects, with a single UPDATE.
+
+        If the requested status is not valid for any of the objects, then ``InvalidStatus`` is raised, and none of
+        the objects are updated.
+        """
+        instances = list(instances)
+        for instance in instances:
+            if new_status not in instance.available_statuses():
+                msg = " Transition from '{status}' to '{new_status}' is invalid for {model_name} {id}.".format(
+                    new_status=new_status,
+                    model_name=cls.__name__.lower(),
+                    id=instance.id,
+                    status=instance.status
+                )
+                raise InvalidStatus(msg)
+
+        # TimeStampedModel updates the modification date on save, which UPDATE queries bypass.
+        bulk_update(instances, status=new_status, modified=timezone.now())
+
     def __str__(self):
         return unicode(self.id)
 
@@ -75,7 +97,7 @@ class Refund(StatusMixin, TimeStampedModel):
         ]
     )
 
-    history = HistoricalRecords()
+    history = DeferrableHistoricalRecords()
     pipeline_setting = 'OSCAR_REFUND_STATUS_PIPELINE'
 
     @classmethod
@@ -209,15 +231,13 @@ class Refund(StatusMixin, TimeStampedModel):
 
         self.set_status(REFUND.DENIED)
 
-        result = True
-        for line in self.lines.all():
-            try:
-                line.deny()
-            except Exception:  # pylint: disable=broad-except
-                logger.exception('Failed to deny RefundLine [%d].', line.id)
-                result = False
+        try:
+            RefundLine.bulk_set_status(self.lines.all(), REFUND_LINE.DENIED)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception('Failed to deny the lines of Refund [%d].', self.id)
+            return False
 
-        return result
+        return True
 
 
 class RefundLine(StatusMixin, TimeStampedModel):
@@ -237,7 +257,7 @@ class RefundLine(StatusMixin, TimeStampedModel):
         ]
     )
 
-    history = HistoricalRecords()
+    history = DeferrableHistoricalRecords()
     pipeline_setting = 'OSCAR_REFUND_LINE_STATUS_PIPELINE'
 
     def deny(self):
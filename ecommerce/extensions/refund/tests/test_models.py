@@ -1,3 +1,5 @@
+import json
+
 import ddt
 from django.conf import settings
 import httpretty
@@ -57,6 +59,37 @@ class StatusTestsMixin(object):
                 instance.set_status(new_status)
                 self.assertEqual(instance.status, new_status, 'Refund status was not updated!')
 
+    def test_bulk_set_status_valid_status(self):
+        """ Verify the statuses of all objects are updated, and recorded, when transitioning to a valid status. """
+        for status, valid_statuses in self.pipeline.iteritems():
+            for new_status in valid_statuses:
+                instances = [self._get_instance(status=status) for __ in range(2)]
+                history_count = sum(instance.history.count() for instance in instances)
+
+                with self.assertNumQueries(2):
+                    instances[0].__class__.bulk_set_status(instances, new_status)
+
+                for instance in instances:
+                    self.assertEqual(instance.status, new_status)
+                    instance.refresh_from_db()
+                    self.assertEqual(instance.status, new_status)
+                    self.assertEqual(instance.history.first().status, new_status)
+
+                self.assertEqual(sum(instance.history.count() for instance in instances), history_count + 2)
+
+    def test_bulk_set_status_invalid_status(self):
+        """ Verify no objects are updated if the new status is invalid for any of them. """
+        for status, valid_statuses in self.pipeline.iteritems():
+            for new_status in valid_statuses:
+                # The first object may move to the new status, but the second, which already has it, may not.
+                instances = [self._get_instance(status=status), self._get_instance(status=new_status)]
+                if new_status in instances[1].available_statuses():
+                    continue
+
+                self.assertRaises(InvalidStatus, instances[0].__class__.bulk_set_status, instances, new_status)
+                instances[0].refresh_from_db()
+                self.assertEqual(instances[0].status, status)
+
 
 @ddt.ddt
 class RefundTests(RefundTestMixin, StatusTestsMixin, TestCase):
@@ -92,14 +125,14 @@ class RefundTests(RefundTestMixin, StatusTestsMixin, TestCase):
                 (
                     LOGGER_NAME,
                     'INFO',
-                    'refund_created: amount="{}", currency="{}", order_number="{}", '
-                    'refund_id="{}", user_id="{}"'.format(
-                        refund.total_credit_excl_tax,
-                        refund.currency,
-                        order.number,
-                        refund.id,
-                        refund.user.id
-                    )
+                    json.dumps({
+                        'event': 'refund_created',
+                        'amount': unicode(refund.total_credit_excl_tax),
+                        'currency': refund.currency,
+                        'order_number': order.number,
+                        'refund_id': refund.id,
+                        'user_id': refund.user.id,
+                    }, sort_keys=True)
                 )
             )
 
@@ -192,14 +225,14 @@ class RefundTests(RefundTestMixin, StatusTestsMixin, TestCase):
                 (
                     LOGGER_NAME,
                     'INFO',
-                    'credit_issued: amount="{}", currency="{}", processor_name="{}", '
-                    'refund_id="{}", user_id="{}"'.format(
-                        refund.total_credit_excl_tax,
-                        refund.currency,
-                        refund.order.sources.first().source_type.name,
-                        refund.id,
-                        refund.user.id
-                    )
+                    json.dumps({
+                        'event': 'credit_issued',
+                        'amount': unicode(refund.total_credit_excl_tax),
+                        'currency': refund.currency,
+                        'processor_name': refund.order.sources.first().source_type.name,
+                        'refund_id': refund.id,
+                        'user_id': refund.user.id,
+                    }, sort_keys=True)
                 )
             )
 
@@ -267,13 +300,13 @@ class RefundTests(RefundTestMixin, StatusTestsMixin, TestCase):
         # Create a Refund
         refund = self._get_instance()
 
-        # Make RefundLine.deny() raise an exception
-        with mock.patch('ecommerce.extensions.refund.models.RefundLine.deny', side_effect=Exception):
+        # Make RefundLine.bulk_set_status() raise an exception
+        with mock.patch('ecommerce.extensions.refund.models.RefundLine.bulk_set_status', side_effect=Exception):
             logger_name = 'ecommerce.extensions.refund.models'
 
             with LogCapture(logger_name) as l:
                 self.assertFalse(refund.deny())
-                l.check((logger_name, 'ERROR', 'Failed to deny RefundLine [{}].'.format(refund.lines.first().id)))
+                l.check((logger_name, 'ERROR', 'Failed to deny the lines of Refund [{}].'.format(refund.id)))
 
     @ddt.data(REFUND.REVOCATION_ERROR, REFUND.PAYMENT_REFUNDED, REFUND.PAYMENT_REFUND_ERROR, REFUND.COMPLETE)
     def test_deny_wrong_state(self, status):
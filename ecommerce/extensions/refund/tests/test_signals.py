@@ -18,6 +18,8 @@ class RefundTrackingTests(BusinessIntelligenceMixin, RefundTestMixin, TestCase):
 
         self.user = UserFactory()
         self.order = self.create_order()
+        # Events are built from the order as stored, whose number is a string.
+        self.order.refresh_from_db()
         self.refund = create_refunds([self.order], self.course.id)[0]
 
     def test_successful_refund_tracking(self, mock_track):
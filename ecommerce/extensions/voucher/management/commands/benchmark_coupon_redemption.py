@@ -0,0 +1,116 @@
+"""
+Management command that measures the rate at which enrollment codes can be redeemed.
+
+Codes are redeemed with both the enrollment code engine, used by CouponRedeemView for 100% single-product vouchers,
+and the general-purpose engine, which prepares the user's basket and applies every available offer. All data
+created by the benchmark, including the orders, is rolled back. Fulfillment is not performed.
+"""
+from __future__ import unicode_literals
+import datetime
+import time
+import uuid
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.sites.models import Site
+from django.core.management import BaseCommand
+from django.core.urlresolvers import reverse
+from django.db import transaction
+from django.test import RequestFactory
+from django.utils.timezone import now
+from oscar.core.loading import get_class, get_model
+
+from ecommerce.coupons.views import CouponRedeemView
+from ecommerce.courses.models import Course
+from ecommerce.extensions.voucher.utils import create_vouchers, get_voucher_resolution
+
+Benefit = get_model('offer', 'Benefit')
+Catalog = get_model('catalogue', 'Catalog')
+Product = get_model('catalogue', 'Product')
+ProductClass = get_model('catalogue', 'ProductClass')
+Selector = get_class('partner.strategy', 'Selector')
+Voucher = get_model('voucher', 'Voucher')
+
+ENGINES = ('enrollment_code', 'applicator')
+
+
+class Command(BaseCommand):
+    help = 'Measure the number of enrollment codes which can be redeemed per second.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('-n', '--redemptions',
+                            action='store',
+                            dest='redemptions',
+                            default=100,
+                            type=int,
+                            help='Number of codes to redeem with each engine.')
+        parser.add_argument('--site-id',
+                            action='store',
+                            dest='site_id',
+                            default=settings.SITE_ID,
+                            type=int,
+                            help='ID of the Site for which codes are redeemed.')
+
+    def handle(self, *args, **options):
+        site = Site.objects.select_related('siteconfiguration__partner').get(id=options['site_id'])
+
+        with transaction.atomic():
+            for engine in ENGINES:
+                self.stderr.write('Redeeming [{}] codes with the [{}] engine...'.format(options['redemptions'], engine))
+                elapsed = self.benchmark(site, engine, options['redemptions'])
+                self.stderr.write(
+                    'Redeemed [{count}] codes in [{elapsed:.3f}] seconds ([{rate:.1f}] per second).'.format(
+                        count=options['redemptions'],
+                        elapsed=elapsed,
+                        rate=options['redemptions'] / elapsed
+                    )
+                )
+
+            transaction.set_rollback(True)
+
+        self.stderr.write('Done.')
+
+    def benchmark(self, site, engine, redemptions):
+        """ Redeem the given number of codes with the given engine, and return the number of seconds taken. """
+        partner = site.siteconfiguration.partner
+        name = 'Benchmark ({})'.format(engine)
+        user = get_user_model().objects.create_user(username='benchmark-{}'.format(uuid.uuid4().hex[:20]))
+        course = Course.objects.create(id='benchmark/{}/run'.format(uuid.uuid4().hex), name=name)
+        seat = course.create_or_update_seat('verified', True, 100, partner)
+
+        catalog = Catalog.objects.create(name=name, partner=partner)
+        catalog.stock_records.add(seat.stockrecords.get(partner=partner))
+        coupon = Product.objects.create(product_class=ProductClass.objects.get(slug='coupon'), title=name)
+        vouchers = create_vouchers(
+            benefit_type=Benefit.PERCENTAGE,
+            benefit_value=100,
+            catalog=catalog,
+            coupon=coupon,
+            end_datetime=now() + datetime.timedelta(days=1),
+            name=name,
+            quantity=redemptions,
+            start_datetime=now() - datetime.timedelta(days=1),
+            voucher_type=Voucher.SINGLE_USE
+        )
+
+        request = RequestFactory().get(reverse('coupons:redeem'))
+        request.user = user
+        request.site = site
+        request.strategy = Selector().strategy(user=user)
+        view = CouponRedeemView()
+        view.request = request
+
+        start = time.time()
+        for voucher in vouchers:
+            resolution = get_voucher_resolution(voucher.code)
+            if engine == 'enrollment_code':
+                view._redeem_enrollment_code(  # pylint: disable=protected-access
+                    site, user, resolution['product'], voucher, resolution['offer']
+                )
+            else:
+                basket = view._prepare_basket(  # pylint: disable=protected-access
+                    site, user, resolution['product'], voucher
+                )
+                view._place_free_order(basket)  # pylint: disable=protected-access
+
+        return time.time() - start
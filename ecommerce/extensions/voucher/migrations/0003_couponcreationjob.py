@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import jsonfield.fields
+from django.conf import settings
+import django.db.models.deletion
+import django.utils.timezone
+import django_extensions.db.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sites', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('voucher', '0002_couponvouchers'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CouponCreationJob',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('created', django_extensions.db.fields.CreationDateTimeField(default=django.utils.timezone.now, verbose_name='created', editable=False, blank=True)),
+                ('modified', django_extensions.db.fields.ModificationDateTimeField(default=django.utils.timezone.now, verbose_name='modified', editable=False, blank=True)),
+                ('parameters', jsonfield.fields.JSONField(help_text='Data with which the coupon creation endpoint was called.')),
+                ('quantity', models.PositiveIntegerField()),
+                ('status', models.CharField(default=b'Pending', max_length=32, choices=[(b'Pending', 'Pending'), (b'Running', 'Running'), (b'Succeeded', 'Succeeded'), (b'Failed', 'Failed')])),
+                ('result', jsonfield.fields.JSONField(help_text='Data returned by the coupon creation endpoint.', null=True, blank=True)),
+                ('error', models.TextField(blank=True)),
+                ('requested_by', models.ForeignKey(on_delete=django.db.models.deletion.SET_NULL, blank=True, to=settings.AUTH_USER_MODEL, null=True)),
+                ('site', models.ForeignKey(on_delete=django.db.models.deletion.SET_NULL, blank=True, to='sites.Site', null=True)),
+            ],
+            options={
+                'ordering': ('-modified', '-created'),
+                'abstract': False,
+                'get_latest_by': 'modified',
+            },
+        ),
+    ]
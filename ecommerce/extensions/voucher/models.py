@@ -1,10 +1,59 @@
 # noinspection PyUnresolvedReferences
+from django.conf import settings
+from django.core.cache import cache
 from django.db import models
+from django.utils.translation import ugettext_lazy as _
+from django_extensions.db.models import TimeStampedModel
+from jsonfield import JSONField
 
 
 class CouponVouchers(models.Model):
     coupon = models.ForeignKey('catalogue.Product', related_name='coupon_vouchers')
     vouchers = models.ManyToManyField('voucher.Voucher', blank=True, related_name='coupon_vouchers')
 
+
+class CouponCreationJob(TimeStampedModel):
+    """ Tracks the creation of a coupon, and its vouchers, in the background.
+
+    Progress is reported through the cache while the job runs, since the vouchers are created in a transaction
+    which is not visible to other connections until the job completes.
+    """
+    PENDING, RUNNING, SUCCEEDED, FAILED = 'Pending', 'Running', 'Succeeded', 'Failed'
+    STATUS_CHOICES = (
+        (PENDING, _('Pending')),
+        (RUNNING, _('Running')),
+        (SUCCEEDED, _('Succeeded')),
+        (FAILED, _('Failed')),
+    )
+
+    site = models.ForeignKey('sites.Site', null=True, blank=True, on_delete=models.SET_NULL)
+    requested_by = models.ForeignKey(settings.AUTH_USER_MODEL, null=True, blank=True, on_delete=models.SET_NULL)
+    parameters = JSONField(help_text=_('Data with which the coupon creation endpoint was called.'))
+    quantity = models.PositiveIntegerField()
+    status = models.CharField(max_length=32, default=PENDING, choices=STATUS_CHOICES)
+    result = JSONField(null=True, blank=True, help_text=_('Data returned by the coupon creation endpoint.'))
+    error = models.TextField(blank=True)
+
+    @property
+    def progress_cache_key(self):
+        return 'coupon_creation_job_progress_{}'.format(self.id)
+
+    @property
+    def progress(self):
+        """ Number of vouchers created so far. """
+        if self.status == self.SUCCEEDED:
+            return self.quantity
+        if self.status == self.RUNNING:
+            return cache.get(self.progress_cache_key, 0)
+        return 0
+
+    def set_progress(self, vouchers_created):
+        cache.set(self.progress_cache_key, vouchers_created, settings.COUPON_CREATION_JOB_PROGRESS_TIMEOUT)
+
+    def __unicode__(self):
+        return u'{id}: {status} creation of {quantity} vouchers'.format(
+            id=self.id, status=self.status, quantity=self.quantity
+        )
+
 # noinspection PyUnresolvedReferences
 from oscar.apps.voucher.models import *  # noqa pylint: disable=wildcard-import,unused-wildcard-import,wrong-import-position
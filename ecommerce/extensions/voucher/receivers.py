@@ -0,0 +1,55 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from oscar.core.loading import get_model
+
+from ecommerce.extensions.offer.utils import is_usage_update
+from ecommerce.extensions.voucher.utils import invalidate_voucher_resolution, invalidate_voucher_resolutions
+
+Benefit = get_model('offer', 'Benefit')
+Catalog = get_model('catalogue', 'Catalog')
+ConditionalOffer = get_model('offer', 'ConditionalOffer')
+Product = get_model('catalogue', 'Product')
+Range = get_model('offer', 'Range')
+RangeProduct = get_model('offer', 'RangeProduct')
+StockRecord = get_model('partner', 'StockRecord')
+Voucher = get_model('voucher', 'Voucher')
+
+
+@receiver(post_save, sender=Voucher, dispatch_uid='voucher.invalidate_resolution')
+def invalidate_resolution(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """ Remove the cached resolution of the modified Voucher's code, unless only its usage was recorded. """
+    if not is_usage_update(instance):
+        invalidate_voucher_resolution(instance.code)
+
+
+@receiver(post_save, sender=ConditionalOffer, dispatch_uid='voucher.invalidate_resolutions_on_offer_save')
+def invalidate_resolutions_on_offer_save(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """ Invalidate all cached voucher resolutions when an offer is modified, unless only its usage was recorded. """
+    if not is_usage_update(instance):
+        invalidate_voucher_resolutions()
+
+
+@receiver(post_delete, sender=Voucher, dispatch_uid='voucher.invalidate_resolutions_on_voucher_delete')
+@receiver(m2m_changed, sender=Voucher.offers.through, dispatch_uid='voucher.invalidate_resolutions_on_offers_change')
+@receiver(post_delete, sender=ConditionalOffer, dispatch_uid='voucher.invalidate_resolutions_on_offer_delete')
+@receiver(post_save, sender=Benefit, dispatch_uid='voucher.invalidate_resolutions_on_benefit_save')
+@receiver(post_delete, sender=Benefit, dispatch_uid='voucher.invalidate_resolutions_on_benefit_delete')
+@receiver(post_save, sender=Range, dispatch_uid='voucher.invalidate_resolutions_on_range_save')
+@receiver(post_delete, sender=Range, dispatch_uid='voucher.invalidate_resolutions_on_range_delete')
+@receiver(post_save, sender=RangeProduct, dispatch_uid='voucher.invalidate_resolutions_on_range_product_save')
+@receiver(post_delete, sender=RangeProduct, dispatch_uid='voucher.invalidate_resolutions_on_range_product_delete')
+@receiver(m2m_changed, sender=Range.excluded_products.through,
+          dispatch_uid='voucher.invalidate_resolutions_on_excluded_products_change')
+@receiver(m2m_changed, sender=Range.classes.through,
+          dispatch_uid='voucher.invalidate_resolutions_on_range_classes_change')
+@receiver(m2m_changed, sender=Range.included_categories.through,
+          dispatch_uid='voucher.invalidate_resolutions_on_range_categories_change')
+@receiver(m2m_changed, sender=Catalog.stock_records.through,
+          dispatch_uid='voucher.invalidate_resolutions_on_catalog_change')
+@receiver(post_save, sender=StockRecord, dispatch_uid='voucher.invalidate_resolutions_on_stock_record_save')
+@receiver(post_delete, sender=StockRecord, dispatch_uid='voucher.invalidate_resolutions_on_stock_record_delete')
+@receiver(post_save, sender=Product, dispatch_uid='voucher.invalidate_resolutions_on_product_save')
+@receiver(post_delete, sender=Product, dispatch_uid='voucher.invalidate_resolutions_on_product_delete')
+def invalidate_resolutions(sender, **kwargs):  # pylint: disable=unused-argument
+    """ Invalidate all cached voucher resolutions, since any number of vouchers may depend on the modified object. """
+    invalidate_voucher_resolutions()
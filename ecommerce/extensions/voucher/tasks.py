@@ -0,0 +1,55 @@
+"""
+Celery tasks which create coupons.
+
+Coupons with many vouchers take minutes to create, so they are created by these tasks rather than during the
+request. See CouponCreationJob.
+"""
+import logging
+
+from celery import shared_task
+from django.db import transaction
+from oscar.core.loading import get_model
+
+logger = logging.getLogger(__name__)
+CouponCreationJob = get_model('voucher', 'CouponCreationJob')
+
+MAX_RETRIES = 5
+# Seconds to wait for the transaction which created the job to be committed.
+RETRY_DELAY = 5
+
+
+@shared_task(bind=True, ignore_result=True, max_retries=MAX_RETRIES)
+def create_coupon(self, job_id):
+    """Create the coupon requested by a CouponCreationJob.
+
+    The coupon, vouchers, basket and order are created in a single transaction, so nothing is left behind if the
+    job fails. Jobs which are not pending (e.g. because the task has been delivered twice) are ignored.
+    """
+    # Avoid a circular import, since the coupon API imports this module.
+    from ecommerce.extensions.api.v2.views.coupons import CouponViewSet
+
+    # The job is created by a request whose transaction may not have been committed yet.
+    if not CouponCreationJob.objects.filter(id=job_id).exists():
+        logger.warning('Coupon creation job [%d] does not exist. Retrying.', job_id)
+        raise self.retry(countdown=RETRY_DELAY)
+
+    if not CouponCreationJob.objects.filter(id=job_id, status=CouponCreationJob.PENDING).update(
+            status=CouponCreationJob.RUNNING):
+        logger.info('Coupon creation job [%d] is not pending. Skipping.', job_id)
+        return
+
+    job = CouponCreationJob.objects.select_related('site__siteconfiguration__partner').get(id=job_id)
+    logger.info('Creating [%d] vouchers for coupon creation job [%d].', job.quantity, job.id)
+
+    try:
+        with transaction.atomic():
+            job.result = CouponViewSet().create_coupon(job.site, job.parameters, progress_callback=job.set_progress)
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.exception('Coupon creation job [%d] failed.', job.id)
+        job.status = CouponCreationJob.FAILED
+        job.error = unicode(exc)
+    else:
+        logger.info('Coupon creation job [%d] succeeded.', job.id)
+        job.status = CouponCreationJob.SUCCEEDED
+
+    job.save()
@@ -0,0 +1,35 @@
+from __future__ import unicode_literals
+from StringIO import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from oscar.core.loading import get_model
+
+from ecommerce.courses.models import Course
+from ecommerce.tests.testcases import TestCase
+
+Basket = get_model('basket', 'Basket')
+Order = get_model('order', 'Order')
+Voucher = get_model('voucher', 'Voucher')
+
+
+class BenchmarkCouponRedemptionCommandTests(TestCase):
+    command = 'benchmark_coupon_redemption'
+
+    def setUp(self):
+        super(BenchmarkCouponRedemptionCommandTests, self).setUp()
+        cache.clear()
+
+    def test_benchmark(self):
+        """ Verify codes are redeemed with each engine, and all data created by the benchmark is rolled back. """
+        err = StringIO()
+        call_command(self.command, redemptions=2, site_id=self.site.id, stderr=err)
+
+        output = err.getvalue()
+        self.assertIn('Redeeming [2] codes with the [enrollment_code] engine...', output)
+        self.assertIn('Redeeming [2] codes with the [applicator] engine...', output)
+        self.assertEqual(output.count('per second'), 2)
+        self.assertTrue(output.endswith('Done.\n'))
+
+        for model in (Basket, Course, Order, Voucher):
+            self.assertFalse(model.objects.exists())
@@ -1,14 +1,19 @@
 import datetime
 
+from decimal import Decimal
+
 from django.conf import settings
+from django.core.cache import cache
 from django.db import IntegrityError
 from django.test import override_settings
-from oscar.core.loading import get_model
+import mock
+from oscar.core.loading import get_class, get_model
 from oscar.test import factories
 
-from ecommerce.extensions.voucher.utils import create_vouchers, generate_coupon_report
+from ecommerce.extensions.voucher.utils import create_vouchers, generate_coupon_report, get_voucher_resolution
 from ecommerce.tests.testcases import TestCase
 
+Applicator = get_class('offer.utils', 'Applicator')
 Benefit = get_model('offer', 'Benefit')
 Catalog = get_model('catalogue', 'Catalog')
 CouponVouchers = get_model('voucher', 'CouponVouchers')
@@ -209,3 +214,127 @@ class UtilTests(TestCase):
             enrollment_code_row['URL'],
             settings.ECOMMERCE_URL_ROOT + REDEMPTION_URL.format(enrollment_code_row['Code'])
         )
+
+
+class VoucherResolutionTests(TestCase):
+    def setUp(self):
+        super(VoucherResolutionTests, self).setUp()
+        cache.clear()
+
+        self.catalog = Catalog.objects.create(partner=self.partner)
+        self.product = factories.create_product(title='Test product')
+        self.stock_record = factories.create_stockrecord(self.product, price_excl_tax=Decimal('50.00'))
+        self.catalog.stock_records.add(self.stock_record)
+
+        coupon = factories.create_product(product_class=ProductClass.objects.get_or_create(name='coupon')[0])
+        self.voucher = create_vouchers(
+            benefit_type=Benefit.PERCENTAGE,
+            benefit_value=100.00,
+            catalog=self.catalog,
+            coupon=coupon,
+            end_datetime=datetime.date(2015, 10, 30),
+            name='Test voucher',
+            quantity=1,
+            start_datetime=datetime.date(2015, 10, 1),
+            voucher_type=Voucher.SINGLE_USE
+        )[0]
+        self.offer = self.voucher.offers.first()
+
+    def test_get_voucher_resolution(self):
+        """ Verify the voucher is resolved to its offer, benefit, product and price, and cached. """
+        expected = {
+            'voucher': self.voucher,
+            'offer': self.offer,
+            'benefit': self.offer.benefit,
+            'product': self.product,
+            'price': Decimal('50.00'),
+            'single_product': True,
+        }
+        self.assertEqual(get_voucher_resolution(self.voucher.code), expected)
+
+        # Only the voucher, with its offer, benefit and range, is loaded once the resolution is cached.
+        with self.assertNumQueries(1):
+            resolution = get_voucher_resolution(self.voucher.code)
+        self.assertEqual(resolution, expected)
+        self.assertEqual(resolution['product'].title, self.product.title)
+        self.assertEqual(resolution['product'].product_class_id, self.product.product_class_id)
+
+    def test_get_voucher_resolution_without_offer(self):
+        """ Verify vouchers without offers are resolved, and cached. """
+        self.voucher.offers.clear()
+        get_voucher_resolution(self.voucher.code)
+
+        with self.assertNumQueries(1):
+            resolution = get_voucher_resolution(self.voucher.code)
+        self.assertEqual(resolution['voucher'], self.voucher)
+        self.assertIsNone(resolution['offer'])
+
+    def test_get_voucher_resolution_without_voucher(self):
+        """ Verify None is returned if no voucher exists for the code. """
+        self.assertIsNone(get_voucher_resolution('DOESNOTEXIST'))
+
+    def test_invalidated_on_voucher_change(self):
+        """ Verify the cached resolution is invalidated when the voucher is modified. """
+        get_voucher_resolution(self.voucher.code)
+        self.voucher.name = 'Updated'
+        self.voucher.save()
+        self.assertEqual(get_voucher_resolution(self.voucher.code)['voucher'].name, 'Updated')
+
+    def test_invalidated_on_offer_change(self):
+        """ Verify the cached resolution is invalidated when the voucher's offer is modified. """
+        get_voucher_resolution(self.voucher.code)
+        benefit = self.offer.benefit
+        benefit.value = 50
+        benefit.save()
+        self.assertEqual(get_voucher_resolution(self.voucher.code)['benefit'].value, 50)
+
+        self.voucher.offers.clear()
+        self.assertIsNone(get_voucher_resolution(self.voucher.code)['offer'])
+
+    def test_retained_on_order_placement(self):
+        """ Verify placing an order, which records the usage of its voucher and offer, does not invalidate the
+        cached resolutions of other codes. """
+        voucher, other_voucher = create_vouchers(
+            benefit_type=Benefit.PERCENTAGE,
+            benefit_value=100.00,
+            catalog=self.catalog,
+            coupon=factories.create_product(product_class=ProductClass.objects.get(name='coupon')),
+            end_datetime=datetime.date(2015, 10, 30),
+            name='Shared voucher',
+            quantity=2,
+            start_datetime=datetime.date(2015, 10, 1),
+            voucher_type=Voucher.SINGLE_USE
+        )
+        get_voucher_resolution(self.voucher.code)
+        get_voucher_resolution(other_voucher.code)
+
+        basket = factories.create_basket(empty=True)
+        basket.add_product(self.product)
+        basket.vouchers.add(voucher)
+        Applicator().apply_offers(basket, voucher.offers.all())
+        factories.create_order(basket=basket, user=self.create_user())
+
+        offer = voucher.offers.get()
+        self.assertEqual(offer.num_orders, 1)
+
+        with mock.patch('ecommerce.extensions.voucher.utils._resolve_voucher') as mock_resolve:
+            self.assertEqual(get_voucher_resolution(self.voucher.code)['voucher'], self.voucher)
+            resolution = get_voucher_resolution(other_voucher.code)
+            self.assertFalse(mock_resolve.called)
+
+        # The voucher and offer are loaded afresh, with their updated usage.
+        self.assertEqual(resolution['offer'].num_orders, 1)
+
+    def test_invalidated_on_range_change(self):
+        """ Verify the cached resolution is invalidated when the products in the voucher's range change. """
+        get_voucher_resolution(self.voucher.code)
+        self.stock_record.price_excl_tax = Decimal('25.00')
+        self.stock_record.save()
+        self.assertEqual(get_voucher_resolution(self.voucher.code)['price'], Decimal('25.00'))
+
+        other_product = factories.create_product()
+        self.catalog.stock_records.add(factories.create_stockrecord(other_product, price_excl_tax=Decimal('50.00')))
+        self.assertFalse(get_voucher_resolution(self.voucher.code)['single_product'])
+
+        self.catalog.stock_records.clear()
+        self.assertIsNone(get_voucher_resolution(self.voucher.code)['product'])
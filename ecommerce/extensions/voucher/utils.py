@@ -1,9 +1,13 @@
 """Order Utility Classes. """
+from hashlib import md5
 import logging
 import random
 import string  # pylint: disable=deprecated-module
+import uuid
 
 from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
 from django.utils.translation import ugettext_lazy as _
 from oscar.core.loading import get_model
 
@@ -13,10 +17,15 @@ Benefit = get_model('offer', 'Benefit')
 Condition = get_model('offer', 'Condition')
 ConditionalOffer = get_model('offer', 'ConditionalOffer')
 CouponVouchers = get_model('voucher', 'CouponVouchers')
+Product = get_model('catalogue', 'Product')
 Range = get_model('offer', 'Range')
 StockRecord = get_model('partner', 'StockRecord')
 Voucher = get_model('voucher', 'Voucher')
 
+# Cache key holding the current generation of voucher resolutions. Changing the generation, rather than deleting
+# individual entries, invalidates every resolution at once.
+VOUCHER_RESOLUTION_GENERATION_KEY = 'voucher_resolution_generation'
+
 
 def generate_coupon_report(coupon_vouchers):
     """
@@ -162,7 +171,8 @@ def create_vouchers(
         quantity,
         start_datetime,
         voucher_type,
-        code=None):
+        code=None,
+        progress_callback=None):
     """
     Create vouchers
 
@@ -178,6 +188,7 @@ def create_vouchers(
             start_datetime (datetime): Start date for voucher offer.
             voucher_type (str): Type of voucher.
             code (str): Code associated with vouchers. Defaults to None.
+            progress_callback (callable): Called with the number of vouchers created, after each is created.
 
     Returns:
             List[Voucher]
@@ -210,4 +221,174 @@ def create_vouchers(
         )
         vouchers.append(voucher)
 
+        if progress_callback:
+            progress_callback(len(vouchers))
+
     return vouchers
+
+
+def get_voucher_resolution(code):
+    """
+    Returns the voucher for the given code, along with its offer, benefit, product and price.
+
+    Resolutions are cached, and invalidated by the receivers in ecommerce.extensions.voucher.receivers whenever the
+    voucher, or the offers, ranges, catalogs and products it depends upon, are modified other than by recording their
+    usage.
+
+    Arguments:
+        code (str): The code of a coupon voucher.
+
+    Returns:
+        dict: Containing the voucher, offer, benefit, product and price; or None if no voucher exists for the code.
+            The offer, benefit, product and price may be None. The dict also indicates whether the product is the
+            only product in the benefit's range ('single_product').
+    """
+    key = _get_voucher_resolution_cache_key(code)
+    cached = cache.get(key)
+    resolution = _load_resolution(cached) if cached else None
+    if resolution is None:
+        resolution = _resolve_voucher(code)
+        if resolution is None:
+            return None
+
+        product_id = resolution.pop('product_id')
+        resolution['product'] = Product.objects.get(id=product_id) if product_id else None
+
+        # The voucher and offer are loaded afresh, by ID, so that their usage counters are never stale, and recording
+        # their usage need not invalidate the resolution. The product, whose attribute container cannot be pickled,
+        # is cached as its field values, so that it need not be loaded by another query.
+        cache.set(key, {
+            'voucher_id': resolution['voucher'].id,
+            'offer_id': resolution['offer'].id if resolution['offer'] else None,
+            'product_fields': _get_field_values(resolution['product']) if product_id else None,
+            'price': resolution['price'],
+            'single_product': resolution['single_product'],
+        }, settings.VOUCHER_RESOLUTION_CACHE_TIMEOUT)
+
+    return resolution
+
+
+def invalidate_voucher_resolution(code):
+    """ Removes the cached resolution for the given voucher code. """
+    cache.delete(_get_voucher_resolution_cache_key(code))
+
+
+def invalidate_voucher_resolutions():
+    """ Invalidates all cached voucher resolutions. """
+    cache.set(VOUCHER_RESOLUTION_GENERATION_KEY, uuid.uuid4().hex, None)
+
+
+def _get_voucher_resolution_cache_key(code):
+    generation = cache.get(VOUCHER_RESOLUTION_GENERATION_KEY)
+    if generation is None:
+        cache.add(VOUCHER_RESOLUTION_GENERATION_KEY, uuid.uuid4().hex, None)
+        generation = cache.get(VOUCHER_RESOLUTION_GENERATION_KEY)
+
+    return 'voucher_resolution_{}_{}'.format(generation, md5(code.encode('utf-8')).hexdigest())
+
+
+def _get_field_values(instance):
+    return {
+        field.attname: getattr(instance, field.attname)
+        for field in instance._meta.concrete_fields  # pylint: disable=protected-access
+    }
+
+
+def _build_instance(model, field_values):
+    """ Returns an instance of the model, as if loaded from the database, with the given field values. """
+    instance = model(**field_values)
+    instance._state.adding = False  # pylint: disable=protected-access
+    instance._state.db = DEFAULT_DB_ALIAS  # pylint: disable=protected-access
+    return instance
+
+
+def _load_resolution(cached):
+    """
+    Loads the voucher, offer and benefit of a cached resolution, with a single query, and builds its product from the
+    cached field values. Returns None if the voucher or offer no longer exist.
+    """
+    if cached['offer_id']:
+        # The voucher, offer, benefit, condition and range are retrieved in a single query.
+        voucher_offer = Voucher.offers.through.objects.select_related(
+            'voucher', 'conditionaloffer__benefit__range', 'conditionaloffer__condition'
+        ).filter(voucher_id=cached['voucher_id'], conditionaloffer_id=cached['offer_id']).first()
+        if voucher_offer is None:
+            return None
+        voucher = voucher_offer.voucher
+        offer = voucher_offer.conditionaloffer
+    else:
+        voucher = Voucher.objects.filter(id=cached['voucher_id']).first()
+        if voucher is None:
+            return None
+        offer = None
+
+    return {
+        'voucher': voucher,
+        'offer': offer,
+        'benefit': offer.benefit if offer else None,
+        'product': _build_instance(Product, cached['product_fields']) if cached['product_fields'] else None,
+        'price': cached['price'],
+        'single_product': cached['single_product'],
+    }
+
+
+def _resolve_voucher(code):
+    # The voucher, offer, benefit, condition, range and catalog are retrieved in a single query.
+    voucher_offer = Voucher.offers.through.objects.select_related(
+        'voucher', 'conditionaloffer__benefit__range__catalog', 'conditionaloffer__condition'
+    ).filter(voucher__code=code).order_by('id').first()
+
+    if voucher_offer:
+        voucher = voucher_offer.voucher
+        offer = voucher_offer.conditionaloffer
+    else:
+        try:
+            voucher = Voucher.objects.get(code=code)
+        except Voucher.DoesNotExist:
+            return None
+        offer = None
+
+    benefit = offer.benefit if offer else None
+    product_range = benefit.range if benefit else None
+    product_id = None
+    price = None
+    single_product = False
+
+    if product_range:
+        stock_record = None
+        if product_range.catalog:
+            stock_record = product_range.catalog.stock_records.order_by('id').first()
+
+        if stock_record:
+            product_id = stock_record.product_id
+            price = stock_record.price_excl_tax
+        else:
+            products = list(product_range.all_products()[:1])
+            if products:
+                product_id = products[0].id
+                stock_record = products[0].stockrecords.first()
+                price = stock_record.price_excl_tax if stock_record else None
+
+        single_product = product_id is not None and _range_contains_only(product_range, product_id)
+
+    return {
+        'voucher': voucher,
+        'offer': offer,
+        'benefit': benefit,
+        'product_id': product_id,
+        'price': price,
+        'single_product': single_product,
+    }
+
+
+def _range_contains_only(product_range, product_id):
+    """ Returns True if the given product is the only product in the range. """
+    if (product_range.proxy_class or product_range.includes_all_products or product_range.classes.exists() or
+            product_range.included_categories.exists()):
+        return False
+
+    product_ids = set(product_range.catalog_product_ids())
+    product_ids.update(product_range.included_products.values_list('id', flat=True))
+    product_ids.difference_update(product_range.excluded_products.values_list('id', flat=True))
+
+    return product_ids == {product_id}
@@ -1,7 +1,8 @@
 from django_extensions.db.models import TimeStampedModel
 from django.db import models
 from django.utils.translation import ugettext_lazy as _
-from simple_history.models import HistoricalRecords
+
+from ecommerce.core.history import DeferrableHistoricalRecords
 
 
 class Invoice(TimeStampedModel):
@@ -13,7 +14,7 @@ class Invoice(TimeStampedModel):
     basket = models.ForeignKey('basket.Basket', null=False, blank=False)
     state = models.CharField(max_length=255, default=NOT_PAID, choices=state_choices)
 
-    history = HistoricalRecords()
+    history = DeferrableHistoricalRecords()
 
     def __str__(self):
         return 'Invoice {id} for order number {order}'.format(id=self.id, order=self.basket.order.number)
@@ -61,10 +61,31 @@ OSCAR_LINE_STATUS_PIPELINE = {
         LINE.FULFILLMENT_TIMEOUT_ERROR,
         LINE.FULFILLMENT_SERVER_ERROR,
     ),
-    LINE.FULFILLMENT_CONFIGURATION_ERROR: (LINE.COMPLETE,),
-    LINE.FULFILLMENT_NETWORK_ERROR: (LINE.COMPLETE,),
-    LINE.FULFILLMENT_TIMEOUT_ERROR: (LINE.COMPLETE,),
-    LINE.FULFILLMENT_SERVER_ERROR: (LINE.COMPLETE,),
+    # Lines which fail to be fulfilled may be retried, and fail again for a different reason.
+    LINE.FULFILLMENT_CONFIGURATION_ERROR: (
+        LINE.COMPLETE,
+        LINE.FULFILLMENT_NETWORK_ERROR,
+        LINE.FULFILLMENT_TIMEOUT_ERROR,
+        LINE.FULFILLMENT_SERVER_ERROR,
+    ),
+    LINE.FULFILLMENT_NETWORK_ERROR: (
+        LINE.COMPLETE,
+        LINE.FULFILLMENT_CONFIGURATION_ERROR,
+        LINE.FULFILLMENT_TIMEOUT_ERROR,
+        LINE.FULFILLMENT_SERVER_ERROR,
+    ),
+    LINE.FULFILLMENT_TIMEOUT_ERROR: (
+        LINE.COMPLETE,
+        LINE.FULFILLMENT_CONFIGURATION_ERROR,
+        LINE.FULFILLMENT_NETWORK_ERROR,
+        LINE.FULFILLMENT_SERVER_ERROR,
+    ),
+    LINE.FULFILLMENT_SERVER_ERROR: (
+        LINE.COMPLETE,
+        LINE.FULFILLMENT_CONFIGURATION_ERROR,
+        LINE.FULFILLMENT_NETWORK_ERROR,
+        LINE.FULFILLMENT_TIMEOUT_ERROR,
+    ),
     LINE.COMPLETE: (),
 }
 
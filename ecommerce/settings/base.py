@@ -189,12 +189,14 @@ MIDDLEWARE_CLASSES = (
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.contrib.sites.middleware.CurrentSiteMiddleware',
+    'ecommerce.core.middleware.SiteConfigurationMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'waffle.middleware.WaffleMiddleware',
     'oscar.apps.basket.middleware.BasketMiddleware',
     'django.contrib.flatpages.middleware.FlatpageFallbackMiddleware',
     'social.apps.django_app.middleware.SocialAuthExceptionMiddleware',
     'simple_history.middleware.HistoryRequestMiddleware',
+    'ecommerce.core.middleware.DeferredHistoryMiddleware',
 )
 # END MIDDLEWARE CONFIGURATION
 
@@ -225,6 +227,39 @@ COMMERCE_API_URL = None
 # PROVIDER DATA PROCESSING
 PROVIDER_DATA_PROCESSING_TIMEOUT = 15  # Value is in seconds.
 CREDIT_PROVIDER_CACHE_TIMEOUT = 600
+# Seconds for which credit provider data may be served, while it is refreshed, after it has expired.
+CREDIT_PROVIDER_STALE_CACHE_TIMEOUT = 3600
+# Seconds for which a failure to retrieve credit provider data is cached.
+CREDIT_PROVIDER_NEGATIVE_CACHE_TIMEOUT = 60
+
+# Seconds for which course information retrieved from the LMS Course API is cached.
+COURSE_INFO_CACHE_TIMEOUT = 3600
+# Seconds for which course information may be served, while it is refreshed, after it has expired.
+COURSE_INFO_STALE_CACHE_TIMEOUT = 86400
+# Seconds for which a failure to retrieve course information is cached.
+COURSE_INFO_NEGATIVE_CACHE_TIMEOUT = 60
+
+# Seconds for which the offer, product and price associated with a voucher code are cached.
+VOUCHER_RESOLUTION_CACHE_TIMEOUT = 3600
+
+# Seconds for which the index of site offers, by the products to which they may apply, is cached.
+SITE_OFFER_INDEX_CACHE_TIMEOUT = 3600
+
+# Seconds for which the IDs of the products in each catalog are cached.
+CATALOG_PRODUCT_IDS_CACHE_TIMEOUT = 3600
+
+# Historical records of these models are written at the end of each request, one INSERT per model, rather than
+# as each object is saved. See ecommerce.core.history.
+HISTORY_DEFERRED_MODELS = ('order.Order', 'order.Line', 'refund.Refund', 'refund.RefundLine')
+# Fields, by model, whose changes alone are not recorded as history.
+HISTORY_IGNORED_FIELDS = {
+    'catalogue.Product': ('date_updated',),
+}
+
+# Coupons with more vouchers than this are created in the background, by a CouponCreationJob.
+COUPON_CREATION_ASYNC_THRESHOLD = 100
+# Seconds for which the progress of a running CouponCreationJob is retained.
+COUPON_CREATION_JOB_PROGRESS_TIMEOUT = 3600
 
 # OAuth2 provider URL used for OAuth2 transactions (e.g. validating access tokens)
 OAUTH2_PROVIDER_URL = None
@@ -386,6 +421,12 @@ EXTRA_SCOPE = ['permissions']
 # Specify a key to emit events to the corresponding Segment project. `None` disables tracking.
 # See: https://segment.com/docs/libraries/python/
 SEGMENT_KEY = None
+
+# Class, implementing track(), through which tracking events are emitted.
+ANALYTICS_EMITTER = 'ecommerce.extensions.analytics.emitters.SegmentEmitter'
+
+# Maximum number of events awaiting upload to Segment. Events emitted while the queue is full are dropped.
+SEGMENT_MAX_QUEUE_SIZE = 10000
 # END ANALYTICS
 
 
@@ -432,6 +473,8 @@ BROKER_URL = None
 # See http://celery.readthedocs.org/en/latest/configuration.html#celery-imports.
 CELERY_IMPORTS = (
     'ecommerce_worker.fulfillment.v1.tasks',
+    'ecommerce.extensions.checkout.tasks',
+    'ecommerce.extensions.voucher.tasks',
 )
 
 # Prevent Celery from removing handlers on the root logger. Allows setting custom logging handlers.
@@ -110,13 +110,17 @@ def get_logger_config(log_dir='/var/tmp',
         })
     else:
         logger_config['handlers'].update({
+            # Records are written to syslog by a background thread, so that requests do not wait on log I/O.
             'local': {
                 'level': local_loglevel,
-                'class': 'logging.handlers.SysLogHandler',
-                # Use a different address for Mac OS X
-                'address': '/var/run/syslog' if sys.platform == "darwin" else '/dev/log',
+                '()': 'ecommerce.core.log_handlers.QueueHandler',
                 'formatter': 'syslog_format',
-                'facility': SysLogHandler.LOG_LOCAL0,
+                'target': {
+                    'class': 'logging.handlers.SysLogHandler',
+                    # Use a different address for Mac OS X
+                    'address': '/var/run/syslog' if sys.platform == "darwin" else '/dev/log',
+                    'facility': SysLogHandler.LOG_LOCAL0,
+                },
             },
         })
 
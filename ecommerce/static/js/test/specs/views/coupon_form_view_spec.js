@@ -169,6 +169,50 @@ define([
                 });
             });
 
+            describe('background creation', function () {
+                var jobUrl = '/api/v2/coupon_jobs/1/',
+                    jobs;
+
+                beforeEach(function () {
+                    jasmine.clock().install();
+                    jobs = [];
+                    spyOn($, 'ajax').and.callFake(function (options) {
+                        options.success(jobs.shift());
+                    });
+                    spyOn(view, 'goTo');
+                    spyOn(view, 'renderAlert');
+                });
+
+                afterEach(function () {
+                    jasmine.clock().uninstall();
+                });
+
+                it('should navigate to the coupon created without a job', function () {
+                    view.saveSuccess(model, {coupon_id: 3});
+                    expect($.ajax).not.toHaveBeenCalled();
+                    expect(view.goTo).toHaveBeenCalledWith('3');
+                });
+
+                it('should poll the job until the coupon is created', function () {
+                    jobs = [{status: 'Running'}, {status: 'Succeeded', result: {coupon_id: 3}}];
+                    view.saveSuccess(model, {job_id: 1, job_url: jobUrl});
+                    expect($.ajax.calls.count()).toBe(1);
+                    expect($.ajax.calls.mostRecent().args[0].url).toBe(jobUrl);
+                    expect(view.goTo).not.toHaveBeenCalled();
+
+                    jasmine.clock().tick(view.jobPollInterval);
+                    expect($.ajax.calls.count()).toBe(2);
+                    expect(view.goTo).toHaveBeenCalledWith('3');
+                });
+
+                it('should render an alert if the job fails', function () {
+                    jobs = [{status: 'Failed'}];
+                    view.saveSuccess(model, {job_id: 1, job_url: jobUrl});
+                    expect(view.goTo).not.toHaveBeenCalled();
+                    expect(view.renderAlert).toHaveBeenCalledWith('danger', jasmine.any(String));
+                });
+            });
+
         });
     }
 );
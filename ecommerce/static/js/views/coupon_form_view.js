@@ -240,11 +240,50 @@ define([
                 return this;
             },
 
+            // Milliseconds to wait between requests for the status of a coupon creation job.
+            jobPollInterval: 2000,
+
             /**
              * Override default saveSuccess.
+             *
+             * Coupons with many vouchers are created in the background. In that case, the job creating the coupon
+             * is polled until it completes.
              */
             saveSuccess: function (model, response) {
-                this.goTo(response.coupon_id.toString());
+                if (response.job_id) {
+                    this.renderAlert('info', gettext('The coupon is being created. This may take a few minutes.'));
+                    this.pollJob(response.job_url);
+                } else {
+                    this.goTo(response.coupon_id.toString());
+                }
+            },
+
+            /**
+             * Poll a coupon creation job, navigating to the coupon once the job succeeds.
+             *
+             * @param {String} url
+             */
+            pollJob: function (url) {
+                var self = this;
+
+                $.ajax({
+                    url: url,
+                    method: 'GET',
+                    success: function (job) {
+                        if (job.status === 'Succeeded') {
+                            self.goTo(job.result.coupon_id.toString());
+                        } else if (job.status === 'Failed') {
+                            self.clearAlerts();
+                            self.renderAlert('danger', gettext('An error occurred while creating the coupon.'));
+                        } else {
+                            _.delay(_.bind(self.pollJob, self), self.jobPollInterval, url);
+                        }
+                    },
+                    error: function () {
+                        self.clearAlerts();
+                        self.renderAlert('danger', gettext('An error occurred while checking the coupon status.'));
+                    }
+                });
             },
 
         });